@@ -0,0 +1,48 @@
+"""Covering index for daily_activity range reads and course listing indexes
+
+Revision ID: 0e4c7b2d9f58
+Revises: b5e8f1a3c640
+Create Date: 2026-10-15 20:06:33.184027
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0e4c7b2d9f58"
+down_revision = "b5e8f1a3c640"
+branch_labels = None
+depends_on = None
+
+# course_* tables are not created by these migrations, so their indexes are
+# only added where the tables already exist
+COURSE_INDEXES = {
+    "ix_enrollment_user_status": ("course_enrollments", "(user_id, status)"),
+    "ix_course_lesson_course_ord": ("course_lessons", "(course_id, ord, created_at)"),
+}
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_daily_activity_user_dt_covering "
+        "ON daily_activity (user_id, activity_dt) "
+        "INCLUDE (lessons_completed, quizzes_completed, minutes, points)"
+    )
+    for name, (table, columns) in COURSE_INDEXES.items():
+        op.execute(
+            f"""
+            DO $$
+            BEGIN
+                IF to_regclass('{table}') IS NOT NULL THEN
+                    CREATE INDEX IF NOT EXISTS {name} ON {table} {columns};
+                END IF;
+            END
+            $$
+            """
+        )
+
+
+def downgrade() -> None:
+    for name in COURSE_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.execute("DROP INDEX IF EXISTS ix_daily_activity_user_dt_covering")
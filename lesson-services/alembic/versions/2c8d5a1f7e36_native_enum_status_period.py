@@ -0,0 +1,55 @@
+"""Native enum types for lesson status and leaderboard period
+
+Revision ID: 2c8d5a1f7e36
+Revises: e6a1c4f83b50
+Create Date: 2026-10-15 16:58:13.550271
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "2c8d5a1f7e36"
+down_revision = "e6a1c4f83b50"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TYPE lesson_status AS ENUM ('in_progress', 'completed', 'abandoned')")
+    op.execute("CREATE TYPE leaderboard_period AS ENUM ('weekly', 'monthly')")
+
+    # The enum enforces the allowed values, so the CHECKs are redundant
+    op.drop_constraint("status_check", "user_lessons", type_="check")
+    op.execute(
+        "ALTER TABLE user_lessons "
+        "ALTER COLUMN status DROP DEFAULT, "
+        "ALTER COLUMN status TYPE lesson_status USING status::lesson_status, "
+        "ALTER COLUMN status SET DEFAULT 'in_progress'"
+    )
+
+    op.drop_constraint("period_check", "leaderboard_snapshots", type_="check")
+    op.execute(
+        "ALTER TABLE leaderboard_snapshots "
+        "ALTER COLUMN period TYPE leaderboard_period USING period::leaderboard_period"
+    )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE leaderboard_snapshots ALTER COLUMN period TYPE text")
+    op.create_check_constraint(
+        "period_check", "leaderboard_snapshots", "period IN ('weekly','monthly')"
+    )
+
+    op.execute(
+        "ALTER TABLE user_lessons "
+        "ALTER COLUMN status DROP DEFAULT, "
+        "ALTER COLUMN status TYPE text, "
+        "ALTER COLUMN status SET DEFAULT 'in_progress'"
+    )
+    op.create_check_constraint(
+        "status_check", "user_lessons", "status IN ('in_progress','completed','abandoned')"
+    )
+
+    op.execute("DROP TYPE leaderboard_period")
+    op.execute("DROP TYPE lesson_status")
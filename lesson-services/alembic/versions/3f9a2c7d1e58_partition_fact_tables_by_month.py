@@ -0,0 +1,96 @@
+"""Partition append-only fact tables by month
+
+Revision ID: 3f9a2c7d1e58
+Revises: bb1d5c959a8a
+Create Date: 2026-10-15 09:12:04.512331
+
+"""
+
+from datetime import date
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f9a2c7d1e58"
+down_revision = "bb1d5c959a8a"
+branch_labels = None
+depends_on = None
+
+# table -> (partition column, serial id sequence or None)
+FACT_TABLES = {
+    "quiz_answers": ("answered_at", None),
+    "sr_reviews": ("reviewed_at", None),
+    "progress_events": ("created_at", "progress_events_id_seq"),
+    "outbox": ("created_at", "outbox_id_seq"),
+}
+
+MONTHS_AHEAD = 2
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _swap_table(table: str, create_sql: str) -> str:
+    """Move the existing table aside and create its replacement."""
+    legacy = f"{table}_legacy"
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    op.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+    op.execute(create_sql)
+    return legacy
+
+
+def _finish_swap(table: str, legacy: str, sequence: str | None) -> None:
+    """Copy rows into the replacement table and drop the old one."""
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    if sequence:
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id")
+    op.execute(f"DROP TABLE {legacy}")
+
+
+def _add_attempt_fk() -> None:
+    op.execute(
+        "ALTER TABLE quiz_answers ADD CONSTRAINT quiz_answers_attempt_id_fkey "
+        "FOREIGN KEY (attempt_id) REFERENCES quiz_attempts (id) ON DELETE CASCADE"
+    )
+
+
+def upgrade() -> None:
+    current = date.today().replace(day=1)
+
+    for table, (column, sequence) in FACT_TABLES.items():
+        legacy = _swap_table(
+            table,
+            f"CREATE TABLE {table} (LIKE {table}_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+            f"PARTITION BY RANGE ({column})",
+        )
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id, {column})")
+
+        # Monthly partitions first so legacy rows land in them; anything older
+        # or newer falls through to the default partition.
+        for offset in range(MONTHS_AHEAD + 1):
+            start = _add_months(current, offset)
+            end = _add_months(start, 1)
+            op.execute(
+                f"CREATE TABLE {table}_{start.year:04d}_{start.month:02d} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{start.isoformat()} 00:00:00+00') "
+                f"TO ('{end.isoformat()} 00:00:00+00')"
+            )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+        _finish_swap(table, legacy, sequence)
+
+    _add_attempt_fk()
+
+
+def downgrade() -> None:
+    for table, (column, sequence) in FACT_TABLES.items():
+        legacy = _swap_table(
+            table,
+            f"CREATE TABLE {table} (LIKE {table}_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS)",
+        )
+        op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY (id)")
+        _finish_swap(table, legacy, sequence)
+
+    _add_attempt_fk()
@@ -0,0 +1,51 @@
+"""Store quiz_answers.selected_ids as packed 16-byte UUIDs in BYTEA
+
+Revision ID: 4d9e2b7c1a05
+Revises: f3a7d0b95c12
+Create Date: 2026-10-15 18:12:39.660842
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4d9e2b7c1a05"
+down_revision = "f3a7d0b95c12"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE FUNCTION pg_temp.pack_uuids(ids uuid[]) RETURNS bytea "
+        "LANGUAGE sql IMMUTABLE AS $$ "
+        "SELECT COALESCE("
+        "string_agg(decode(replace(u::text, '-', ''), 'hex'), ''::bytea ORDER BY ord), "
+        "''::bytea) "
+        "FROM unnest(ids) WITH ORDINALITY AS t(u, ord) $$"
+    )
+    op.execute(
+        "ALTER TABLE quiz_answers "
+        "ALTER COLUMN selected_ids DROP DEFAULT, "
+        "ALTER COLUMN selected_ids TYPE bytea USING pg_temp.pack_uuids(selected_ids), "
+        "ALTER COLUMN selected_ids SET DEFAULT ''::bytea"
+    )
+    op.execute("DROP FUNCTION pg_temp.pack_uuids(uuid[])")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE FUNCTION pg_temp.unpack_uuids(blob bytea) RETURNS uuid[] "
+        "LANGUAGE sql IMMUTABLE AS $$ "
+        "SELECT COALESCE("
+        "array_agg(encode(substring(blob FROM i FOR 16), 'hex')::uuid ORDER BY i), "
+        "'{}'::uuid[]) "
+        "FROM generate_series(1, length(blob), 16) AS i $$"
+    )
+    op.execute(
+        "ALTER TABLE quiz_answers "
+        "ALTER COLUMN selected_ids DROP DEFAULT, "
+        "ALTER COLUMN selected_ids TYPE uuid[] USING pg_temp.unpack_uuids(selected_ids), "
+        "ALTER COLUMN selected_ids SET DEFAULT '{}'"
+    )
+    op.execute("DROP FUNCTION pg_temp.unpack_uuids(bytea)")
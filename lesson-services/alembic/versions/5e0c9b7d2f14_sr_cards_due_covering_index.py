@@ -0,0 +1,28 @@
+"""Covering partial index for due, non-suspended spaced repetition cards
+
+Revision ID: 5e0c9b7d2f14
+Revises: d24b7e9f0a61
+Create Date: 2026-10-15 15:12:08.418273
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5e0c9b7d2f14"
+down_revision = "d24b7e9f0a61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS sr_due_idx")
+    op.execute(
+        "CREATE INDEX sr_due_idx ON sr_cards (user_id, due_at) "
+        "INCLUDE (flashcard_id, ease_factor, interval_d, repetition) "
+        "WHERE suspended = false"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS sr_due_idx")
@@ -0,0 +1,41 @@
+"""Ranking indexes for the points and streak leaderboards
+
+Revision ID: 6d1f8b3e2a95
+Revises: 2e7c5a9f1d34
+Create Date: 2026-10-16 01:07:53.418266
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6d1f8b3e2a95"
+down_revision = "2e7c5a9f1d34"
+branch_labels = None
+depends_on = None
+
+POINTS_COLUMNS = ("lifetime", "weekly", "monthly")
+
+
+def upgrade() -> None:
+    # Leaderboard pages are top-N reads in (points DESC, updated_at) order; with
+    # user_id included they never touch the heap. Rank lookups (count of users
+    # with more points) are served by the same indexes.
+    for column in POINTS_COLUMNS:
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS user_points_{column}_rank_idx "
+            f"ON user_points ({column} DESC, updated_at) INCLUDE (user_id)"
+        )
+
+    # Only active streaks are ranked
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS user_streaks_current_len_rank_idx "
+        "ON user_streaks (current_len DESC, last_day DESC) "
+        "WHERE current_len > 0"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS user_streaks_current_len_rank_idx")
+    for column in POINTS_COLUMNS:
+        op.execute(f"DROP INDEX IF EXISTS user_points_{column}_rank_idx")
@@ -0,0 +1,61 @@
+"""Materialized per-user lifetime activity summary
+
+Revision ID: 7a2f4e9c3d81
+Revises: 4d9e2b7c1a05
+Create Date: 2026-10-15 19:04:52.317406
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7a2f4e9c3d81"
+down_revision = "4d9e2b7c1a05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW mv_user_activity_summary AS
+        SELECT
+            t.user_id,
+            t.lifetime_lessons_completed,
+            t.lifetime_quizzes_completed,
+            t.lifetime_minutes,
+            t.lifetime_points,
+            t.active_days,
+            m.activity_dt AS most_active_dt,
+            m.lessons_completed AS most_active_lessons_completed,
+            m.quizzes_completed AS most_active_quizzes_completed,
+            m.minutes AS most_active_minutes,
+            m.points AS most_active_points
+        FROM (
+            SELECT
+                user_id,
+                SUM(lessons_completed)::int AS lifetime_lessons_completed,
+                SUM(quizzes_completed)::int AS lifetime_quizzes_completed,
+                SUM(minutes)::int AS lifetime_minutes,
+                SUM(points)::int AS lifetime_points,
+                COUNT(*)::int AS active_days
+            FROM daily_activity
+            GROUP BY user_id
+        ) t
+        JOIN (
+            SELECT DISTINCT ON (user_id)
+                user_id, activity_dt, lessons_completed, quizzes_completed, minutes, points
+            FROM daily_activity
+            ORDER BY user_id, points DESC, activity_dt DESC
+        ) m USING (user_id)
+        """
+    )
+    # A unique index is required for REFRESH ... CONCURRENTLY
+    op.execute(
+        "CREATE UNIQUE INDEX mv_user_activity_summary_user_idx "
+        "ON mv_user_activity_summary (user_id)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS mv_user_activity_summary")
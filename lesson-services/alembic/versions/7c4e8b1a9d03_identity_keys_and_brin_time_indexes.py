@@ -0,0 +1,52 @@
+"""Identity keys and BRIN time indexes on append-only tables
+
+Revision ID: 7c4e8b1a9d03
+Revises: 3f9a2c7d1e58
+Create Date: 2026-10-15 11:40:27.186904
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7c4e8b1a9d03"
+down_revision = "3f9a2c7d1e58"
+branch_labels = None
+depends_on = None
+
+# table -> monotonic time column covered by the BRIN index
+IDENTITY_TABLES = {
+    "leaderboard_snapshots": "taken_at",
+    "progress_events": "created_at",
+    "outbox": "created_at",
+}
+
+
+def upgrade() -> None:
+    for table, column in IDENTITY_TABLES.items():
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+        op.execute(f"DROP SEQUENCE IF EXISTS {table}_id_seq")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE BIGINT")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id ADD GENERATED ALWAYS AS IDENTITY")
+        op.execute(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
+        op.execute(
+            f"CREATE INDEX {table}_{column}_brin ON {table} "
+            f"USING BRIN ({column}) WITH (pages_per_range = 32)"
+        )
+
+
+def downgrade() -> None:
+    for table, column in IDENTITY_TABLES.items():
+        op.execute(f"DROP INDEX IF EXISTS {table}_{column}_brin")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP IDENTITY")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE INTEGER")
+        op.execute(f"CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')"
+        )
+        op.execute(
+            f"SELECT setval('{table}_id_seq', COALESCE(MAX(id), 0) + 1, false) FROM {table}"
+        )
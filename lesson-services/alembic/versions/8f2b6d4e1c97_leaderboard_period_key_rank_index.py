@@ -0,0 +1,29 @@
+"""Index leaderboard snapshots by period key and rank for keyset history pages
+
+Revision ID: 8f2b6d4e1c97
+Revises: c71d3e5a8b24
+Create Date: 2026-10-15 23:18:42.503611
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "8f2b6d4e1c97"
+down_revision = "c71d3e5a8b24"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves both the newest-first walk over period keys and the per-key
+    # ORDER BY rank read; daily_activity range reads are already covered by
+    # ix_daily_activity_user_dt_covering
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS leaderboard_snapshots_period_key_rank_idx "
+        "ON leaderboard_snapshots (period, period_key DESC, rank)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS leaderboard_snapshots_period_key_rank_idx")
@@ -0,0 +1,49 @@
+"""Precomputed SM-2 schedule lookup table
+
+Revision ID: 9b3f6a2e4c87
+Revises: 5e0c9b7d2f14
+Create Date: 2026-10-15 15:40:27.903512
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "9b3f6a2e4c87"
+down_revision = "5e0c9b7d2f14"
+branch_labels = None
+depends_on = None
+
+# Repetition 0 and 1 have fixed intervals; 2+ scales by the card's ease factor
+FIXED_INTERVALS = {0: 1, 1: 6, 2: None}
+
+
+def upgrade() -> None:
+    sr_schedule = op.create_table(
+        "sr_schedule",
+        sa.Column("repetition", sa.Integer(), primary_key=True),
+        sa.Column("quality", sa.SmallInteger(), primary_key=True),
+        sa.Column("passed", sa.Boolean(), nullable=False),
+        sa.Column("new_interval_d", sa.Integer(), nullable=True),
+        sa.Column("ef_delta", sa.Float(), nullable=False),
+    )
+
+    rows = []
+    for repetition, interval in FIXED_INTERVALS.items():
+        for quality in range(6):
+            passed = quality >= 3
+            rows.append(
+                {
+                    "repetition": repetition,
+                    "quality": quality,
+                    "passed": passed,
+                    "new_interval_d": interval if passed else 0,
+                    "ef_delta": 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02),
+                }
+            )
+    op.bulk_insert(sr_schedule, rows)
+
+
+def downgrade() -> None:
+    op.drop_table("sr_schedule")
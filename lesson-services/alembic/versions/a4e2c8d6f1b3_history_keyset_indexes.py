@@ -0,0 +1,33 @@
+"""Keyset indexes for quiz attempt history and review history pages
+
+Revision ID: a4e2c8d6f1b3
+Revises: 6d1f8b3e2a95
+Create Date: 2026-10-16 02:14:37.902518
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a4e2c8d6f1b3"
+down_revision = "6d1f8b3e2a95"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # History pages seek to the (sort key, id) the previous page ended on and read
+    # forward; the trailing id makes the order total when timestamps tie
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS quiz_attempts_user_history_idx "
+        "ON quiz_attempts (user_id, submitted_at DESC, id DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS sr_reviews_user_history_idx "
+        "ON sr_reviews (user_id, reviewed_at DESC, id DESC)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS sr_reviews_user_history_idx")
+    op.execute("DROP INDEX IF EXISTS quiz_attempts_user_history_idx")
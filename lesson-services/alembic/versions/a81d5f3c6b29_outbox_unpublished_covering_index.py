@@ -0,0 +1,27 @@
+"""Covering partial index for unpublished outbox messages
+
+Revision ID: a81d5f3c6b29
+Revises: 7c4e8b1a9d03
+Create Date: 2026-10-15 13:05:51.734120
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a81d5f3c6b29"
+down_revision = "7c4e8b1a9d03"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX outbox_unpub_idx ON outbox (id) "
+        "INCLUDE (topic, type, aggregate_id) "
+        "WHERE published_at IS NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS outbox_unpub_idx")
@@ -0,0 +1,53 @@
+"""Default UUID primary keys to time-ordered UUIDv7 on the server
+
+Revision ID: b5e8f1a3c640
+Revises: 7a2f4e9c3d81
+Create Date: 2026-10-15 19:41:08.502913
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b5e8f1a3c640"
+down_revision = "7a2f4e9c3d81"
+branch_labels = None
+depends_on = None
+
+UUID_KEY_TABLES = ("user_lessons", "quiz_attempts", "quiz_answers", "sr_cards", "sr_reviews")
+
+
+def upgrade() -> None:
+    # 48-bit unix millisecond timestamp over a random v4 UUID, version nibble set to 7
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid
+        LANGUAGE sql VOLATILE AS $$
+        SELECT encode(
+            set_bit(
+                set_bit(
+                    overlay(
+                        uuid_send(gen_random_uuid())
+                        PLACING substring(
+                            int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                            FROM 3
+                        )
+                        FROM 1 FOR 6
+                    ),
+                    52, 1
+                ),
+                53, 1
+            ),
+            'hex'
+        )::uuid
+        $$
+        """
+    )
+    for table in UUID_KEY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT uuid_generate_v7()")
+
+
+def downgrade() -> None:
+    for table in UUID_KEY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,28 @@
+"""Partial index on published outbox messages
+
+Revision ID: c3d8f5a1b7e2
+Revises: e9b4c1d7a3f6
+Create Date: 2026-10-16 09:12:47.506381
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c3d8f5a1b7e2"
+down_revision = "e9b4c1d7a3f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Lets each cleanup batch pick expired rows by published_at instead of
+    # rescanning the already-deleted prefix of every partition
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS outbox_published_at_idx "
+        "ON outbox (published_at) WHERE published_at IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS outbox_published_at_idx")
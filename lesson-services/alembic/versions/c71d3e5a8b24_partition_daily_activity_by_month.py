@@ -0,0 +1,109 @@
+"""Partition daily_activity by month on activity_dt
+
+Revision ID: c71d3e5a8b24
+Revises: 0e4c7b2d9f58
+Create Date: 2026-10-15 20:31:47.906215
+
+"""
+
+from datetime import date
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c71d3e5a8b24"
+down_revision = "0e4c7b2d9f58"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 2
+
+SUMMARY_VIEW = "mv_user_activity_summary"
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def _drop_summary_view() -> str:
+    """Drop the summary view that depends on daily_activity and return its definition."""
+    definition = op.get_bind().execute(
+        sa.text(f"SELECT pg_get_viewdef('{SUMMARY_VIEW}'::regclass)")
+    ).scalar()
+    op.execute(f"DROP MATERIALIZED VIEW {SUMMARY_VIEW}")
+    return definition.rstrip().rstrip(";")
+
+
+def _create_summary_view(definition: str) -> None:
+    op.execute(f"CREATE MATERIALIZED VIEW {SUMMARY_VIEW} AS {definition}")
+    op.execute(
+        f"CREATE UNIQUE INDEX {SUMMARY_VIEW}_user_idx ON {SUMMARY_VIEW} (user_id)"
+    )
+
+
+def _swap_table(create_sql: str) -> None:
+    op.execute("ALTER TABLE daily_activity RENAME TO daily_activity_legacy")
+    op.execute(
+        "ALTER TABLE daily_activity_legacy "
+        "RENAME CONSTRAINT daily_activity_pkey TO daily_activity_legacy_pkey"
+    )
+    op.execute(
+        "ALTER INDEX ix_daily_activity_user_dt_covering "
+        "RENAME TO ix_daily_activity_legacy_user_dt_covering"
+    )
+    op.execute(create_sql)
+    op.execute("ALTER TABLE daily_activity ADD PRIMARY KEY (user_id, activity_dt)")
+    op.execute(
+        "CREATE INDEX ix_daily_activity_user_dt_covering "
+        "ON daily_activity (user_id, activity_dt) "
+        "INCLUDE (lessons_completed, quizzes_completed, minutes, points)"
+    )
+
+
+def _finish_swap() -> None:
+    op.execute("INSERT INTO daily_activity SELECT * FROM daily_activity_legacy")
+    op.execute("DROP TABLE daily_activity_legacy")
+
+
+def upgrade() -> None:
+    definition = _drop_summary_view()
+
+    _swap_table(
+        "CREATE TABLE daily_activity "
+        "(LIKE daily_activity_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (activity_dt)"
+    )
+
+    # Unlike the append-only fact tables, existing history is spread over many
+    # months, so give every month that has rows its own partition.
+    current = date.today().replace(day=1)
+    oldest = op.get_bind().execute(
+        sa.text("SELECT min(activity_dt) FROM daily_activity_legacy")
+    ).scalar()
+    start = min(oldest.replace(day=1), current) if oldest else current
+    last = _add_months(current, MONTHS_AHEAD)
+    while start <= last:
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE daily_activity_{start.year:04d}_{start.month:02d} "
+            f"PARTITION OF daily_activity "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+    op.execute("CREATE TABLE daily_activity_default PARTITION OF daily_activity DEFAULT")
+
+    _finish_swap()
+    _create_summary_view(definition)
+
+
+def downgrade() -> None:
+    definition = _drop_summary_view()
+
+    _swap_table(
+        "CREATE TABLE daily_activity "
+        "(LIKE daily_activity_legacy INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    )
+    _finish_swap()
+    _create_summary_view(definition)
@@ -0,0 +1,58 @@
+"""Points change log and unique leaderboard entries for incremental refresh
+
+Revision ID: d24b7e9f0a61
+Revises: a81d5f3c6b29
+Create Date: 2026-10-15 14:22:09.601847
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "d24b7e9f0a61"
+down_revision = "a81d5f3c6b29"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mlog_user_points",
+        sa.Column("id", sa.BigInteger(), sa.Identity(always=True), primary_key=True),
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("old_points", sa.Integer(), nullable=True),
+        sa.Column("new_points", sa.Integer(), nullable=True),
+        sa.Column("op", sa.Text(), nullable=False),
+        sa.Column(
+            "logged_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+    # Keep only the latest row per user within a period before enforcing uniqueness
+    op.execute(
+        """
+        DELETE FROM leaderboard_snapshots s
+        USING leaderboard_snapshots newer
+        WHERE s.period = newer.period
+          AND s.period_key = newer.period_key
+          AND s.user_id = newer.user_id
+          AND (s.taken_at, s.id) < (newer.taken_at, newer.id)
+        """
+    )
+    op.create_unique_constraint(
+        "leaderboard_period_user_key",
+        "leaderboard_snapshots",
+        ["period", "period_key", "user_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        "leaderboard_period_user_key", "leaderboard_snapshots", type_="unique"
+    )
+    op.drop_table("mlog_user_points")
@@ -0,0 +1,40 @@
+"""LZ4 compression and inline storage for JSONB payload columns
+
+Revision ID: e6a1c4f83b50
+Revises: 9b3f6a2e4c87
+Create Date: 2026-10-15 16:21:44.186950
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6a1c4f83b50"
+down_revision = "9b3f6a2e4c87"
+branch_labels = None
+depends_on = None
+
+# Event payloads are small, so keep them compressed inline (MAIN) instead of TOASTed
+PAYLOAD_TABLES = ("outbox", "progress_events")
+
+
+def upgrade() -> None:
+    for table in PAYLOAD_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN payload SET STORAGE MAIN")
+        # Servers built without lz4 keep pglz rather than failing the migration
+        op.execute(
+            "DO $$ BEGIN "
+            f"ALTER TABLE {table} ALTER COLUMN payload SET COMPRESSION lz4; "
+            "EXCEPTION WHEN feature_not_supported THEN "
+            f"RAISE NOTICE 'lz4 not available, keeping default compression for {table}.payload'; "
+            "END $$"
+        )
+
+
+def downgrade() -> None:
+    for table in PAYLOAD_TABLES:
+        op.execute(
+            f"ALTER TABLE {table} "
+            "ALTER COLUMN payload SET COMPRESSION DEFAULT, "
+            "ALTER COLUMN payload SET STORAGE EXTENDED"
+        )
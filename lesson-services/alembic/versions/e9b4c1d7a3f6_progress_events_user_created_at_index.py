@@ -0,0 +1,28 @@
+"""Index progress events by user and creation time
+
+Revision ID: e9b4c1d7a3f6
+Revises: a4e2c8d6f1b3
+Create Date: 2026-10-16 04:41:09.318274
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e9b4c1d7a3f6"
+down_revision = "a4e2c8d6f1b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves the first-event probe (MIN(created_at) per user) and the per-user
+    # event pages, which otherwise scan every monthly partition
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS progress_events_user_created_at_idx "
+        "ON progress_events (user_id, created_at)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS progress_events_user_created_at_idx")
@@ -0,0 +1,38 @@
+"""Extended statistics and autovacuum tuning for sr_cards
+
+Revision ID: f3a7d0b95c12
+Revises: 2c8d5a1f7e36
+Create Date: 2026-10-15 17:31:06.274418
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "f3a7d0b95c12"
+down_revision = "2c8d5a1f7e36"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE STATISTICS IF NOT EXISTS sr_cards_user_due (dependencies, ndistinct) "
+        "ON user_id, due_at FROM sr_cards"
+    )
+    # Reviews move due_at on most rows daily, so re-analyze well before the 10% default
+    op.execute(
+        "ALTER TABLE sr_cards SET ("
+        "autovacuum_analyze_scale_factor = 0.02, "
+        "autovacuum_vacuum_scale_factor = 0.05)"
+    )
+    op.execute("ANALYZE sr_cards")
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE sr_cards RESET ("
+        "autovacuum_analyze_scale_factor, "
+        "autovacuum_vacuum_scale_factor)"
+    )
+    op.execute("DROP STATISTICS IF EXISTS sr_cards_user_due")
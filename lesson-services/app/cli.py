@@ -0,0 +1,123 @@
+import argparse
+import asyncio
+import logging
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional
+
+import orjson
+
+from app.database.migrations import run_database_migrations
+
+# Lines per transaction when loading JSON-lines files
+LOAD_BATCH_SIZE = 10_000
+
+
+def migrate(args: argparse.Namespace) -> None:
+    run_database_migrations(args.target)
+
+
+def partitions(args: argparse.Namespace) -> None:
+    from app.database.partitions import run_partition_maintenance
+
+    if not run_partition_maintenance():
+        logging.getLogger(__name__).info("Maintenance already running elsewhere; skipped")
+
+
+def refresh_views(args: argparse.Namespace) -> None:
+    from app.database.materialized_views import refresh_materialized_views
+
+    if not refresh_materialized_views():
+        logging.getLogger(__name__).info("Refresh already running elsewhere; skipped")
+
+
+def _read_batches(path: str) -> Iterator[List[Dict[str, Any]]]:
+    with open(path, "rb") as handle:
+        records = (orjson.loads(line) for line in handle if line.strip())
+        while batch := list(islice(records, LOAD_BATCH_SIZE)):
+            yield batch
+
+
+def seed_users(args: argparse.Namespace) -> None:
+    from app.database.connection import AsyncSessionLocal
+    from app.schemas.dim_user_schema import DimUserCreate
+    from app.services.dim_user_service import DimUserService
+
+    async def load() -> int:
+        total = 0
+        async with AsyncSessionLocal() as db:
+            service = DimUserService(db)
+            for batch in _read_batches(args.path):
+                total += await service.bulk_upsert_users(
+                    [DimUserCreate.model_validate(record) for record in batch]
+                )
+        return total
+
+    logging.getLogger(__name__).info("Upserted %d users", asyncio.run(load()))
+
+
+def replay_events(args: argparse.Namespace) -> None:
+    from app.database.connection import AsyncSessionLocal
+    from app.schemas import ProgressEventCreate
+    from app.services.progress_event_service import ProgressEventService
+
+    def to_event(record: Dict[str, Any]) -> Dict[str, Any]:
+        event = ProgressEventCreate.model_validate(record).model_dump()
+        created_at = record.get("created_at")
+        event["created_at"] = datetime.fromisoformat(created_at) if created_at else None
+        return event
+
+    async def load() -> int:
+        total = 0
+        async with AsyncSessionLocal() as db:
+            service = ProgressEventService(db)
+            for batch in _read_batches(args.path):
+                total += await service.replay_events([to_event(record) for record in batch])
+        return total
+
+    logging.getLogger(__name__).info("Replayed %d events", asyncio.run(load()))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Lesson Services jobs")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Apply Alembic migrations")
+    migrate_parser.add_argument("--target", default="head", help="Revision to upgrade to")
+    migrate_parser.set_defaults(func=migrate)
+
+    partitions_parser = subparsers.add_parser(
+        "partitions", help="Create upcoming partitions and apply retention"
+    )
+    partitions_parser.set_defaults(func=partitions)
+
+    refresh_parser = subparsers.add_parser(
+        "refresh-views", help="Refresh materialized views concurrently"
+    )
+    refresh_parser.set_defaults(func=refresh_views)
+
+    seed_parser = subparsers.add_parser(
+        "seed-users", help="Upsert dim_users from a JSON-lines file"
+    )
+    seed_parser.add_argument("path", help="One DimUserCreate object per line")
+    seed_parser.set_defaults(func=seed_users)
+
+    replay_parser = subparsers.add_parser(
+        "replay-events", help="Append progress events from a JSON-lines file"
+    )
+    replay_parser.add_argument(
+        "path", help="One event per line: user_id, type, payload and optional created_at"
+    )
+    replay_parser.set_defaults(func=replay_events)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
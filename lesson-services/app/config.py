@@ -1,10 +1,14 @@
-import os
+from __future__ import annotations
+
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from fastapi import status
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore", frozen=True)
+
     # PostgreSQL settings
     postgres_user: str = "user"
     postgres_password: str = "password"
@@ -32,24 +36,44 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     environment: str = "development"
-    run_migrations_on_startup: bool = True
+    partition_months_ahead: int = 2
+    partition_retention_months: Optional[int] = None
+    partition_maintenance_seconds: float = 21600.0
+    daily_activity_flush_seconds: float = 5.0
+    materialized_view_refresh_seconds: float = 300.0
+
+    # Connection pools, sized per engine. One worker process can open up to
+    # (sync size + overflow) + (async size + overflow) = 30 connections by default,
+    # so three workers stay under Postgres' default max_connections=100 with room
+    # for migrations and psql. Scale these down as workers are added.
+    db_sync_pool_size: int = 10
+    db_sync_max_overflow: int = 5
+    db_async_pool_size: int = 10
+    db_async_max_overflow: int = 5
+    db_pool_timeout: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    # Set when connecting through PgBouncer in transaction mode: pooling is left to
+    # PgBouncer and asyncpg's prepared statement cache is disabled
+    db_use_pgbouncer: bool = False
     
-    @property
+    @cached_property
     def database_url(self) -> str:
-        print(f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}")
         return f"postgresql://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
     
-    @property
+    @cached_property
+    def async_database_url(self) -> str:
+        return f"postgresql+asyncpg://{self.postgres_user}:{self.postgres_password}@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+    
+    @cached_property
     def redis_url(self) -> str:
         if self.redis_password:
             return f"redis://:{self.redis_password}@{self.redis_host}:{self.redis_port}"
         return f"redis://{self.redis_host}:{self.redis_port}"
-    
-    class Config:
-        env_file = ".env"
-        extra = "ignore"  # Ignore extra environment variables
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, reading the environment and .env once."""
+    return Settings()
 
 # Default success payload when an endpoint returns no explicit data
 DEFAULT_SUCCESS_DATA: dict[str, object] = {}
@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# Batches at or above this size are loaded with COPY instead of INSERT
+COPY_THRESHOLD = 1024
+
+_COPY_NULL = "\\N"
+
+
+def _copy_value(value: Any) -> Any:
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+
+def copy_rows(
+    db: Session,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """Stream rows into ``table`` with ``COPY ... FROM STDIN`` on the session's connection.
+
+    Runs inside the session transaction, so the caller decides when to commit.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    count = 0
+    for row in rows:
+        writer.writerow([_copy_value(value) for value in row])
+        count += 1
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT csv, NULL '{_COPY_NULL}')",
+            buffer,
+        )
+    finally:
+        cursor.close()
+    return count
+
+
+async def copy_records(
+    db: AsyncSession,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Sequence[Any]],
+) -> int:
+    """Async counterpart of :func:`copy_rows` using asyncpg's binary COPY.
+
+    Values are sent as native Python objects, so no CSV encoding is needed.
+    """
+    records = [tuple(row) for row in rows]
+    connection = await db.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        table, records=records, columns=list(columns)
+    )
+    return len(records)
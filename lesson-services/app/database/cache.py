@@ -0,0 +1,114 @@
+import logging
+from functools import lru_cache
+from datetime import date
+from typing import Callable, Optional
+from uuid import UUID
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> aioredis.Redis:
+    return aioredis.from_url(
+        get_settings().redis_url,
+        socket_connect_timeout=0.25,
+        socket_timeout=0.25,
+    )
+
+
+# Spaced-repetition dashboards poll these; card and review writes clear them, while
+# cards falling due over time show up once the entry expires
+SR_STATS_CACHE_TTL = 60
+
+POINTS_LEADERBOARD_CACHE_PREFIX = "points-leaderboard:"
+
+
+def sr_card_stats_cache_key(user_id: UUID) -> str:
+    return f"sr:card-stats:{user_id}"
+
+
+def sr_review_stats_cache_key(user_id: UUID) -> str:
+    return f"sr:review-stats:{user_id}"
+
+
+def sr_today_stats_cache_key(user_id: UUID) -> str:
+    return f"sr:today-stats:{user_id}"
+
+
+def points_leaderboard_cache_key(attribute: str, limit: int, offset: int) -> str:
+    return f"{POINTS_LEADERBOARD_CACHE_PREFIX}{attribute}:{limit}:{offset}"
+
+
+def streak_leaderboard_cache_key(limit: int) -> str:
+    return f"streak-leaderboard:{limit}"
+
+
+def daily_month_cache_key(user_id: UUID, year: int, month: int) -> str:
+    return f"daily:month:{user_id}:{year}:{month}"
+
+
+def daily_summary_cache_key(user_id: UUID, today: date) -> str:
+    return f"daily:summary:{user_id}:{today.isoformat()}"
+
+
+# The cache is an optimization only: Redis errors are logged and treated as misses
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    try:
+        return await get_redis().get(key)
+    except RedisError:
+        logger.warning("Redis GET failed for %s", key, exc_info=True)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl_seconds: int) -> None:
+    try:
+        await get_redis().setex(key, ttl_seconds, value)
+    except RedisError:
+        logger.warning("Redis SETEX failed for %s", key, exc_info=True)
+
+
+async def cache_delete(*keys: str) -> None:
+    if not keys:
+        return
+    try:
+        await get_redis().delete(*keys)
+    except RedisError:
+        logger.warning("Redis DEL failed for %s", ", ".join(keys), exc_info=True)
+
+
+async def cache_delete_prefix(prefix: str) -> None:
+    """Delete every key under ``prefix``; SCAN keeps Redis responsive on large keyspaces."""
+    try:
+        redis = get_redis()
+        keys = [key async for key in redis.scan_iter(match=f"{prefix}*", count=500)]
+        if keys:
+            await redis.delete(*keys)
+    except RedisError:
+        logger.warning("Redis prefix delete failed for %s", prefix, exc_info=True)
+
+
+async def cached_json(key: str, ttl_seconds: int, load: Callable[[], bytes]) -> bytes:
+    """Cache-aside read of a rendered JSON body.
+
+    ``load`` queries through a synchronous service and serializes the result, so
+    on a miss it runs in the threadpool rather than on the event loop.
+    """
+    body = await cache_get(key)
+    if body is None:
+        body = await run_in_threadpool(load)
+        await cache_set(key, body, ttl_seconds)
+    return body
+
+
+async def close_redis() -> None:
+    if get_redis.cache_info().currsize:
+        await get_redis().aclose()
+        get_redis.cache_clear()
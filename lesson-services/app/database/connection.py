@@ -1,14 +1,67 @@
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from app.config import settings
+from sqlalchemy.pool import NullPool
+from app.config import Settings, get_settings
 from app.models.progress_models import Base
 
-engine = create_engine(settings.database_url)
+# Room for every statement shape the service issues, so none is recompiled after warm-up
+QUERY_CACHE_SIZE = 2048
+
+
+def _pool_options(settings: Settings, pool_size: int, max_overflow: int) -> Dict[str, Any]:
+    if settings.db_use_pgbouncer:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": True,
+    }
+
+
+# Batch executemany: INSERTs are folded into multi-row VALUES pages, UPDATE/DELETE
+# go through psycopg2's execute_batch instead of one round-trip per row
+engine = create_engine(
+    get_settings().database_url,
+    query_cache_size=QUERY_CACHE_SIZE,
+    executemany_mode="values_plus_batch",
+    insertmanyvalues_page_size=1000,
+    executemany_batch_page_size=500,
+    **_pool_options(
+        get_settings(), get_settings().db_sync_pool_size, get_settings().db_sync_max_overflow
+    ),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(
+    get_settings().async_database_url,
+    query_cache_size=QUERY_CACHE_SIZE,
+    insertmanyvalues_page_size=1000,
+    # PgBouncer transaction pooling cannot keep server-side prepared statements
+    connect_args=(
+        {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+        if get_settings().db_use_pgbouncer
+        else {}
+    ),
+    **_pool_options(
+        get_settings(), get_settings().db_async_pool_size, get_settings().db_async_max_overflow
+    ),
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,59 @@
+import asyncio
+import logging
+from typing import Optional
+
+from sqlalchemy import func, select, text
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database.connection import engine
+
+logger = logging.getLogger(__name__)
+
+MATERIALIZED_VIEWS = ("mv_user_activity_summary",)
+
+# Shared by every replica so only one of them refreshes at a time
+_REFRESH_LOCK_KEY = "materialized_view_refresh"
+
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def refresh_materialized_views() -> bool:
+    """Refresh all materialized views; returns False if another process holds the lock."""
+    with engine.begin() as conn:
+        locked = conn.execute(
+            select(func.pg_try_advisory_xact_lock(func.hashtext(_REFRESH_LOCK_KEY)))
+        ).scalar()
+        if not locked:
+            return False
+        for view in MATERIALIZED_VIEWS:
+            conn.execute(text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}"))
+    return True
+
+
+async def _refresh_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(refresh_materialized_views)
+        except Exception:
+            logger.exception("Failed to refresh materialized views")
+
+
+def start_materialized_view_refresher() -> None:
+    global _refresh_task
+    if _refresh_task is None:
+        _refresh_task = asyncio.create_task(
+            _refresh_periodically(get_settings().materialized_view_refresh_seconds)
+        )
+
+
+async def stop_materialized_view_refresher() -> None:
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
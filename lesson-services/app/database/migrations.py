@@ -1,19 +1,24 @@
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from alembic import command
 from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, pool
 
-from app.config import settings
+from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 BASE_DIR = Path(__file__).resolve().parents[2]
 
 
+@lru_cache()
 def load_alembic_config() -> Config:
-    """Build an Alembic Config object tied to this project."""
+    """Build an Alembic Config object tied to this project (once per process)."""
     ini_name = os.getenv("ALEMBIC_INI_PATH", "alembic.ini")
     ini_path = (BASE_DIR / ini_name).resolve()
 
@@ -23,14 +28,30 @@ def load_alembic_config() -> Config:
     cfg = Config(str(ini_path))
     script_location = os.getenv("ALEMBIC_SCRIPT_LOCATION", str(BASE_DIR / "alembic"))
     cfg.set_main_option("script_location", script_location)
-    cfg.set_main_option("sqlalchemy.url", settings.database_url)
+    cfg.set_main_option("sqlalchemy.url", get_settings().database_url)
     return cfg
 
 
+def _database_heads(cfg: Config) -> set:
+    engine = create_engine(cfg.get_main_option("sqlalchemy.url"), poolclass=pool.NullPool)
+    try:
+        with engine.connect() as connection:
+            return set(MigrationContext.configure(connection).get_current_heads())
+    finally:
+        engine.dispose()
+
+
 def run_database_migrations(target: str = "head") -> None:
     """Apply Alembic migrations up to the provided target (defaults to head)."""
     cfg = load_alembic_config()
     try:
+        # Skip env.py and the migration transaction entirely when already current
+        if target == "head":
+            script_heads = set(ScriptDirectory.from_config(cfg).get_heads())
+            if _database_heads(cfg) == script_heads:
+                logger.info("Database already at head (%s)", ", ".join(sorted(script_heads)))
+                return
+
         command.upgrade(cfg, target)
         logger.info("Database migrations applied (%s)", target)
     except Exception:
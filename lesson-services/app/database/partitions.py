@@ -0,0 +1,205 @@
+import asyncio
+import logging
+from datetime import date
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Connection
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database.connection import engine
+
+logger = logging.getLogger(__name__)
+
+# Tables partitioned by month on their time column
+PARTITIONED_TABLES: Dict[str, str] = {
+    "quiz_answers": "answered_at",
+    "sr_reviews": "reviewed_at",
+    "progress_events": "created_at",
+    "outbox": "created_at",
+    "daily_activity": "activity_dt",
+}
+
+# Partitioned for scan width only; lifetime stats need every month, so retention skips them
+RETAINED_TABLES = frozenset({"daily_activity"})
+
+# Partitions are only dropped when no row matches the guard predicate
+RETENTION_GUARDS: Dict[str, str] = {
+    "outbox": "published_at IS NULL",
+}
+
+# Shared by every replica so only one of them runs maintenance at a time
+_MAINTENANCE_LOCK_KEY = "partition_maintenance"
+
+_maintenance_task: Optional[asyncio.Task] = None
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.year * 12 + (value.month - 1) + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(table: str, month_start: date) -> str:
+    return f"{table}_{month_start.year:04d}_{month_start.month:02d}"
+
+
+def ensure_partitions(
+    conn: Connection,
+    months_ahead: int = 2,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Create monthly partitions from the current month up to ``months_ahead`` months ahead."""
+    current = (today or date.today()).replace(day=1)
+    created: List[str] = []
+
+    for table, column in PARTITIONED_TABLES.items():
+        for offset in range(months_ahead + 1):
+            start = _add_months(current, offset)
+            end = _add_months(start, 1)
+            name = partition_name(table, start)
+            lower = f"'{start.isoformat()} 00:00:00+00'"
+            upper = f"'{end.isoformat()} 00:00:00+00'"
+            create = (
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                f"FOR VALUES FROM ({lower}) TO ({upper})"
+            )
+            in_range = f"{column} >= {lower} AND {column} < {upper}"
+            if _default_has_rows(conn, table, name, in_range):
+                _create_from_default(conn, table, create, in_range)
+                logger.info("Moved rows for %s out of %s_default", name, table)
+            else:
+                conn.execute(text(create))
+            created.append(name)
+
+    return created
+
+
+def _default_has_rows(conn: Connection, table: str, name: str, in_range: str) -> bool:
+    """True when ``name`` is still missing and the default partition holds rows for its range."""
+    default = f"{table}_default"
+    missing = conn.execute(
+        text("SELECT to_regclass(:name) IS NULL AND to_regclass(:default) IS NOT NULL"),
+        {"name": name, "default": default},
+    ).scalar()
+    return bool(missing) and bool(
+        conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {default} WHERE {in_range})")).scalar()
+    )
+
+
+def _create_from_default(conn: Connection, table: str, create: str, in_range: str) -> None:
+    """Create a partition whose range already has rows in the default partition.
+
+    Postgres refuses to add the partition while the default holds matching rows (e.g. a
+    client-dated daily_activity row beyond the horizon), so the default is detached, the
+    rows are moved through the parent into the new partition, and the default goes back.
+    """
+    default = f"{table}_default"
+    conn.execute(text(f"ALTER TABLE {table} DETACH PARTITION {default}"))
+    conn.execute(text(create))
+    conn.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {default} WHERE {in_range} RETURNING *) "
+            f"INSERT INTO {table} OVERRIDING SYSTEM VALUE SELECT * FROM moved"
+        )
+    )
+    conn.execute(text(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT"))
+
+
+def drop_expired_partitions(
+    conn: Connection,
+    retention_months: int,
+    today: Optional[date] = None,
+) -> List[str]:
+    """Drop monthly partitions that end before the retention cutoff."""
+    if retention_months < 0:
+        raise ValueError("Retention period must be non-negative")
+
+    cutoff = _add_months((today or date.today()).replace(day=1), -retention_months)
+    dropped: List[str] = []
+
+    for table in PARTITIONED_TABLES:
+        if table in RETAINED_TABLES:
+            continue
+
+        children = conn.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "JOIN pg_class p ON p.oid = i.inhparent "
+                "WHERE p.relname = :table"
+            ),
+            {"table": table},
+        ).scalars()
+
+        for name in children:
+            suffix = name[len(table) + 1:]
+            try:
+                year, month = (int(part) for part in suffix.split("_"))
+                month_start = date(year, month, 1)
+            except ValueError:
+                # Default partition or a manually named child
+                continue
+
+            if _add_months(month_start, 1) > cutoff:
+                continue
+
+            guard = RETENTION_GUARDS.get(table)
+            if guard and conn.execute(
+                text(f"SELECT EXISTS (SELECT 1 FROM {name} WHERE {guard})")
+            ).scalar():
+                logger.warning("Keeping partition %s: rows match %s", name, guard)
+                continue
+
+            conn.execute(text(f"DROP TABLE {name}"))
+            dropped.append(name)
+
+    return dropped
+
+
+def run_partition_maintenance() -> bool:
+    """Create upcoming partitions and apply the configured retention window.
+
+    Returns False if another process is already running maintenance.
+    """
+    settings = get_settings()
+    with engine.begin() as conn:
+        locked = conn.execute(
+            select(func.pg_try_advisory_xact_lock(func.hashtext(_MAINTENANCE_LOCK_KEY)))
+        ).scalar()
+        if not locked:
+            return False
+        ensure_partitions(conn, months_ahead=settings.partition_months_ahead)
+        if settings.partition_retention_months is not None:
+            dropped = drop_expired_partitions(conn, settings.partition_retention_months)
+            if dropped:
+                logger.info("Dropped expired partitions: %s", ", ".join(dropped))
+    return True
+
+
+async def _maintain_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(run_partition_maintenance)
+        except Exception:
+            logger.exception("Partition maintenance failed")
+
+
+def start_partition_maintainer() -> None:
+    global _maintenance_task
+    if _maintenance_task is None:
+        _maintenance_task = asyncio.create_task(
+            _maintain_periodically(get_settings().partition_maintenance_seconds)
+        )
+
+
+async def stop_partition_maintainer() -> None:
+    global _maintenance_task
+    if _maintenance_task is not None:
+        _maintenance_task.cancel()
+        try:
+            await _maintenance_task
+        except asyncio.CancelledError:
+            pass
+        _maintenance_task = None
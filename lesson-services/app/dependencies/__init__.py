@@ -0,0 +1,3 @@
+"""
+Shared FastAPI dependencies for the lesson services API.
+"""
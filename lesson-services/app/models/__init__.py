@@ -5,10 +5,12 @@ from app.models.progress_models import (
     QuizAttempt,
     QuizAnswer,
     SRCard,
+    SRSchedule,
     SRReview,
     DailyActivity,
     UserStreak,
     UserPoints,
+    UserPointsLog,
     LeaderboardSnapshot,
     ProgressEvent,
     Outbox,
@@ -21,10 +23,12 @@ __all__ = [
     "QuizAttempt",
     "QuizAnswer",
     "SRCard",
+    "SRSchedule",
     "SRReview",
     "DailyActivity",
     "UserStreak",
     "UserPoints",
+    "UserPointsLog",
     "LeaderboardSnapshot",
     "ProgressEvent",
     "Outbox",
@@ -1,12 +1,50 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, Date, Text, CheckConstraint, ForeignKey, ARRAY, Float
-from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy import Column, String, Integer, SmallInteger, BigInteger, Boolean, DateTime, Date, Text, CheckConstraint, UniqueConstraint, ForeignKey, Float, Identity, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID, JSONB, ENUM
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
+from sqlalchemy.types import TypeDecorator
+import os
+import time
 import uuid
 
 Base = declarative_base()
 
+# Native PostgreSQL enums; the types are created by migrations
+LESSON_STATUS = ENUM("in_progress", "completed", "abandoned", name="lesson_status", create_type=False)
+LEADERBOARD_PERIOD = ENUM("weekly", "monthly", name="leaderboard_period", create_type=False)
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562) so new keys append to the index tail."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+class PackedUUIDList(TypeDecorator):
+    """List of UUIDs stored as concatenated 16-byte values in a BYTEA column."""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return b"".join(
+            item.bytes if isinstance(item, uuid.UUID) else uuid.UUID(str(item)).bytes
+            for item in value
+        )
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return []
+        blob = bytes(value)
+        return [uuid.UUID(bytes=blob[i:i + 16]) for i in range(0, len(blob), 16)]
+
+
 class DimUser(Base):
     __tablename__ = "dim_users"
     
@@ -18,23 +56,19 @@ class DimUser(Base):
 class UserLesson(Base):
     __tablename__ = "user_lessons"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
     user_id = Column(UUID(as_uuid=True), nullable=False)
     lesson_id = Column(UUID(as_uuid=True), nullable=False)
-    status = Column(Text, nullable=False, default='in_progress')
+    status = Column(LESSON_STATUS, nullable=False, default='in_progress')
     started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     completed_at = Column(DateTime(timezone=True))
     last_section_ord = Column(Integer)
     score_total = Column(Integer, nullable=False, default=0)
-    
-    __table_args__ = (
-        CheckConstraint("status IN ('in_progress','completed','abandoned')", name='status_check'),
-    )
 
 class CourseEnrollment(Base):
     __tablename__ = "course_enrollments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), nullable=False)
     course_id = Column(UUID(as_uuid=True), nullable=False)
     status = Column(Text, nullable=False, default="enrolled")  # enrolled, in_progress, completed, cancelled
@@ -52,7 +86,7 @@ class CourseEnrollment(Base):
 class CourseLesson(Base):
     __tablename__ = "course_lessons"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     course_id = Column(UUID(as_uuid=True), nullable=False)
     lesson_id = Column(UUID(as_uuid=True), nullable=False)
     ord = Column(Integer, nullable=False)
@@ -67,7 +101,7 @@ class CourseLesson(Base):
 class QuizAttempt(Base):
     __tablename__ = "quiz_attempts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
     user_id = Column(UUID(as_uuid=True), nullable=False)
     quiz_id = Column(UUID(as_uuid=True), nullable=False)
     lesson_id = Column(UUID(as_uuid=True))
@@ -80,27 +114,37 @@ class QuizAttempt(Base):
     attempt_no = Column(Integer, nullable=False, default=1)
     
     # Relationship
-    answers = relationship("QuizAnswer", back_populates="attempt", cascade="all, delete-orphan")
+    # Never lazy-loaded: read paths that need answers ask for selectinload explicitly,
+    # and deletes leave the rows to the ON DELETE CASCADE foreign key
+    answers = relationship(
+        "QuizAnswer",
+        back_populates="attempt",
+        cascade="all, delete-orphan",
+        lazy="raise",
+        passive_deletes=True,
+    )
 
 class QuizAnswer(Base):
     __tablename__ = "quiz_answers"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, insert_sentinel=True, server_default=text("uuid_generate_v7()"))
     attempt_id = Column(UUID(as_uuid=True), ForeignKey('quiz_attempts.id', ondelete='CASCADE'), nullable=False)
     question_id = Column(UUID(as_uuid=True), nullable=False)
-    selected_ids = Column(ARRAY(UUID(as_uuid=True)), default=[])
+    selected_ids = Column(PackedUUIDList, default=list)
     text_answer = Column(Text)
     is_correct = Column(Boolean)
     points_earned = Column(Integer, nullable=False, default=0)
-    answered_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    answered_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     
     # Relationship
-    attempt = relationship("QuizAttempt", back_populates="answers")
+    # Answer responses never include the attempt, so touching it is a bug rather
+    # than a reason to issue one SELECT per answer row
+    attempt = relationship("QuizAttempt", back_populates="answers", lazy="raise")
 
 class SRCard(Base):
     __tablename__ = "sr_cards"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
     user_id = Column(UUID(as_uuid=True), nullable=False)
     flashcard_id = Column(UUID(as_uuid=True), nullable=False)
     ease_factor = Column(Float, nullable=False, default=2.5)
@@ -109,17 +153,28 @@ class SRCard(Base):
     due_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     suspended = Column(Boolean, nullable=False, default=False)
 
+class SRSchedule(Base):
+    """Precomputed SM-2 transitions keyed by repetition bucket (0, 1, 2+) and quality."""
+    __tablename__ = "sr_schedule"
+
+    repetition = Column(Integer, primary_key=True)
+    quality = Column(SmallInteger, primary_key=True)
+    passed = Column(Boolean, nullable=False)
+    # NULL means the interval grows by the card's current ease factor
+    new_interval_d = Column(Integer)
+    ef_delta = Column(Float, nullable=False)
+
 class SRReview(Base):
     __tablename__ = "sr_reviews"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, server_default=text("uuid_generate_v7()"))
     user_id = Column(UUID(as_uuid=True), nullable=False)
     flashcard_id = Column(UUID(as_uuid=True), nullable=False)
     quality = Column(Integer, nullable=False)
     prev_interval = Column(Integer)
     new_interval = Column(Integer)
     new_ef = Column(Float)
-    reviewed_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    reviewed_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     
     __table_args__ = (
         CheckConstraint("quality BETWEEN 0 AND 5", name='quality_check'),
@@ -152,11 +207,23 @@ class UserPoints(Base):
     monthly = Column(Integer, nullable=False, default=0)
     updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
+class UserPointsLog(Base):
+    """Change log of user_points writes consumed by the incremental leaderboard refresh."""
+
+    __tablename__ = "mlog_user_points"
+
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    user_id = Column(UUID(as_uuid=True))
+    old_points = Column(Integer)
+    new_points = Column(Integer)
+    op = Column(Text, nullable=False)
+    logged_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
 class LeaderboardSnapshot(Base):
     __tablename__ = "leaderboard_snapshots"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    period = Column(Text, nullable=False)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    period = Column(LEADERBOARD_PERIOD, nullable=False)
     period_key = Column(Text, nullable=False)
     rank = Column(Integer, nullable=False)
     user_id = Column(UUID(as_uuid=True), nullable=False)
@@ -164,25 +231,25 @@ class LeaderboardSnapshot(Base):
     taken_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
     
     __table_args__ = (
-        CheckConstraint("period IN ('weekly','monthly')", name='period_check'),
+        UniqueConstraint("period", "period_key", "user_id", name='leaderboard_period_user_key'),
     )
 
 class ProgressEvent(Base):
     __tablename__ = "progress_events"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     user_id = Column(UUID(as_uuid=True), nullable=False)
     type = Column(Text, nullable=False)
     payload = Column(JSONB, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
 
 class Outbox(Base):
     __tablename__ = "outbox"
     
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
     aggregate_id = Column(UUID(as_uuid=True), nullable=False)
     topic = Column(Text, nullable=False)
     type = Column(Text, nullable=False)
     payload = Column(JSONB, nullable=False)
-    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), primary_key=True, nullable=False, server_default=func.now())
     published_at = Column(DateTime(timezone=True))
\ No newline at end of file
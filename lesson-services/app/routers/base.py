@@ -2,14 +2,114 @@
 
 from __future__ import annotations
 
-import json
-from typing import Any, Dict
+import base64
+import binascii
+import hashlib
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, List, Mapping, Optional, Tuple
+from uuid import UUID
 
+import orjson
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.routing import APIRoute
 
-from app.config import DEFAULT_SUCCESS_DATA, get_error_message
+from app.config import DEFAULT_SUCCESS_DATA, ERROR_MESSAGES, get_error_message
+
+# Compact JSON as rendered by JSONResponse/ORJSONResponse
+_FORMATTED_PREFIXES = (b'{"status":"success"', b'{"status":"error"')
+_EMPTY_BODIES = (b"", b"null", b'""')
+# An error envelope that already has its message needs no defaults filled in
+_COMPLETE_ERROR_PREFIX = b'{"status":"error","message":'
+_SUCCESS_PREFIX = b'{"status":"success","data":'
+_EMPTY_SUCCESS_BODY = orjson.dumps({"status": "success", "data": DEFAULT_SUCCESS_DATA})
+
+# Set by the outer response itself; raw header names are already lower-case bytes
+_EXCLUDED_HEADERS = frozenset((b"content-length", b"content-type"))
+
+# Resolved once; error paths look messages up directly instead of calling get_error_message
+_INTERNAL_ERROR_MESSAGE = get_error_message(status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+# Everything but the exception text of the unhandled-error envelope, encoded once
+_INTERNAL_ERROR_PREFIX = orjson.dumps({"status": "error", "message": _INTERNAL_ERROR_MESSAGE})[:-1] + b',"error":'
+
+
+def _internal_error_response(exc: Exception) -> Response:
+    return Response(
+        content=_INTERNAL_ERROR_PREFIX + orjson.dumps(str(exc)) + b"}",
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        media_type="application/json",
+    )
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {candidate.strip().removeprefix("W/") for candidate in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_json_response(request: Request, body: bytes, cache_control: str) -> Response:
+    """Return ``body`` with an ETag and Cache-Control, or 304 if the client already has it.
+
+    The ETag hashes the unwrapped body; the envelope added by ApiResponseRoute is
+    deterministic, so it validates the final representation as well.
+    """
+    etag = f'"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def streaming_success_response(chunks: AsyncIterable[bytes]) -> StreamingResponse:
+    """Stream a JSON array inside the success envelope.
+
+    Each chunk is one or more already serialized, comma-joined array items.
+    ApiResponseRoute passes streaming responses through untouched, so the
+    envelope is written here.
+    """
+
+    async def body() -> AsyncIterator[bytes]:
+        yield _SUCCESS_PREFIX + b"["
+        separator = b""
+        async for chunk in chunks:
+            yield separator + chunk
+            separator = b","
+        yield b"]}"
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+# Shared by every DELETE route: the body is empty and nothing writes to it, and ApiResponseRoute
+# only reads it to build the envelope. Routes that take BackgroundTasks must build their own,
+# since FastAPI attaches the tasks to the returned response
+NO_CONTENT_RESPONSE = Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# Header carrying the keyset cursor of the page after this one
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+KeysetCursor = Tuple[Optional[datetime], UUID]
+
+
+def encode_cursor(sort_value: Optional[datetime], row_id: UUID) -> str:
+    """Opaque keyset cursor for the row a page ended on."""
+    raw = f"{sort_value.isoformat() if sort_value else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> KeysetCursor:
+    try:
+        sort_value, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return (datetime.fromisoformat(sort_value) if sort_value else None, UUID(row_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
 
 
 class ApiResponseRoute(APIRoute):
@@ -17,67 +117,54 @@ class ApiResponseRoute(APIRoute):
 
     def get_route_handler(self):
         original_route_handler = super().get_route_handler()
+        # Bound once per route so the per-request path skips attribute lookups on self
+        format_error_response = self._format_error_response
+        build_success_response = self._build_success_response
+        should_passthrough = self._should_passthrough
+        parse_body = self._parse_body
+        build_error_response = self._build_error_response
+        wrap_success_body = self._wrap_success_body
 
         async def custom_route_handler(request: Request) -> Response:
             try:
                 response: Response = await original_route_handler(request)
             except HTTPException as exc:
-                return self._format_error_response(exc)
-            except Exception as exc:  # noqa: BLE001 - bubble as normalized error payload
-                return JSONResponse(
-                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    content={
-                        "status": "error",
-                        "message": get_error_message(status.HTTP_500_INTERNAL_SERVER_ERROR),
-                        "error": str(exc),
-                    },
+                return format_error_response(exc)
+            except RequestValidationError as exc:
+                return format_error_response(
+                    HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail=jsonable_encoder(exc.errors()),
+                    )
                 )
+            except Exception as exc:  # noqa: BLE001 - bubble as normalized error payload
+                return _internal_error_response(exc)
 
             if not isinstance(response, Response):
-                return self._build_success_response(status.HTTP_200_OK, response)
+                return build_success_response(status.HTTP_200_OK, response)
 
-            if self._should_passthrough(response):
+            if should_passthrough(response):
                 return response
 
-            payload, already_formatted = self._parse_body(response)
-
             if response.status_code >= 400:
-                return self._build_error_response(
+                payload, already_formatted = parse_body(response)
+                return build_error_response(
                     response,
                     payload,
                     already_formatted=already_formatted,
                 )
 
-            if already_formatted:
-                return JSONResponse(
-                    status_code=response.status_code,
-                    content=payload,
-                    headers=self._copy_headers(response.headers),
-                    background=response.background,
-                )
-
-            success_status = (
-                response.status_code
-                if response.status_code != status.HTTP_204_NO_CONTENT
-                else status.HTTP_200_OK
-            )
-
-            return self._build_success_response(
-                success_status,
-                payload,
-                headers=response.headers,
-                background=response.background,
-            )
+            return wrap_success_body(response)
 
         return custom_route_handler
 
-    def _format_error_response(self, exc: HTTPException) -> JSONResponse:
+    def _format_error_response(self, exc: HTTPException) -> ORJSONResponse:
         error_detail = self._normalize_error_detail(exc.detail)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "status": "error",
-                "message": get_error_message(exc.status_code),
+                "message": ERROR_MESSAGES.get(exc.status_code, _INTERNAL_ERROR_MESSAGE),
                 "error": error_detail,
             },
             headers=exc.headers,
@@ -93,6 +180,10 @@ class ApiResponseRoute(APIRoute):
         return str(detail) if detail is not None else ""
 
     def _should_passthrough(self, response: Response) -> bool:
+        if response.status_code == status.HTTP_304_NOT_MODIFIED:
+            return True
+        if isinstance(response, StreamingResponse):
+            return True
         media_type = getattr(response, "media_type", None)
         return media_type is not None and media_type != "application/json"
 
@@ -101,9 +192,13 @@ class ApiResponseRoute(APIRoute):
         if not body:
             return DEFAULT_SUCCESS_DATA.copy(), False
 
+        if body.startswith(_COMPLETE_ERROR_PREFIX):
+            # Passed through as raw bytes by _build_error_response
+            return bytes(body), True
+
         try:
-            parsed = json.loads(body)
-        except json.JSONDecodeError:
+            parsed = orjson.loads(body)
+        except orjson.JSONDecodeError:
             if isinstance(body, (bytes, bytearray)):
                 return body.decode(), False
             return body, False
@@ -113,35 +208,69 @@ class ApiResponseRoute(APIRoute):
 
         return parsed, False
 
+    def _wrap_success_body(self, response: Response) -> Response:
+        """Embed an already rendered JSON body in the success envelope without re-parsing it."""
+        body = bytes(getattr(response, "body", b""))
+        if body.startswith(_FORMATTED_PREFIXES):
+            content = body
+        elif body in _EMPTY_BODIES:
+            content = _EMPTY_SUCCESS_BODY
+        else:
+            content = _SUCCESS_PREFIX + body + b"}"
+
+        success_status = (
+            response.status_code
+            if response.status_code != status.HTTP_204_NO_CONTENT
+            else status.HTTP_200_OK
+        )
+        return self._with_headers(
+            Response(
+                content=content,
+                status_code=success_status,
+                media_type="application/json",
+                background=response.background,
+            ),
+            response.headers,
+        )
+
     def _build_error_response(
         self,
         response: Response,
         payload: Any,
         *,
         already_formatted: bool,
-    ) -> JSONResponse:
-        cleaned_headers = self._copy_headers(response.headers)
+    ) -> Response:
+        if already_formatted and isinstance(payload, bytes):
+            return self._with_headers(
+                Response(
+                    content=payload,
+                    status_code=response.status_code,
+                    media_type="application/json",
+                    background=response.background,
+                ),
+                response.headers,
+            )
+
         if already_formatted and isinstance(payload, dict):
             content = payload.copy()
             content.setdefault("status", "error")
-            content.setdefault("message", get_error_message(response.status_code))
-            return JSONResponse(
+            content.setdefault(
+                "message", ERROR_MESSAGES.get(response.status_code, _INTERNAL_ERROR_MESSAGE)
+            )
+        else:
+            content = {
+                "status": "error",
+                "message": ERROR_MESSAGES.get(response.status_code, _INTERNAL_ERROR_MESSAGE),
+                "error": self._normalize_error_detail(payload),
+            }
+
+        return self._with_headers(
+            ORJSONResponse(
                 status_code=response.status_code,
                 content=content,
-                headers=cleaned_headers,
                 background=response.background,
-            )
-
-        error_detail = self._normalize_error_detail(payload)
-        return JSONResponse(
-            status_code=response.status_code,
-            content={
-                "status": "error",
-                "message": get_error_message(response.status_code),
-                "error": error_detail,
-            },
-            headers=cleaned_headers,
-            background=response.background,
+            ),
+            response.headers,
         )
 
     def _build_success_response(
@@ -149,25 +278,38 @@ class ApiResponseRoute(APIRoute):
         status_code: int,
         data: Any,
         *,
-        headers: Dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
         background: Any | None = None,
-    ) -> JSONResponse:
-        normalized = self._normalize_success_data(data)
-        cleaned_headers = self._copy_headers(headers)
-        return JSONResponse(
-            status_code=status_code,
-            content={"status": "success", "data": normalized},
-            headers=cleaned_headers,
-            background=background,
+    ) -> Response:
+        if self._is_empty_success_data(data):
+            content = _EMPTY_SUCCESS_BODY
+        else:
+            content = orjson.dumps({"status": "success", "data": data})
+        return self._with_headers(
+            Response(
+                content=content,
+                status_code=status_code,
+                media_type="application/json",
+                background=background,
+            ),
+            headers,
         )
 
-    def _normalize_success_data(self, data: Any) -> Any:
-        if data is None or data == "" or data == DEFAULT_SUCCESS_DATA:
-            return DEFAULT_SUCCESS_DATA.copy()
-        return data
+    def _is_empty_success_data(self, data: Any) -> bool:
+        return data is None or data == "" or data == DEFAULT_SUCCESS_DATA
 
-    def _copy_headers(self, headers: Dict[str, str] | None) -> Dict[str, str] | None:
+    def _copy_headers(self, headers: Mapping[str, str] | None) -> List[Tuple[bytes, bytes]]:
         if not headers:
-            return None
-        excluded = {"content-length", "content-type"}
-        return {key: value for key, value in headers.items() if key.lower() not in excluded}
+            return []
+        raw = getattr(headers, "raw", None)
+        if raw is None:
+            raw = [
+                (key.lower().encode("latin-1"), value.encode("latin-1"))
+                for key, value in headers.items()
+            ]
+        return [(key, value) for key, value in raw if key not in _EXCLUDED_HEADERS]
+
+    def _with_headers(self, response: Response, headers: Mapping[str, str] | None) -> Response:
+        """Append the inner response's headers to ``response`` as raw byte pairs."""
+        response.raw_headers.extend(self._copy_headers(headers))
+        return response
@@ -3,17 +3,18 @@ from __future__ import annotations
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db
+from app.database.connection import get_async_db
 from app.schemas.course_lesson_schema import (
     CourseLessonCreate,
     CourseLessonResponse,
     CourseLessonUpdate,
 )
 from app.services.course_lesson_service import CourseLessonService
-from app.routers.base import ApiResponseRoute
+from app.routers.base import NO_CONTENT_RESPONSE, ApiResponseRoute, conditional_json_response
 
 
 router = APIRouter(
@@ -22,46 +23,63 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Course structure changes rarely and is the same for every user
+COURSE_LESSONS_CACHE_CONTROL = "public, max-age=300"
 
-def get_service(db: Session = Depends(get_db)) -> CourseLessonService:
+_COURSE_LESSON_LIST_ADAPTER = TypeAdapter(List[CourseLessonResponse])
+
+
+async def get_service(db: AsyncSession = Depends(get_async_db)) -> CourseLessonService:
     return CourseLessonService(db)
 
 
 @router.get("/by-course/{course_id}", response_model=List[CourseLessonResponse])
-def list_course_lessons(
+async def list_course_lessons(
     course_id: UUID,
+    request: Request,
     service: CourseLessonService = Depends(get_service),
-) -> List[CourseLessonResponse]:
-    return service.list_by_course(course_id)
+) -> Response:
+    lessons = await service.list_by_course(course_id)
+    return conditional_json_response(
+        request, _COURSE_LESSON_LIST_ADAPTER.dump_json(lessons), COURSE_LESSONS_CACHE_CONTROL
+    )
 
 
 @router.post("", response_model=CourseLessonResponse, status_code=status.HTTP_201_CREATED)
-def create_course_lesson(
+async def create_course_lesson(
     payload: CourseLessonCreate,
     service: CourseLessonService = Depends(get_service),
 ) -> CourseLessonResponse:
-    return service.create(payload)
+    return await service.create(payload)
+
+
+@router.post("/bulk", response_model=List[CourseLessonResponse], status_code=status.HTTP_201_CREATED)
+async def bulk_create_course_lessons(
+    payloads: List[CourseLessonCreate],
+    service: CourseLessonService = Depends(get_service),
+) -> List[CourseLessonResponse]:
+    return await service.bulk_create(payloads)
 
 
 @router.put("/{row_id}", response_model=CourseLessonResponse)
-def update_course_lesson(
+async def update_course_lesson(
     row_id: UUID,
     payload: CourseLessonUpdate,
     service: CourseLessonService = Depends(get_service),
 ) -> CourseLessonResponse:
-    row = service.update(row_id, payload)
+    row = await service.update(row_id, payload)
     if row is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course lesson not found")
     return row
 
 
 @router.delete("/{row_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_course_lesson(
+async def delete_course_lesson(
     row_id: UUID,
     service: CourseLessonService = Depends(get_service),
-):
-    deleted = service.delete(row_id)
+) -> Response:
+    deleted = await service.delete(row_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Course lesson not found")
-    return None
+    return NO_CONTENT_RESPONSE
 
@@ -1,21 +1,32 @@
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db
+from app.database.cache import (
+    cache_delete,
+    cache_get,
+    cache_set,
+    daily_month_cache_key,
+    daily_summary_cache_key,
+)
+from app.database.connection import get_async_db
 from app.schemas.daily_activity_schema import (
     DailyActivityIncrementRequest,
     DailyActivityMonthSummary,
     DailyActivityResponse,
     DailyActivitySummary,
-    DailyTotals,
 )
-from app.services.daily_activity_service import DailyActivityService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.services.daily_activity_service import ActivityRow, DailyActivityService
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import (
+    ApiResponseRoute,
+    conditional_json_response,
+    streaming_success_response,
+)
 
 
 router = APIRouter(
@@ -24,12 +35,64 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+SUMMARY_CACHE_TTL = 60
+CURRENT_MONTH_CACHE_TTL = 60
+# Past months rarely change and every write path deletes the key, so Redis keeps them longer
+PAST_MONTH_CACHE_TTL = 24 * 60 * 60
+# Browser cache window for the polled today/week reads
+POLLED_CACHE_CONTROL = "private, max-age=30"
+# Back-dated increments can still change a closed month, so clients revalidate with the ETag
+PAST_MONTH_CACHE_CONTROL = "private, no-cache"
+# Range reads without date_from cover the 30 days ending at date_to
+DEFAULT_RANGE_SPAN = timedelta(days=29)
+# Widest range a single request may ask for, and the width above which it is streamed
+MAX_RANGE_DAYS = 366
+STREAM_RANGE_DAYS = 90
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
 
-def get_daily_activity_service(db: Session = Depends(get_db)) -> DailyActivityService:
+async def get_daily_activity_service(db: AsyncSession = Depends(get_async_db)) -> DailyActivityService:
     """Dependency to get DailyActivityService instance."""
     return DailyActivityService(db)
 
 
+def _activity_response(row: ActivityRow) -> DailyActivityResponse:
+    # Rows come straight from the database, so skip re-validation
+    return DailyActivityResponse.model_construct(
+        user_id=row[0],
+        activity_dt=row[1],
+        lessons_completed=row[2],
+        quizzes_completed=row[3],
+        minutes=row[4],
+        points=row[5],
+    )
+
+
+def _row_to_dict(row: ActivityRow) -> Dict[str, object]:
+    return dict(zip(ActivityRow._fields, row))
+
+
+# Read paths serialize database rows with orjson; pydantic stays on the request
+# side and in response_model for the API docs. asyncpg returns its own UUID
+# subclass, which orjson only handles through ``default``.
+def _dump_json(payload: object) -> bytes:
+    return orjson.dumps(payload, default=str)
+
+
+def _activity_list_json(rows: List[ActivityRow]) -> bytes:
+    return _dump_json([_row_to_dict(row) for row in rows])
+
+
+async def _stream_activity_json(
+    partitions: AsyncIterator[Sequence[ActivityRow]],
+) -> AsyncIterator[bytes]:
+    async for rows in partitions:
+        yield b",".join(_dump_json(_row_to_dict(row)) for row in rows)
+
+
 def _empty_activity(user_id: UUID, activity_dt: date) -> DailyActivityResponse:
     return DailyActivityResponse(
         user_id=user_id,
@@ -42,116 +105,161 @@ def _empty_activity(user_id: UUID, activity_dt: date) -> DailyActivityResponse:
 
 
 @router.get("/user/me/today", response_model=DailyActivityResponse)
-def get_today_activity(
+async def get_today_activity(
+    request: Request,
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service)
-) -> DailyActivityResponse:
-    activity = service.get_today_activity(user_id)
+) -> Response:
+    activity = await service.get_today_activity(user_id)
     if activity is None:
-        return _empty_activity(user_id, date.today())
-    return DailyActivityResponse.model_validate(activity)
+        response = _empty_activity(user_id, service.today)
+    else:
+        response = DailyActivityResponse.model_validate(activity)
+    return conditional_json_response(
+        request, response.model_dump_json().encode(), POLLED_CACHE_CONTROL
+    )
 
 
 @router.get(
     "/user/me/date/{activity_date}",
     response_model=DailyActivityResponse
 )
-def get_activity_by_date(
+async def get_activity_by_date(
     activity_date: date,
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service)
 ) -> DailyActivityResponse:
-    activity = service.get_activity_by_date(user_id, activity_date)
+    activity = await service.get_activity_by_date(user_id, activity_date)
     if activity is None:
         return _empty_activity(user_id, activity_date)
     return DailyActivityResponse.model_validate(activity)
 
 
 @router.get("/user/me/range", response_model=List[DailyActivityResponse])
-def get_activity_range(
+async def get_activity_range(
     date_from: Optional[date] = Query(default=None),
     date_to: Optional[date] = Query(default=None),
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service),
-) -> List[DailyActivityResponse]:
-    end_date = date_to or date.today()
-    start_date = date_from or (end_date - timedelta(days=29))
+) -> Response:
+    end_date = date_to or service.today
+    start_date = date_from or (end_date - DEFAULT_RANGE_SPAN)
     if start_date > end_date:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="date_from must be before or equal to date_to",
         )
-    activities = service.get_activity_range(user_id, start_date, end_date)
-    return [DailyActivityResponse.model_validate(activity) for activity in activities]
+    span_days = (end_date - start_date).days + 1
+    if span_days > MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Date range cannot exceed {MAX_RANGE_DAYS} days",
+        )
+    if span_days > STREAM_RANGE_DAYS:
+        return streaming_success_response(
+            _stream_activity_json(
+                service.stream_activity_range(user_id, start_date, end_date)
+            )
+        )
+    activities = await service.get_activity_range(user_id, start_date, end_date)
+    return _json_response(_activity_list_json(activities))
 
 
 @router.get("/user/me/week", response_model=List[DailyActivityResponse])
-def get_week_activity(
+async def get_week_activity(
+    request: Request,
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service)
-) -> List[DailyActivityResponse]:
-    activities = service.get_week_activity(user_id)
-    return [DailyActivityResponse.model_validate(activity) for activity in activities]
+) -> Response:
+    activities = await service.get_week_activity(user_id)
+    return conditional_json_response(
+        request, _activity_list_json(activities), POLLED_CACHE_CONTROL
+    )
 
 
 @router.get("/user/me/month", response_model=DailyActivityMonthSummary)
-def get_month_activity(
+async def get_month_activity(
+    request: Request,
     year: Optional[int] = Query(default=None),
     month: Optional[int] = Query(default=None, ge=1, le=12),
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service),
-) -> DailyActivityMonthSummary:
-    today = date.today()
+) -> Response:
+    today = service.today
     target_year = year or today.year
     target_month = month or today.month
-    summary = service.get_month_activity(user_id, target_year, target_month)
-    return DailyActivityMonthSummary(
-        year=summary["year"],
-        month=summary["month"],
-        totals=DailyTotals(**summary["totals"]),
-        days=[
-            DailyActivityResponse.model_validate(activity)
-            for activity in summary["days"]
-        ],
+    is_past_month = (target_year, target_month) < (today.year, today.month)
+    cache_control = PAST_MONTH_CACHE_CONTROL if is_past_month else POLLED_CACHE_CONTROL
+
+    cache_key = daily_month_cache_key(user_id, target_year, target_month)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return conditional_json_response(request, cached, cache_control)
+
+    summary = await service.get_month_activity(user_id, target_year, target_month)
+    body = _dump_json(
+        {
+            "year": summary["year"],
+            "month": summary["month"],
+            "totals": summary["totals"],
+            "days": [_row_to_dict(activity) for activity in summary["days"]],
+        }
     )
 
+    ttl = PAST_MONTH_CACHE_TTL if is_past_month else CURRENT_MONTH_CACHE_TTL
+    await cache_set(cache_key, body, ttl)
+    return conditional_json_response(request, body, cache_control)
+
 
 @router.get("/user/me/stats/summary", response_model=DailyActivitySummary)
-def get_activity_summary(
+async def get_activity_summary(
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service)
-) -> DailyActivitySummary:
-    summary = service.get_activity_summary(user_id)
-    return DailyActivitySummary(
-        lifetime=DailyTotals(**summary["lifetime"]),
-        last_7_days=DailyTotals(**summary["last_7_days"]),
-        last_30_days=DailyTotals(**summary["last_30_days"]),
-        average_per_day=DailyTotals(**summary["average_per_day"]),
-        total_active_days=summary["total_active_days"],
-        most_active_day=(
-            DailyActivityResponse.model_validate(summary["most_active_day"])
-            if summary["most_active_day"]
-            else None
-        ),
+) -> Response:
+    cache_key = daily_summary_cache_key(user_id, service.today)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
+    summary = await service.get_activity_summary(user_id)
+    most_active_day = summary["most_active_day"]
+    # Totals are already int dicts in DailyTotals field order; no model repack needed
+    body = _dump_json(
+        {
+            "lifetime": summary["lifetime"],
+            "last_7_days": summary["last_7_days"],
+            "last_30_days": summary["last_30_days"],
+            "average_per_day": summary["average_per_day"],
+            "total_active_days": summary["total_active_days"],
+            "most_active_day": _row_to_dict(most_active_day) if most_active_day else None,
+        }
     )
 
+    await cache_set(cache_key, body, SUMMARY_CACHE_TTL)
+    return _json_response(body)
+
 
 @router.post("/increment", response_model=DailyActivityResponse)
-def increment_activity(
+async def increment_activity(
     payload: DailyActivityIncrementRequest, 
     user_id: UUID = Depends(get_current_user_id),
     service: DailyActivityService = Depends(get_daily_activity_service)
 ) -> DailyActivityResponse:
-    try:
-        activity = service.increment_activity(
-            user_id=user_id,
-            activity_date=payload.activity_dt or date.today(),
-            field=payload.field.lower(),
-            amount=payload.amount,
-        )
-    except ValueError as exc:  # pragma: no cover - defensive, ensures 400 for invalid field
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
-        ) from exc
+    increment = (
+        service.increment_activity if payload.consistent else service.buffer_increment
+    )
+    # The schema already restricts field to a known counter
+    activity = await increment(
+        user_id=user_id,
+        activity_date=payload.activity_dt or service.today,
+        field=payload.field,
+        amount=payload.amount,
+    )
 
-    return DailyActivityResponse.model_validate(activity)
+    if payload.consistent:
+        # Buffered increments are invalidated by the flush that writes them
+        await cache_delete(
+            daily_month_cache_key(user_id, activity.activity_dt.year, activity.activity_dt.month),
+            daily_summary_cache_key(user_id, service.today),
+        )
+    return _activity_response(activity)
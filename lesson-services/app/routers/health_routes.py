@@ -1,11 +1,14 @@
-from typing import Dict
+import orjson
+from fastapi import APIRouter, Response, status
 
-from fastapi import APIRouter, status
+# Probes hit this every second per pod, so the success envelope is built once at
+# import and the route skips ApiResponseRoute entirely
+_HEALTH_BODY = orjson.dumps(
+    {"status": "success", "data": {"status": "healthy", "service": "lesson-services"}}
+)
 
-from app.routers.base import ApiResponseRoute
-
-router = APIRouter(route_class=ApiResponseRoute)
+router = APIRouter()
 
 @router.get("/health", status_code=status.HTTP_200_OK)
-async def health_check() -> Dict[str, str]:
-    return {"status": "healthy", "service": "lesson-services"}
+async def health_check() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
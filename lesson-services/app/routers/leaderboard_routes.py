@@ -1,18 +1,20 @@
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db
+from app.database.cache import cache_delete_prefix, cache_get, cache_set
+from app.database.connection import get_async_db
 from app.schemas.leaderboard_schema import (
     LeaderboardPeriod,
     LeaderboardResponse,
     LeaderboardSnapshotCreate,
 )
 from app.services.leaderboard_service import LeaderboardService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import ApiResponseRoute, conditional_json_response
 
 
 router = APIRouter(
@@ -21,109 +23,208 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Leaderboards are shared by every user and only change on snapshot/refresh,
+# which clear the whole prefix
+LEADERBOARD_CACHE_TTL = 300
+_LEADERBOARD_CACHE_PREFIX = "leaderboard:"
 
-def get_leaderboard_service(db: Session = Depends(get_db)) -> LeaderboardService:
+# Snapshots of closed periods never change; open ones are revalidated by ETag
+CLOSED_PERIOD_CACHE_CONTROL = "public, max-age=86400"
+OPEN_PERIOD_CACHE_CONTROL = "public, no-cache"
+
+_LEADERBOARD_LIST_ADAPTER = TypeAdapter(List[LeaderboardResponse])
+
+
+def _leaderboard_cache_key(*parts: object) -> str:
+    return _LEADERBOARD_CACHE_PREFIX + ":".join(str(part) for part in parts)
+
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _period_cache_control(
+    service: LeaderboardService, period: LeaderboardPeriod, period_key: str
+) -> str:
+    # Period keys sort chronologically, so anything before the current key is closed
+    if period_key < service.current_period_key(period):
+        return CLOSED_PERIOD_CACHE_CONTROL
+    return OPEN_PERIOD_CACHE_CONTROL
+
+
+def _respond(request: Optional[Request], body: bytes, cache_control: Optional[str]) -> Response:
+    if request is None or cache_control is None:
+        return _json_response(body)
+    return conditional_json_response(request, body, cache_control)
+
+
+async def _cached_leaderboard(
+    cache_key: str,
+    load: Callable[[], Awaitable[Optional[LeaderboardResponse]]],
+    request: Optional[Request] = None,
+    cache_control: Optional[str] = None,
+) -> Response:
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return _respond(request, cached, cache_control)
+
+    leaderboard = await load()
+    if not leaderboard:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Leaderboard not found"
+        )
+
+    body = leaderboard.model_dump_json().encode()
+    await cache_set(cache_key, body, LEADERBOARD_CACHE_TTL)
+    return _respond(request, body, cache_control)
+
+
+async def _cached_history(
+    request: Request,
+    cache_key: str,
+    load: Callable[[], Awaitable[List[LeaderboardResponse]]],
+) -> Response:
+    # History pages gain new periods over time, so they are always revalidated
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return conditional_json_response(request, cached, OPEN_PERIOD_CACHE_CONTROL)
+
+    body = _LEADERBOARD_LIST_ADAPTER.dump_json(await load())
+    await cache_set(cache_key, body, LEADERBOARD_CACHE_TTL)
+    return conditional_json_response(request, body, OPEN_PERIOD_CACHE_CONTROL)
+
+
+async def get_leaderboard_service(db: AsyncSession = Depends(get_async_db)) -> LeaderboardService:
     """Dependency to get LeaderboardService instance."""
     return LeaderboardService(db)
 
 
 @router.get("/weekly/current", response_model=LeaderboardResponse)
-def get_current_weekly_leaderboard(
+async def get_current_weekly_leaderboard(
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> LeaderboardResponse:
-    leaderboard = service.get_current_weekly_leaderboard(limit=limit, offset=offset)
-    if not leaderboard:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Leaderboard not found"
-        )
-    return leaderboard
+) -> Response:
+    return await _cached_leaderboard(
+        _leaderboard_cache_key("weekly", "current", limit, offset),
+        lambda: service.get_current_weekly_leaderboard(limit=limit, offset=offset),
+    )
 
 
 @router.get("/monthly/current", response_model=LeaderboardResponse)
-def get_current_monthly_leaderboard(
+async def get_current_monthly_leaderboard(
     limit: int = Query(100, ge=1, le=500),
     offset: int = Query(0, ge=0),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> LeaderboardResponse:
-    leaderboard = service.get_current_monthly_leaderboard(limit=limit, offset=offset)
-    if not leaderboard:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Leaderboard not found"
-        )
-    return leaderboard
+) -> Response:
+    return await _cached_leaderboard(
+        _leaderboard_cache_key("monthly", "current", limit, offset),
+        lambda: service.get_current_monthly_leaderboard(limit=limit, offset=offset),
+    )
 
 
 @router.get("/weekly/history", response_model=List[LeaderboardResponse])
-def get_weekly_history(
+async def get_weekly_history(
+    request: Request,
     limit: int = Query(10, ge=1, le=52),
     offset: int = Query(0, ge=0),
+    before: Optional[str] = Query(None, description="Return weeks older than this period key"),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> List[LeaderboardResponse]:
-    return service.get_weekly_history(limit=limit, offset=offset)
+) -> Response:
+    return await _cached_history(
+        request,
+        _leaderboard_cache_key("weekly", "history", limit, offset, before or ""),
+        lambda: service.get_weekly_history(limit=limit, offset=offset, before=before),
+    )
 
 
 @router.get("/monthly/history", response_model=List[LeaderboardResponse])
-def get_monthly_history(
+async def get_monthly_history(
+    request: Request,
     limit: int = Query(12, ge=1, le=60),
     offset: int = Query(0, ge=0),
+    before: Optional[str] = Query(None, description="Return months older than this period key"),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> List[LeaderboardResponse]:
-    return service.get_monthly_history(limit=limit, offset=offset)
+) -> Response:
+    return await _cached_history(
+        request,
+        _leaderboard_cache_key("monthly", "history", limit, offset, before or ""),
+        lambda: service.get_monthly_history(limit=limit, offset=offset, before=before),
+    )
+
+
+async def _create_snapshot(
+    service: LeaderboardService,
+    period: LeaderboardPeriod,
+    payload: LeaderboardSnapshotCreate,
+) -> Dict[str, int]:
+    created = await service.create_snapshot(period, payload)
+    await cache_delete_prefix(_LEADERBOARD_CACHE_PREFIX)
+    return {"created": created}
 
 
 @router.post("/snapshot/weekly", status_code=status.HTTP_201_CREATED)
-def create_weekly_snapshot(
+async def create_weekly_snapshot(
     payload: LeaderboardSnapshotCreate,
     service: LeaderboardService = Depends(get_leaderboard_service),
 ) -> Dict[str, int]:
-    created = service.create_snapshot(LeaderboardPeriod.WEEKLY, payload)
-    return {"created": created}
+    return await _create_snapshot(service, LeaderboardPeriod.WEEKLY, payload)
 
 
 @router.post("/snapshot/monthly", status_code=status.HTTP_201_CREATED)
-def create_monthly_snapshot(
+async def create_monthly_snapshot(
     payload: LeaderboardSnapshotCreate,
     service: LeaderboardService = Depends(get_leaderboard_service),
 ) -> Dict[str, int]:
-    created = service.create_snapshot(LeaderboardPeriod.MONTHLY, payload)
-    return {"created": created}
+    return await _create_snapshot(service, LeaderboardPeriod.MONTHLY, payload)
+
+
+@router.post("/refresh")
+async def refresh_leaderboards(
+    limit: int = Query(100, ge=1, le=500),
+    service: LeaderboardService = Depends(get_leaderboard_service),
+) -> Dict[str, int]:
+    results = await service.refresh_leaderboards(limit=limit)
+    if any(results.values()):
+        await cache_delete_prefix(_LEADERBOARD_CACHE_PREFIX)
+    return results
 
 
 @router.get("/user/me/history", response_model=Dict[str, List[LeaderboardResponse]])
-def get_user_history(
+async def get_user_history(
     user_id: UUID = Depends(get_current_user_id),
     service: LeaderboardService = Depends(get_leaderboard_service),
 ) -> Dict[str, List[LeaderboardResponse]]:
-    return service.get_user_leaderboard_history(user_id)
+    return await service.get_user_leaderboard_history(user_id)
 
 
 @router.get("/week/{week_key}", response_model=LeaderboardResponse)
-def get_week_leaderboard(
+async def get_week_leaderboard(
+    request: Request,
     week_key: str,
     limit: Optional[int] = Query(None, ge=1, le=500),
     offset: int = Query(0, ge=0),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> LeaderboardResponse:
-    leaderboard = service.get_leaderboard_by_week(week_key, limit=limit, offset=offset)
-    if not leaderboard:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Leaderboard not found"
-        )
-    return leaderboard
+) -> Response:
+    return await _cached_leaderboard(
+        _leaderboard_cache_key("weekly", week_key, limit, offset),
+        lambda: service.get_leaderboard_by_week(week_key, limit=limit, offset=offset),
+        request,
+        _period_cache_control(service, LeaderboardPeriod.WEEKLY, week_key),
+    )
 
 
 @router.get("/month/{month_key}", response_model=LeaderboardResponse)
-def get_month_leaderboard(
+async def get_month_leaderboard(
+    request: Request,
     month_key: str,
     limit: Optional[int] = Query(None, ge=1, le=500),
     offset: int = Query(0, ge=0),
     service: LeaderboardService = Depends(get_leaderboard_service),
-) -> LeaderboardResponse:
-    leaderboard = service.get_leaderboard_by_month(month_key, limit=limit, offset=offset)
-    if not leaderboard:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Leaderboard not found"
-        )
-    return leaderboard
+) -> Response:
+    return await _cached_leaderboard(
+        _leaderboard_cache_key("monthly", month_key, limit, offset),
+        lambda: service.get_leaderboard_by_month(month_key, limit=limit, offset=offset),
+        request,
+        _period_cache_control(service, LeaderboardPeriod.MONTHLY, month_key),
+    )
@@ -1,16 +1,13 @@
-from datetime import datetime
-from typing import List, Optional
-from uuid import UUID
+from typing import Any, Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.connection import get_async_db
+from app.schemas.outbox_schema import OutboxCreate, OutboxMarkPublished
+from app.services.outbox_service import OutboxService
 from app.routers.base import ApiResponseRoute
 
-# Import dependencies
-# from app.database.connection import get_db
-# from app.services.outbox_service import OutboxService
-# from app.schemas.outbox_schema import OutboxResponse
 
 router = APIRouter(
     prefix="/api/outbox",
@@ -18,51 +15,38 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
-# GET /api/outbox/pending
-# Logic: Get unpublished outbox messages (internal/admin)
-# - Query outbox where published_at IS NULL
-# - Order by created_at ASC (FIFO)
-# - Optional limit for batch processing
-# - Return list of pending messages
 
-# GET /api/outbox/{outbox_id}
-# Logic: Get specific outbox message
-# - Fetch outbox record by id
-# - Return message with topic, type, payload, and status
+async def get_outbox_service(db: AsyncSession = Depends(get_async_db)) -> OutboxService:
+    """Dependency to get OutboxService instance."""
+    return OutboxService(db)
 
-# POST /api/outbox
-# Logic: Create outbox message (internal use)
-# - Validate request body (aggregate_id, topic, type, payload)
-# - Topics: 'user.progress', 'lesson.completed', 'quiz.submitted'
-# - Types: 'LessonCompleted', 'QuizSubmitted', 'StreakUpdated'
-# - Create outbox record with:
-#   - aggregate_id (e.g., user_id)
-#   - topic (message queue topic/exchange)
-#   - type (event type)
-#   - payload (JSONB event data)
-#   - created_at (current timestamp)
-#   - published_at (NULL initially)
-# - Insert and commit
-# - Return created outbox record
-# - Background worker will pick up and publish
 
-# PATCH /api/outbox/{outbox_id}/mark-published
-# Logic: Mark message as published (called by worker)
-# - Update published_at = current timestamp
-# - Commit transaction
-# - Return updated record
+@router.get("/stats")
+async def get_outbox_stats(
+    service: OutboxService = Depends(get_outbox_service),
+) -> Dict[str, Any]:
+    return await service.get_outbox_stats()
 
-# DELETE /api/outbox/cleanup
-# Logic: Delete old published messages (maintenance)
-# - Query params: days_old (default 7)
-# - Delete outbox records where published_at < X days ago
-# - Keep unpublished messages
-# - Return count of deleted records
 
-# GET /api/outbox/stats
-# Logic: Get outbox statistics
-# - Count pending messages
-# - Count published messages in last 24h
-# - Count failed publishes (old unpublished)
-# - Average publish time
-# - Return statistics object
+@router.post("/batch", status_code=status.HTTP_201_CREATED)
+async def create_messages(
+    payload: List[OutboxCreate],
+    service: OutboxService = Depends(get_outbox_service),
+) -> Dict[str, int]:
+    return {"created": await service.create_messages(payload)}
+
+
+@router.patch("/mark-published-batch")
+async def mark_published_batch(
+    payload: OutboxMarkPublished,
+    service: OutboxService = Depends(get_outbox_service),
+) -> Dict[str, int]:
+    return {"updated": await service.mark_batch_as_published(payload.ids)}
+
+
+@router.delete("/cleanup")
+async def cleanup_published(
+    days_old: int = Query(7, ge=0),
+    service: OutboxService = Depends(get_outbox_service),
+) -> Dict[str, int]:
+    return {"deleted": await service.cleanup_old_published(days_old)}
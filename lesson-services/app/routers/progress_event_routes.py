@@ -1,18 +1,28 @@
 from datetime import date
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.engine import RowMapping
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.connection import get_db
+from app.database.cache import cache_get, cache_set
+from app.database.connection import get_async_db
 from app.schemas.progress_event_schema import (
     ProgressEventCreate,
     ProgressEventResponse,
 )
 from app.services.progress_event_service import ProgressEventService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import (
+    NO_CONTENT_RESPONSE,
+    ApiResponseRoute,
+    conditional_json_response,
+    streaming_success_response,
+)
 
 
 router = APIRouter(
@@ -21,28 +31,90 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Shared bounds of the paged event lists
+DEFAULT_EVENTS_LIMIT = 100
+MAX_EVENTS_LIMIT = 500
+# Pages larger than this are streamed row by row instead of built as one list;
+# payloads are free-form JSON, so a full 500-row page can get large
+STREAM_EVENTS_LIMIT = 100
+# A user's first event day only moves later as events are deleted, so a stale
+# value just skips fewer empty windows; backfilled events show up once it expires
+FIRST_EVENT_CACHE_TTL = 3600
+# Clients poll the recent feed; a short private window plus ETag revalidation
+RECENT_EVENTS_CACHE_CONTROL = "private, max-age=15"
+
+_EVENT_LIST_ADAPTER = TypeAdapter(List[ProgressEventResponse])
+
+
+def _first_event_cache_key(user_id: UUID) -> str:
+    return f"events:first-day:{user_id}"
+
+
+async def _ends_before_first_event(
+    service: ProgressEventService, user_id: UUID, date_to: Optional[date]
+) -> bool:
+    """True when ``date_to`` falls before the user's first event, so the page is empty."""
+    if date_to is None:
+        return False
+    cache_key = _first_event_cache_key(user_id)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return date_to < date.fromisoformat(cached.decode())
+
+    first_day = await service.get_first_event_date(user_id)
+    if first_day is None:
+        # No events yet; not cached, since the next insert would make it stale
+        return True
+    await cache_set(cache_key, first_day.isoformat().encode(), FIRST_EVENT_CACHE_TTL)
+    return date_to < first_day
+
+
+async def _stream_events_json(
+    partitions: AsyncIterator[Sequence[RowMapping]],
+) -> AsyncIterator[bytes]:
+    # OPT_UTC_Z keeps timestamps identical to the pydantic-rendered pages
+    async for rows in partitions:
+        yield b",".join(
+            orjson.dumps(dict(row), default=str, option=orjson.OPT_UTC_Z) for row in rows
+        )
+
 
-def get_progress_event_service(db: Session = Depends(get_db)) -> ProgressEventService:
+async def get_progress_event_service(db: AsyncSession = Depends(get_async_db)) -> ProgressEventService:
     """Dependency to get ProgressEventService instance."""
     return ProgressEventService(db)
 
 
 @router.get("/user/me", response_model=List[ProgressEventResponse])
-def get_user_events(
+async def get_user_events(
     event_type: Optional[str] = Query(None, alias="type"),
-    limit: int = Query(100, ge=1, le=500),
+    limit: int = Query(DEFAULT_EVENTS_LIMIT, ge=1, le=MAX_EVENTS_LIMIT),
     offset: int = Query(0, ge=0),
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
     user_id: UUID = Depends(get_current_user_id),
     service: ProgressEventService = Depends(get_progress_event_service),
-) -> List[ProgressEventResponse]:
+) -> Union[List[ProgressEventResponse], StreamingResponse]:
     if date_from and date_to and date_from > date_to:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="date_from must be before or equal to date_to",
         )
-    return service.get_user_events(
+    if await _ends_before_first_event(service, user_id, date_to):
+        return []
+    if limit > STREAM_EVENTS_LIMIT:
+        return streaming_success_response(
+            _stream_events_json(
+                service.stream_user_events(
+                    user_id=user_id,
+                    event_type=event_type,
+                    limit=limit,
+                    offset=offset,
+                    date_from=date_from,
+                    date_to=date_to,
+                )
+            )
+        )
+    return await service.get_user_events(
         user_id=user_id,
         event_type=event_type,
         limit=limit,
@@ -53,33 +125,44 @@ def get_user_events(
 
 
 @router.get("/{event_id}", response_model=ProgressEventResponse)
-def get_event(
+async def get_event(
     event_id: int, 
     service: ProgressEventService = Depends(get_progress_event_service)
 ) -> ProgressEventResponse:
-    event = service.get_event(event_id)
+    event = await service.get_event(event_id)
     if not event:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
     return event
 
 
 @router.post("", response_model=ProgressEventResponse, status_code=status.HTTP_201_CREATED)
-def create_event(
+async def create_event(
     payload: ProgressEventCreate,
     service: ProgressEventService = Depends(get_progress_event_service),
 ) -> ProgressEventResponse:
-    return service.create_event(payload)
+    return await service.create_event(payload)
 
 
 @router.get("/user/me/type/{event_type}", response_model=List[ProgressEventResponse])
-def get_events_by_type(
+async def get_events_by_type(
     event_type: str,
-    limit: int = Query(100, ge=1, le=500),
+    limit: int = Query(DEFAULT_EVENTS_LIMIT, ge=1, le=MAX_EVENTS_LIMIT),
     offset: int = Query(0, ge=0),
     user_id: UUID = Depends(get_current_user_id),
     service: ProgressEventService = Depends(get_progress_event_service),
-) -> List[ProgressEventResponse]:
-    return service.get_events_by_type(
+) -> Union[List[ProgressEventResponse], StreamingResponse]:
+    if limit > STREAM_EVENTS_LIMIT:
+        return streaming_success_response(
+            _stream_events_json(
+                service.stream_user_events(
+                    user_id=user_id,
+                    event_type=event_type,
+                    limit=limit,
+                    offset=offset,
+                )
+            )
+        )
+    return await service.get_events_by_type(
         user_id=user_id,
         event_type=event_type,
         limit=limit,
@@ -88,27 +171,31 @@ def get_events_by_type(
 
 
 @router.get("/user/me/recent", response_model=List[ProgressEventResponse])
-def get_recent_events(
+async def get_recent_events(
+    request: Request,
     limit: int = Query(50, ge=1, le=200),
     user_id: UUID = Depends(get_current_user_id),
     service: ProgressEventService = Depends(get_progress_event_service),
-) -> List[ProgressEventResponse]:
-    return service.get_recent_events(user_id=user_id, limit=limit)
+) -> Response:
+    events = await service.get_recent_events(user_id=user_id, limit=limit)
+    return conditional_json_response(
+        request, _EVENT_LIST_ADAPTER.dump_json(events), RECENT_EVENTS_CACHE_CONTROL
+    )
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(
+async def delete_event(
     event_id: int, 
     service: ProgressEventService = Depends(get_progress_event_service)
 ) -> Response:
-    deleted = service.delete_event(event_id)
+    deleted = await service.delete_event(event_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Event not found")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return NO_CONTENT_RESPONSE
 
 
 @router.get("/stats/types", response_model=Dict[str, int])
-def get_event_type_stats(
+async def get_event_type_stats(
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
     service: ProgressEventService = Depends(get_progress_event_service),
@@ -119,4 +206,4 @@ def get_event_type_stats(
             detail="date_from must be before or equal to date_to",
         )
 
-    return service.get_event_type_stats(date_from=date_from, date_to=date_to)
+    return await service.get_event_type_stats(date_from=date_from, date_to=date_to)
@@ -2,9 +2,11 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database.connection import get_db
+from app.models.progress_models import QuizAttempt
 from app.schemas.quiz_schema import (
     QuizAttemptCreate,
     QuizAttemptDetailResponse,
@@ -12,8 +14,14 @@ from app.schemas.quiz_schema import (
     QuizAttemptSubmit,
 )
 from app.services.quiz_attempt_service import QuizAttemptService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import (
+    NEXT_CURSOR_HEADER,
+    NO_CONTENT_RESPONSE,
+    ApiResponseRoute,
+    decode_cursor,
+    encode_cursor,
+)
 
 
 router = APIRouter(
@@ -22,6 +30,24 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+_ATTEMPT_LIST_ADAPTER = TypeAdapter(List[QuizAttemptResponse])
+_ATTEMPT_FIELDS = tuple(QuizAttemptResponse.model_fields)
+
+
+def _attempt_list_response(
+    attempts: List[QuizAttempt], headers: Optional[dict] = None
+) -> Response:
+    # Same single-pass serialization as the review lists; response_model is docs only here
+    body = _ATTEMPT_LIST_ADAPTER.dump_json(
+        [
+            QuizAttemptResponse.model_construct(
+                **{name: getattr(attempt, name) for name in _ATTEMPT_FIELDS}
+            )
+            for attempt in attempts
+        ]
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 def get_quiz_attempt_service(db: Session = Depends(get_db)) -> QuizAttemptService:
     """Dependency to get QuizAttemptService instance."""
@@ -57,18 +83,14 @@ def submit_quiz_attempt(
     attempt = service.submit_quiz(attempt_id, payload)
     if not attempt:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found or already submitted")
-    # Reload attempt with answers for complete response
-    refreshed = service.get_attempt(attempt_id)
-    if not refreshed:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found")
-    return QuizAttemptDetailResponse.model_validate(refreshed, from_attributes=True)
+    return QuizAttemptDetailResponse.model_validate(attempt, from_attributes=True)
 
 @router.get("/user/{user_id}", response_model=List[QuizAttemptResponse])
 def get_quiz_attempts_by_user_id(
     user_id: UUID,
     service: QuizAttemptService = Depends(get_quiz_attempt_service),
-) -> List[QuizAttemptResponse]:
-    return service.get_quiz_attempts_by_user_id(user_id)
+) -> Response:
+    return _attempt_list_response(service.get_quiz_attempts_by_user_id(user_id))
 
 
 @router.get("/user/me/quiz/{quiz_id}", response_model=List[QuizAttemptResponse])
@@ -76,8 +98,8 @@ def get_user_quiz_attempts(
     quiz_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
     service: QuizAttemptService = Depends(get_quiz_attempt_service),
-) -> List[QuizAttemptResponse]:
-    return service.get_user_quiz_attempts(user_id, quiz_id)
+) -> Response:
+    return _attempt_list_response(service.get_user_quiz_attempts(user_id, quiz_id))
 
 
 @router.get("/user/me/history", response_model=List[QuizAttemptResponse])
@@ -85,10 +107,24 @@ def get_user_quiz_history(
     passed: Optional[bool] = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(
+        None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"
+    ),
     user_id: UUID = Depends(get_current_user_id),
     service: QuizAttemptService = Depends(get_quiz_attempt_service),
-) -> List[QuizAttemptResponse]:
-    return service.get_user_quiz_history(user_id, passed=passed, limit=limit, offset=offset)
+) -> Response:
+    attempts = service.get_user_quiz_history(
+        user_id,
+        passed=passed,
+        limit=limit,
+        offset=offset,
+        cursor=decode_cursor(cursor) if cursor else None,
+    )
+    headers = None
+    if len(attempts) == limit:
+        last = attempts[-1]
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(last.submitted_at, last.id)}
+    return _attempt_list_response(attempts, headers)
 
 
 @router.get("/lesson/{lesson_id}/user/me", response_model=List[QuizAttemptResponse])
@@ -96,8 +132,8 @@ def get_lesson_quiz_attempts(
     lesson_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
     service: QuizAttemptService = Depends(get_quiz_attempt_service),
-) -> List[QuizAttemptResponse]:
-    return service.get_lesson_quiz_attempts(lesson_id, user_id)
+) -> Response:
+    return _attempt_list_response(service.get_lesson_quiz_attempts(lesson_id, user_id))
 
 
 @router.delete("/{attempt_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -108,4 +144,4 @@ def delete_quiz_attempt(
     deleted = service.delete_attempt(attempt_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Quiz attempt not found")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return NO_CONTENT_RESPONSE
@@ -1,14 +1,30 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
 
+from app.database.cache import (
+    SR_STATS_CACHE_TTL,
+    cache_delete,
+    cached_json,
+    sr_card_stats_cache_key,
+)
 from app.database.connection import get_db
 from app.schemas.spaced_repetition_schema import SRCardCreate, SRCardResponse, SRCardStatsResponse
 from app.services.sr_card_service import SRCardService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import (
+    NO_CONTENT_RESPONSE,
+    ApiResponseRoute,
+    conditional_json_response,
+    streaming_success_response,
+)
 
 router = APIRouter(
     prefix="/api/spaced-repetition/cards",
@@ -16,6 +32,18 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Review screens poll the due list; browsers reuse it briefly, then revalidate by ETag
+DUE_CARDS_CACHE_CONTROL = "private, max-age=15"
+
+_CARD_LIST_ADAPTER = TypeAdapter(List[SRCardResponse])
+_CARD_FIELDS = tuple(SRCardResponse.model_fields)
+
+
+def _stream_cards_json(partitions: Iterator[Sequence[RowMapping]]) -> Iterator[bytes]:
+    # OPT_UTC_Z keeps due_at identical to the pydantic-rendered lists
+    for rows in partitions:
+        yield b",".join(orjson.dumps(dict(row), option=orjson.OPT_UTC_Z) for row in rows)
+
 
 def get_sr_card_service(db: Session = Depends(get_db)) -> SRCardService:
     """Dependency to get SRCardService instance."""
@@ -28,26 +56,42 @@ def get_user_cards(
     due_only: bool = Query(False),
     user_id: UUID = Depends(get_current_user_id),
     service: SRCardService = Depends(get_sr_card_service),
-) -> List[SRCardResponse]:
-    cards = service.get_user_cards(user_id, suspended=suspended, due_only=due_only)
-    return [SRCardResponse.model_validate(card, from_attributes=True) for card in cards]
+) -> StreamingResponse:
+    # A user's whole deck has no page limit, so it is written as rows arrive; the
+    # sync cursor is advanced in the threadpool, off the event loop
+    return streaming_success_response(
+        iterate_in_threadpool(
+            _stream_cards_json(
+                service.stream_user_cards(user_id, suspended=suspended, due_only=due_only)
+            )
+        )
+    )
 
 
 @router.get("/user/me/due", response_model=List[SRCardResponse])
 def get_due_cards(
+    request: Request,
     user_id: UUID = Depends(get_current_user_id),
     service: SRCardService = Depends(get_sr_card_service)
-) -> List[SRCardResponse]:
+) -> Response:
     cards = service.get_due_cards(user_id)
-    return [SRCardResponse.model_validate(card, from_attributes=True) for card in cards]
+    # Typed ORM rows need no validation; model_construct just wraps them for dumping
+    body = _CARD_LIST_ADAPTER.dump_json(
+        [
+            SRCardResponse.model_construct(**{name: getattr(card, name) for name in _CARD_FIELDS})
+            for card in cards
+        ]
+    )
+    return conditional_json_response(request, body, DUE_CARDS_CACHE_CONTROL)
 
 
 @router.post("", response_model=SRCardResponse, status_code=status.HTTP_201_CREATED)
-def create_card(
+async def create_card(
     payload: SRCardCreate, 
     service: SRCardService = Depends(get_sr_card_service)
 ) -> SRCardResponse:
-    card = service.create_card(payload)
+    card = await run_in_threadpool(service.create_card, payload)
+    await cache_delete(sr_card_stats_cache_key(card.user_id))
     return SRCardResponse.model_validate(card, from_attributes=True)
 
 
@@ -63,24 +107,26 @@ def get_card(
 
 
 @router.patch("/{card_id}/suspend", response_model=SRCardResponse)
-def suspend_card(
+async def suspend_card(
     card_id: UUID, 
     service: SRCardService = Depends(get_sr_card_service)
 ) -> SRCardResponse:
-    card = service.suspend_card(card_id)
+    card = await run_in_threadpool(service.suspend_card, card_id)
     if not card:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SR card not found")
+    await cache_delete(sr_card_stats_cache_key(card.user_id))
     return SRCardResponse.model_validate(card, from_attributes=True)
 
 
 @router.patch("/{card_id}/unsuspend", response_model=SRCardResponse)
-def unsuspend_card(
+async def unsuspend_card(
     card_id: UUID, 
     service: SRCardService = Depends(get_sr_card_service)
 ) -> SRCardResponse:
-    card = service.unsuspend_card(card_id)
+    card = await run_in_threadpool(service.unsuspend_card, card_id)
     if not card:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SR card not found")
+    await cache_delete(sr_card_stats_cache_key(card.user_id))
     return SRCardResponse.model_validate(card, from_attributes=True)
 
 
@@ -92,13 +138,17 @@ def delete_card(
     deleted = service.delete_card(card_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SR card not found")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return NO_CONTENT_RESPONSE
 
 
 @router.get("/user/me/stats", response_model=SRCardStatsResponse)
-def get_user_card_stats(
+async def get_user_card_stats(
     user_id: UUID = Depends(get_current_user_id),
     service: SRCardService = Depends(get_sr_card_service)
-) -> SRCardStatsResponse:
-    stats = service.get_user_stats(user_id)
-    return SRCardStatsResponse(**stats)
+) -> Response:
+    body = await cached_json(
+        sr_card_stats_cache_key(user_id),
+        SR_STATS_CACHE_TTL,
+        lambda: SRCardStatsResponse(**service.get_user_stats(user_id)).model_dump_json().encode(),
+    )
+    return Response(content=body, media_type="application/json")
@@ -3,9 +3,20 @@ from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
-
+from starlette.concurrency import run_in_threadpool
+
+from app.database.cache import (
+    SR_STATS_CACHE_TTL,
+    cache_delete,
+    cached_json,
+    sr_card_stats_cache_key,
+    sr_review_stats_cache_key,
+    sr_today_stats_cache_key,
+)
 from app.database.connection import get_db
+from app.models.progress_models import SRReview
 from app.schemas.spaced_repetition_schema import (
     SRReviewCreate,
     SRReviewResponse,
@@ -13,8 +24,14 @@ from app.schemas.spaced_repetition_schema import (
     SRReviewTodayStatsResponse,
 )
 from app.services.sr_review_service import SRReviewService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import (
+    NEXT_CURSOR_HEADER,
+    NO_CONTENT_RESPONSE,
+    ApiResponseRoute,
+    decode_cursor,
+    encode_cursor,
+)
 
 router = APIRouter(
     prefix="/api/spaced-repetition/reviews",
@@ -22,6 +39,23 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+_REVIEW_LIST_ADAPTER = TypeAdapter(List[SRReviewResponse])
+_REVIEW_FIELDS = tuple(SRReviewResponse.model_fields)
+
+
+def _review_list_response(reviews: List[SRReview], headers: Optional[dict] = None) -> Response:
+    # Rows come from typed columns, so they are wrapped with model_construct and
+    # serialized once instead of validated here and again against response_model
+    body = _REVIEW_LIST_ADAPTER.dump_json(
+        [
+            SRReviewResponse.model_construct(
+                **{name: getattr(review, name) for name in _REVIEW_FIELDS}
+            )
+            for review in reviews
+        ]
+    )
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 def get_sr_review_service(db: Session = Depends(get_db)) -> SRReviewService:
     """Dependency to get SRReviewService instance."""
@@ -29,15 +63,21 @@ def get_sr_review_service(db: Session = Depends(get_db)) -> SRReviewService:
 
 
 @router.post("", response_model=SRReviewResponse, status_code=status.HTTP_201_CREATED)
-def create_review(
+async def create_review(
     payload: SRReviewCreate, 
     user_id: UUID = Depends(get_current_user_id),
     service: SRReviewService = Depends(get_sr_review_service)
 ) -> SRReviewResponse:
     try:
-        review = service.create_review(user_id, payload)
+        review = await run_in_threadpool(service.create_review, user_id, payload)
     except ValueError as exc:  # pragma: no cover - defensive
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    # A review also reschedules (or creates) its card
+    await cache_delete(
+        sr_review_stats_cache_key(user_id),
+        sr_today_stats_cache_key(user_id),
+        sr_card_stats_cache_key(user_id),
+    )
     return SRReviewResponse.model_validate(review, from_attributes=True)
 
 
@@ -47,17 +87,28 @@ def get_user_reviews(
     offset: int = Query(0, ge=0),
     date_from: Optional[date] = Query(None),
     date_to: Optional[date] = Query(None),
+    cursor: Optional[str] = Query(
+        None, description=f"Value of the previous page's {NEXT_CURSOR_HEADER} header"
+    ),
     user_id: UUID = Depends(get_current_user_id),
     service: SRReviewService = Depends(get_sr_review_service),
-) -> List[SRReviewResponse]:
+) -> Response:
+    after = decode_cursor(cursor) if cursor else None
+    if after is not None and after[0] is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
     reviews = service.get_user_reviews(
         user_id,
         limit=limit,
         offset=offset,
         date_from=date_from,
         date_to=date_to,
+        cursor=after,
     )
-    return [SRReviewResponse.model_validate(review, from_attributes=True) for review in reviews]
+    headers = None
+    if len(reviews) == limit:
+        last = reviews[-1]
+        headers = {NEXT_CURSOR_HEADER: encode_cursor(last.reviewed_at, last.id)}
+    return _review_list_response(reviews, headers)
 
 
 @router.get("/user/me/flashcard/{flashcard_id}", response_model=List[SRReviewResponse])
@@ -65,27 +116,38 @@ def get_flashcard_reviews(
     flashcard_id: UUID,
     user_id: UUID = Depends(get_current_user_id),
     service: SRReviewService = Depends(get_sr_review_service),
-) -> List[SRReviewResponse]:
-    reviews = service.get_flashcard_reviews(user_id, flashcard_id)
-    return [SRReviewResponse.model_validate(review, from_attributes=True) for review in reviews]
+) -> Response:
+    return _review_list_response(service.get_flashcard_reviews(user_id, flashcard_id))
 
 
 @router.get("/user/me/today", response_model=SRReviewTodayStatsResponse)
-def get_today_review_stats(
+async def get_today_review_stats(
     user_id: UUID = Depends(get_current_user_id),
     service: SRReviewService = Depends(get_sr_review_service)
-) -> SRReviewTodayStatsResponse:
-    stats = service.get_today_stats(user_id)
-    return SRReviewTodayStatsResponse(**stats)
+) -> Response:
+    body = await cached_json(
+        sr_today_stats_cache_key(user_id),
+        SR_STATS_CACHE_TTL,
+        lambda: SRReviewTodayStatsResponse(**service.get_today_stats(user_id))
+        .model_dump_json()
+        .encode(),
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/user/me/stats", response_model=SRReviewStatsResponse)
-def get_user_review_stats(
+async def get_user_review_stats(
     user_id: UUID = Depends(get_current_user_id),
     service: SRReviewService = Depends(get_sr_review_service)
-) -> SRReviewStatsResponse:
-    stats = service.get_user_review_stats(user_id)
-    return SRReviewStatsResponse(**stats)
+) -> Response:
+    body = await cached_json(
+        sr_review_stats_cache_key(user_id),
+        SR_STATS_CACHE_TTL,
+        lambda: SRReviewStatsResponse(**service.get_user_review_stats(user_id))
+        .model_dump_json()
+        .encode(),
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete("/{review_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -96,4 +158,4 @@ def delete_review(
     deleted = service.delete_review(review_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="SR review not found")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return NO_CONTENT_RESPONSE
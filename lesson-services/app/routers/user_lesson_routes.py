@@ -16,8 +16,8 @@ from app.schemas.user_lesson_schema import (
     UserLessonUpdate,
 )
 from app.services.user_lesson_service import UserLessonService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import NO_CONTENT_RESPONSE, ApiResponseRoute
 
 
 router = APIRouter(
@@ -133,4 +133,4 @@ def delete_user_lesson(
     deleted = service.delete_user_lesson(user_id, lesson_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User lesson not found")
-    return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return NO_CONTENT_RESPONSE
@@ -1,11 +1,19 @@
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.database.cache import (
+    POINTS_LEADERBOARD_CACHE_PREFIX,
+    cache_delete_prefix,
+    cached_json,
+    points_leaderboard_cache_key,
+)
 from app.database.connection import get_db
 from app.schemas.user_points_schema import (
     PointsAdjustmentRequest,
@@ -14,8 +22,8 @@ from app.schemas.user_points_schema import (
     UserPointsResponse,
 )
 from app.services.user_points_service import UserPointsService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import ApiResponseRoute, conditional_json_response
 
 
 router = APIRouter(
@@ -24,6 +32,14 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Boards are shared by every user and tolerate a minute of staleness, so point
+# adjustments leave them to expire; resets rewrite every row and clear the prefix
+POINTS_LEADERBOARD_CACHE_TTL = 60
+# Same staleness budget for browsers and shared proxies; ETags revalidate after that
+POINTS_LEADERBOARD_CACHE_CONTROL = f"public, max-age={POINTS_LEADERBOARD_CACHE_TTL}"
+
+_POINTS_LEADERBOARD_ADAPTER = TypeAdapter(List[PointsLeaderboardEntry])
+
 
 def get_user_points_service(db: Session = Depends(get_db)) -> UserPointsService:
     return UserPointsService(db)
@@ -82,49 +98,64 @@ def _build_leaderboard(records, attribute: str) -> List[PointsLeaderboardEntry]:
     return entries
 
 
+async def _cached_leaderboard(
+    request: Request, attribute: str, limit: int, offset: int, load: Callable[..., list]
+) -> Response:
+    body = await cached_json(
+        points_leaderboard_cache_key(attribute, limit, offset),
+        POINTS_LEADERBOARD_CACHE_TTL,
+        lambda: _POINTS_LEADERBOARD_ADAPTER.dump_json(
+            _build_leaderboard(load(limit=limit, offset=offset), attribute)
+        ),
+    )
+    return conditional_json_response(request, body, POINTS_LEADERBOARD_CACHE_CONTROL)
+
+
 @router.get("/leaderboard/lifetime", response_model=List[PointsLeaderboardEntry])
-def get_lifetime_leaderboard(
+async def get_lifetime_leaderboard(
+    request: Request,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     service: UserPointsService = Depends(get_user_points_service),
-) -> List[PointsLeaderboardEntry]:
-    records = service.get_lifetime_leaderboard(limit=limit, offset=offset)
-    return _build_leaderboard(records, "lifetime")
+) -> Response:
+    return await _cached_leaderboard(request, "lifetime", limit, offset, service.get_lifetime_leaderboard)
 
 
 @router.get("/leaderboard/weekly", response_model=List[PointsLeaderboardEntry])
-def get_weekly_leaderboard(
+async def get_weekly_leaderboard(
+    request: Request,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     service: UserPointsService = Depends(get_user_points_service),
-) -> List[PointsLeaderboardEntry]:
-    records = service.get_weekly_leaderboard(limit=limit, offset=offset)
-    return _build_leaderboard(records, "weekly")
+) -> Response:
+    return await _cached_leaderboard(request, "weekly", limit, offset, service.get_weekly_leaderboard)
 
 
 @router.get("/leaderboard/monthly", response_model=List[PointsLeaderboardEntry])
-def get_monthly_leaderboard(
+async def get_monthly_leaderboard(
+    request: Request,
     limit: int = Query(default=100, ge=1, le=500),
     offset: int = Query(default=0, ge=0),
     service: UserPointsService = Depends(get_user_points_service),
-) -> List[PointsLeaderboardEntry]:
-    records = service.get_monthly_leaderboard(limit=limit, offset=offset)
-    return _build_leaderboard(records, "monthly")
+) -> Response:
+    return await _cached_leaderboard(request, "monthly", limit, offset, service.get_monthly_leaderboard)
 
 
 @router.post("/reset/weekly")
-def reset_weekly_points(
+async def reset_weekly_points(
     service: UserPointsService = Depends(get_user_points_service),
 ) -> dict:
-    updated = service.reset_weekly_points()
+    updated = await run_in_threadpool(service.reset_weekly_points)
+    await cache_delete_prefix(POINTS_LEADERBOARD_CACHE_PREFIX)
     return {"updated": updated}
 
 
 @router.post("/reset/monthly")
-def reset_monthly_points(
+async def reset_monthly_points(
     service: UserPointsService = Depends(get_user_points_service),
 ) -> dict:
-    updated = service.reset_monthly_points()
+    updated = await run_in_threadpool(service.reset_monthly_points)
+    await cache_delete_prefix(POINTS_LEADERBOARD_CACHE_PREFIX)
     return {"updated": updated}
 
 
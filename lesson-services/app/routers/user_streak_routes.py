@@ -3,9 +3,11 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
+from app.database.cache import cached_json, streak_leaderboard_cache_key
 from app.database.connection import get_db
 from app.schemas.user_streak_schema import (
     StreakCheckRequest,
@@ -14,8 +16,8 @@ from app.schemas.user_streak_schema import (
     UserStreakStatusResponse,
 )
 from app.services.user_streak_service import UserStreakService
-from app.middlewares.auth_middleware import get_current_user_id
-from app.routers.base import ApiResponseRoute
+from app.dependencies.auth import get_current_user_id
+from app.routers.base import ApiResponseRoute, conditional_json_response
 
 
 router = APIRouter(
@@ -24,6 +26,12 @@ router = APIRouter(
     route_class=ApiResponseRoute,
 )
 
+# Shared by every user; streak checks are frequent, so the board simply expires
+STREAK_LEADERBOARD_CACHE_TTL = 60
+STREAK_LEADERBOARD_CACHE_CONTROL = f"public, max-age={STREAK_LEADERBOARD_CACHE_TTL}"
+
+_STREAK_LEADERBOARD_ADAPTER = TypeAdapter(List[StreakLeaderboardEntry])
+
 
 def get_user_streak_service(db: Session = Depends(get_db)) -> UserStreakService:
     return UserStreakService(db)
@@ -65,18 +73,25 @@ def get_streak_status(
 
 
 @router.get("/leaderboard", response_model=List[StreakLeaderboardEntry])
-def get_streak_leaderboard(
+async def get_streak_leaderboard(
+    request: Request,
     limit: int = Query(default=50, ge=1, le=200),
     service: UserStreakService = Depends(get_user_streak_service),
-) -> List[StreakLeaderboardEntry]:
-    records = service.get_streak_leaderboard(limit=limit)
-    return [
-        StreakLeaderboardEntry(
-            rank=index,
-            user_id=record.user_id,
-            current_len=record.current_len,
-            longest_len=record.longest_len,
-            last_day=record.last_day,
-        )
-        for index, record in enumerate(records, start=1)
-    ]
+) -> Response:
+    def load() -> bytes:
+        entries = [
+            StreakLeaderboardEntry(
+                rank=index,
+                user_id=record.user_id,
+                current_len=record.current_len,
+                longest_len=record.longest_len,
+                last_day=record.last_day,
+            )
+            for index, record in enumerate(service.get_streak_leaderboard(limit=limit), start=1)
+        ]
+        return _STREAK_LEADERBOARD_ADAPTER.dump_json(entries)
+
+    body = await cached_json(
+        streak_leaderboard_cache_key(limit), STREAK_LEADERBOARD_CACHE_TTL, load
+    )
+    return conditional_json_response(request, body, STREAK_LEADERBOARD_CACHE_CONTROL)
@@ -7,3 +7,4 @@ from .user_streak_schema import *
 from .user_points_schema import *
 from .leaderboard_schema import *
 from .progress_event_schema import *
+from .outbox_schema import *
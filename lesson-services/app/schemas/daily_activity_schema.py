@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 from datetime import date
 from uuid import UUID
@@ -55,5 +55,7 @@ class DailyActivitySummary(BaseModel):
 
 class DailyActivityIncrementRequest(BaseModel):
     activity_dt: Optional[date] = None
-    field: str  # 'lessons_completed', 'quizzes_completed', 'minutes', 'points'
-    amount: int = Field(default=1, ge=1)
\ No newline at end of file
+    field: Literal["lessons_completed", "quizzes_completed", "minutes", "points"]
+    amount: int = Field(default=1, ge=1)
+    # False coalesces the write through the in-process buffer and returns a projected row
+    consistent: bool = True
\ No newline at end of file
@@ -0,0 +1,15 @@
+from pydantic import BaseModel, Field
+from typing import List
+from uuid import UUID
+
+
+# Outbox Schemas
+class OutboxCreate(BaseModel):
+    aggregate_id: UUID
+    topic: str
+    type: str
+    payload: dict
+
+
+class OutboxMarkPublished(BaseModel):
+    ids: List[int] = Field(min_length=1)
@@ -60,6 +60,11 @@ class QuizAnswerSubmission(QuizAnswerBase):
     pass
 
 
+class QuizAnswerBulkCreate(BaseModel):
+    attempt_id: UUID
+    answers: List[QuizAnswerSubmission] = Field(min_length=1)
+
+
 class QuizAnswerUpdate(BaseModel):
     selected_ids: Optional[List[UUID]] = None
     text_answer: Optional[str] = None
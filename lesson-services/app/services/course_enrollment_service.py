@@ -4,8 +4,8 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, bindparam, desc, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.progress_models import CourseEnrollment
 from app.schemas.course_enrollment_schema import (
@@ -15,76 +15,89 @@ from app.schemas.course_enrollment_schema import (
     EnrollmentStatus,
 )
 
+# Hot list reads built once at import; user_id, status and paging are bound per call
+_LIST_FOR_USER = (
+    select(CourseEnrollment)
+    .where(CourseEnrollment.user_id == bindparam("user_id"))
+    .order_by(desc(CourseEnrollment.last_accessed_at), desc(CourseEnrollment.enrolled_at))
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit"))
+)
+_LIST_FOR_USER_BY_STATUS = _LIST_FOR_USER.where(CourseEnrollment.status == bindparam("status"))
+
 
 class CourseEnrollmentService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_by_id(self, enrollment_id: UUID, user_id: Optional[UUID] = None) -> Optional[CourseEnrollmentResponse]:
-        query = self.db.query(CourseEnrollment).filter(CourseEnrollment.id == enrollment_id)
+    async def _get_owned(self, enrollment_id: UUID, user_id: UUID) -> Optional[CourseEnrollment]:
+        result = await self.db.execute(
+            select(CourseEnrollment).where(
+                and_(
+                    CourseEnrollment.id == enrollment_id,
+                    CourseEnrollment.user_id == user_id,
+                )
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def get_by_id(self, enrollment_id: UUID, user_id: Optional[UUID] = None) -> Optional[CourseEnrollmentResponse]:
+        query = select(CourseEnrollment).where(CourseEnrollment.id == enrollment_id)
         if user_id is not None:
-            query = query.filter(CourseEnrollment.user_id == user_id)
-        row = query.one_or_none()
+            query = query.where(CourseEnrollment.user_id == user_id)
+        row = (await self.db.execute(query)).scalar_one_or_none()
         return CourseEnrollmentResponse.from_orm(row) if row else None
 
-    def get_for_user(
+    async def get_for_user(
         self,
         user_id: UUID,
         status: Optional[EnrollmentStatus] = None,
         limit: int = 100,
         offset: int = 0,
     ) -> List[CourseEnrollmentResponse]:
-        query = self.db.query(CourseEnrollment).filter(CourseEnrollment.user_id == user_id)
+        params = {"user_id": user_id, "offset": offset, "limit": limit}
         if status is not None:
-            query = query.filter(CourseEnrollment.status == status)
-        rows = (
-            query.order_by(desc(CourseEnrollment.last_accessed_at), desc(CourseEnrollment.enrolled_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
-        )
-        return [CourseEnrollmentResponse.from_orm(r) for r in rows]
-
-    def enroll(self, user_id: UUID, payload: CourseEnrollmentCreate) -> CourseEnrollmentResponse:
-        existing = (
-            self.db.query(CourseEnrollment)
-            .filter(
+            query = _LIST_FOR_USER_BY_STATUS
+            params["status"] = status
+        else:
+            query = _LIST_FOR_USER
+        result = await self.db.execute(query, params)
+        return [CourseEnrollmentResponse.from_orm(r) for r in result.scalars()]
+
+    async def enroll(self, user_id: UUID, payload: CourseEnrollmentCreate) -> CourseEnrollmentResponse:
+        result = await self.db.execute(
+            select(CourseEnrollment).where(
                 and_(
                     CourseEnrollment.user_id == user_id,
                     CourseEnrollment.course_id == payload.course_id,
                 )
             )
-            .one_or_none()
         )
+        existing = result.scalar_one_or_none()
         if existing:
             return CourseEnrollmentResponse.model_validate(existing)
 
-        row = CourseEnrollment(
-            user_id=user_id,
-            course_id=payload.course_id,
-            status=EnrollmentStatus.ENROLLED.value,
-            progress_percent=0,
-            enrolled_at=datetime.utcnow(),
-            last_accessed_at=datetime.utcnow(),
+        now = datetime.utcnow()
+        result = await self.db.execute(
+            insert(CourseEnrollment)
+            .values(
+                user_id=user_id,
+                course_id=payload.course_id,
+                status=EnrollmentStatus.ENROLLED.value,
+                progress_percent=0,
+                enrolled_at=now,
+                last_accessed_at=now,
+            )
+            .returning(CourseEnrollment)
         )
-        self.db.add(row)
-        self.db.commit()
-        self.db.refresh(row)
+        row = result.scalar_one()
+        await self.db.commit()
         return CourseEnrollmentResponse.model_validate(row)
 
-    def update(
+    async def update(
         self, enrollment_id: UUID, user_id: UUID, payload: CourseEnrollmentUpdate
     ) -> Optional[CourseEnrollmentResponse]:
-        row = (
-            self.db.query(CourseEnrollment)
-            .filter(
-                and_(
-                    CourseEnrollment.id == enrollment_id,
-                    CourseEnrollment.user_id == user_id,
-                )
-            )
-            .one_or_none()
-        )
+        row = await self._get_owned(enrollment_id, user_id)
         if not row:
             return None
 
@@ -99,27 +112,18 @@ class CourseEnrollmentService:
         if getattr(row, "status", None) == EnrollmentStatus.COMPLETED.value and row.completed_at is None:
             row.completed_at = datetime.utcnow()
 
-        self.db.commit()
-        self.db.refresh(row)
+        await self.db.commit()
+        await self.db.refresh(row)
         return CourseEnrollmentResponse.from_orm(row)
 
-    def cancel(self, enrollment_id: UUID, user_id: UUID) -> Optional[CourseEnrollmentResponse]:
-        row = (
-            self.db.query(CourseEnrollment)
-            .filter(
-                and_(
-                    CourseEnrollment.id == enrollment_id,
-                    CourseEnrollment.user_id == user_id,
-                )
-            )
-            .one_or_none()
-        )
+    async def cancel(self, enrollment_id: UUID, user_id: UUID) -> Optional[CourseEnrollmentResponse]:
+        row = await self._get_owned(enrollment_id, user_id)
         if not row:
             return None
         row.status = EnrollmentStatus.CANCELLED.value
         row.last_accessed_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(row)
+        await self.db.commit()
+        await self.db.refresh(row)
         return CourseEnrollmentResponse.from_orm(row)
 
 
@@ -3,8 +3,8 @@ from __future__ import annotations
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import and_, asc
-from sqlalchemy.orm import Session
+from sqlalchemy import asc, bindparam, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.progress_models import CourseLesson
 from app.schemas.course_lesson_schema import (
@@ -13,43 +13,59 @@ from app.schemas.course_lesson_schema import (
     CourseLessonUpdate,
 )
 
+# Hot read built once at import; only the bound course_id varies per call
+_LIST_BY_COURSE = (
+    select(CourseLesson)
+    .where(CourseLesson.course_id == bindparam("course_id"))
+    .order_by(asc(CourseLesson.ord), asc(CourseLesson.created_at))
+)
+
 
 class CourseLessonService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def list_by_course(self, course_id: UUID) -> List[CourseLessonResponse]:
-        rows = (
-            self.db.query(CourseLesson)
-            .filter(CourseLesson.course_id == course_id)
-            .order_by(asc(CourseLesson.ord), asc(CourseLesson.created_at))
-            .all()
-        )
-        return [CourseLessonResponse.from_orm(r) for r in rows]
+    async def _get(self, row_id: UUID) -> Optional[CourseLesson]:
+        result = await self.db.execute(select(CourseLesson).where(CourseLesson.id == row_id))
+        return result.scalar_one_or_none()
+
+    async def list_by_course(self, course_id: UUID) -> List[CourseLessonResponse]:
+        result = await self.db.execute(_LIST_BY_COURSE, {"course_id": course_id})
+        return [CourseLessonResponse.from_orm(r) for r in result.scalars()]
 
-    def create(self, payload: CourseLessonCreate) -> CourseLessonResponse:
-        row = CourseLesson(**payload.dict())
-        self.db.add(row)
-        self.db.commit()
-        self.db.refresh(row)
+    async def create(self, payload: CourseLessonCreate) -> CourseLessonResponse:
+        result = await self.db.execute(
+            insert(CourseLesson).values(**payload.model_dump()).returning(CourseLesson)
+        )
+        row = result.scalar_one()
+        await self.db.commit()
         return CourseLessonResponse.from_orm(row)
 
-    def update(self, row_id: UUID, payload: CourseLessonUpdate) -> Optional[CourseLessonResponse]:
-        row = self.db.query(CourseLesson).filter(CourseLesson.id == row_id).one_or_none()
+    async def bulk_create(self, payloads: List[CourseLessonCreate]) -> List[CourseLessonResponse]:
+        if not payloads:
+            return []
+        # A list of parameter sets runs as a single batched executemany
+        result = await self.db.scalars(
+            insert(CourseLesson).returning(CourseLesson),
+            [payload.model_dump() for payload in payloads],
+        )
+        rows = result.all()
+        await self.db.commit()
+        return [CourseLessonResponse.from_orm(r) for r in rows]
+
+    async def update(self, row_id: UUID, payload: CourseLessonUpdate) -> Optional[CourseLessonResponse]:
+        row = await self._get(row_id)
         if not row:
             return None
         for field, value in payload.dict(exclude_unset=True).items():
             setattr(row, field, value)
-        self.db.commit()
-        self.db.refresh(row)
+        await self.db.commit()
+        await self.db.refresh(row)
         return CourseLessonResponse.from_orm(row)
 
-    def delete(self, row_id: UUID) -> bool:
-        row = self.db.query(CourseLesson).filter(CourseLesson.id == row_id).one_or_none()
-        if not row:
-            return False
-        self.db.delete(row)
-        self.db.commit()
-        return True
+    async def delete(self, row_id: UUID) -> bool:
+        result = await self.db.execute(delete(CourseLesson).where(CourseLesson.id == row_id))
+        await self.db.commit()
+        return result.rowcount > 0
 
 
@@ -0,0 +1,157 @@
+import asyncio
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import date
+from typing import DefaultDict, Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from app.config import get_settings
+from app.database.cache import cache_delete, daily_month_cache_key, daily_summary_cache_key
+from app.database.bulk import copy_rows
+from app.database.connection import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ACTIVITY_FIELDS = ("lessons_completed", "quizzes_completed", "minutes", "points")
+
+ActivityKey = Tuple[UUID, date]
+
+
+class DailyActivityBuffer:
+    """Accumulates daily_activity increments in memory and merges them in one batch.
+
+    Increments come from sync route handlers running in the threadpool as well as
+    from the event loop, so the counters are guarded by a thread lock rather than
+    an asyncio lock.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: DefaultDict[ActivityKey, Counter] = defaultdict(Counter)
+
+    def add(self, user_id: UUID, activity_date: date, field: str, amount: int) -> None:
+        field = field.lower()
+        if field not in ACTIVITY_FIELDS:
+            raise ValueError(f"Invalid activity field: {field}")
+
+        with self._lock:
+            self._counters[(user_id, activity_date)][field] += amount
+
+    def pending(self, user_id: UUID, activity_date: date) -> Counter:
+        """Increments buffered for one user/day that have not been flushed yet."""
+        with self._lock:
+            counter = self._counters.get((user_id, activity_date))
+            return Counter(counter) if counter else Counter()
+
+    def _drain(self) -> Dict[ActivityKey, Counter]:
+        with self._lock:
+            drained, self._counters = self._counters, defaultdict(Counter)
+        return drained
+
+    def _restore(self, drained: Dict[ActivityKey, Counter]) -> None:
+        with self._lock:
+            for key, counter in drained.items():
+                self._counters[key].update(counter)
+
+    def flush(self) -> List[ActivityKey]:
+        """Write buffered increments to daily_activity; returns the user/day keys merged."""
+        drained = self._drain()
+        if not drained:
+            return []
+
+        rows = [
+            (user_id, activity_date, *(counter[field] for field in ACTIVITY_FIELDS))
+            for (user_id, activity_date), counter in drained.items()
+        ]
+        increments = ", ".join(
+            f"{field} = daily_activity.{field} + EXCLUDED.{field}" for field in ACTIVITY_FIELDS
+        )
+
+        db = SessionLocal()
+        try:
+            db.execute(
+                text(
+                    "CREATE TEMP TABLE daily_activity_stage "
+                    "(LIKE daily_activity INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+            copy_rows(
+                db,
+                "daily_activity_stage",
+                ("user_id", "activity_dt", *ACTIVITY_FIELDS),
+                rows,
+            )
+            db.execute(
+                text(
+                    "INSERT INTO daily_activity SELECT * FROM daily_activity_stage "
+                    f"ON CONFLICT (user_id, activity_dt) DO UPDATE SET {increments}"
+                )
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            # Keep the increments so the next flush retries them
+            self._restore(drained)
+            raise
+        finally:
+            db.close()
+
+        return list(drained)
+
+
+daily_activity_buffer = DailyActivityBuffer()
+
+_flush_task: Optional[asyncio.Task] = None
+
+
+async def flush_daily_activity_buffer() -> None:
+    """Flush the buffer, then drop the cached month and summary reads it made stale.
+
+    Reads between an increment and its flush may have re-cached totals without it,
+    so the invalidation has to follow the write rather than the increment.
+    """
+    flushed = await run_in_threadpool(daily_activity_buffer.flush)
+    if not flushed:
+        return
+
+    today = date.today()
+    keys = set()
+    for user_id, activity_date in flushed:
+        keys.add(daily_month_cache_key(user_id, activity_date.year, activity_date.month))
+        keys.add(daily_summary_cache_key(user_id, today))
+    await cache_delete(*keys)
+
+
+async def _flush_periodically(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_daily_activity_buffer()
+        except Exception:
+            logger.exception("Failed to flush daily activity buffer")
+
+
+def start_daily_activity_flusher() -> None:
+    global _flush_task
+    if _flush_task is None:
+        _flush_task = asyncio.create_task(
+            _flush_periodically(get_settings().daily_activity_flush_seconds)
+        )
+
+
+async def stop_daily_activity_flusher() -> None:
+    """Stop the periodic flush and write out whatever is still buffered."""
+    global _flush_task
+    if _flush_task is not None:
+        _flush_task.cancel()
+        try:
+            await _flush_task
+        except asyncio.CancelledError:
+            pass
+        _flush_task = None
+
+    await flush_daily_activity_buffer()
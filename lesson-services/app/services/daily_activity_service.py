@@ -1,112 +1,180 @@
+import calendar
 from datetime import date, timedelta
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, column, func, select, table, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.progress_models import DailyActivity
+from app.services.daily_activity_buffer import daily_activity_buffer
+
+class ActivityRow(NamedTuple):
+    """Same shape as an ACTIVITY_COLUMNS row; used for days without activity."""
+    user_id: UUID
+    activity_dt: date
+    lessons_completed: int = 0
+    quizzes_completed: int = 0
+    minutes: int = 0
+    points: int = 0
+
+
+daily_activity = DailyActivity.__table__
+
+# Core table columns rather than ORM attributes: read paths only need plain rows,
+# and Core-only statements skip the ORM compile and loading layers entirely
+ACTIVITY_COLUMNS = tuple(daily_activity.c[name] for name in ActivityRow._fields)
+
+_SUMMARY_FIELDS = ("lessons_completed", "quizzes_completed", "minutes", "points")
+
+_ONE_DAY = timedelta(days=1)
+_WEEK_OFFSETS = tuple(timedelta(days=i) for i in range(7))
+_LAST_7_SPAN = timedelta(days=6)
+_LAST_30_SPAN = timedelta(days=29)
+
+# Rows fetched per round trip when a range is streamed from a server-side cursor
+STREAM_CHUNK_ROWS = 500
+
+mv_user_activity_summary = table(
+    "mv_user_activity_summary",
+    column("user_id"),
+    column("active_days"),
+    column("most_active_dt"),
+    *(column(f"lifetime_{field}") for field in _SUMMARY_FIELDS),
+    *(column(f"most_active_{field}") for field in _SUMMARY_FIELDS),
+)
+
+_ACTIVITY_BY_DATE = select(DailyActivity).where(
+    DailyActivity.user_id == bindparam("user_id"),
+    DailyActivity.activity_dt == bindparam("activity_dt"),
+)
+
+_ACTIVITY_ROW_BY_DATE = select(*ACTIVITY_COLUMNS).where(
+    daily_activity.c.user_id == bindparam("user_id"),
+    daily_activity.c.activity_dt == bindparam("activity_dt"),
+)
+
+_IN_DATE_RANGE = (
+    daily_activity.c.user_id == bindparam("user_id"),
+    daily_activity.c.activity_dt.between(bindparam("date_from"), bindparam("date_to")),
+)
+
+_ACTIVITY_RANGE = (
+    select(*ACTIVITY_COLUMNS)
+    .where(*_IN_DATE_RANGE)
+    .order_by(daily_activity.c.activity_dt.asc())
+)
+
+# Month totals come back on every row as window sums, so one query returns both
+# the days and their aggregate
+_MONTH_ACTIVITY = (
+    select(
+        *ACTIVITY_COLUMNS,
+        *(func.sum(daily_activity.c[field]).over() for field in _SUMMARY_FIELDS),
+    )
+    .where(*_IN_DATE_RANGE)
+    .order_by(daily_activity.c.activity_dt.asc())
+)
+
+
+def _increment_statement(field: str):
+    stmt = pg_insert(daily_activity).values(
+        user_id=bindparam("user_id"),
+        activity_dt=bindparam("activity_dt"),
+        **{field: bindparam("amount")},
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[daily_activity.c.user_id, daily_activity.c.activity_dt],
+        set_={field: daily_activity.c[field] + stmt.excluded[field]},
+    ).returning(*ACTIVITY_COLUMNS)
+
+
+# One prebuilt UPSERT per counter; the mapping doubles as the field whitelist
+_INCREMENT_ACTIVITY = {field: _increment_statement(field) for field in _SUMMARY_FIELDS}
 
 
 class DailyActivityService:
-    VALID_FIELDS = {
-        "lessons_completed",
-        "quizzes_completed",
-        "minutes",
-        "points",
-    }
-
-    def __init__(self, db: Session):
-        self.db = db
+    VALID_FIELDS = frozenset(_INCREMENT_ACTIVITY)
 
-    def _get_or_create_activity(self, user_id: UUID, activity_dt: date) -> DailyActivity:
-        activity = (
-            self.db.query(DailyActivity)
-            .filter(
-                DailyActivity.user_id == user_id,
-                DailyActivity.activity_dt == activity_dt,
-            )
-            .one_or_none()
-        )
-
-        if activity is None:
-            activity = DailyActivity(user_id=user_id, activity_dt=activity_dt)
-            self.db.add(activity)
-            self.db.flush()
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        # Services are request-scoped, so one date lookup serves the whole request
+        self.today = date.today()
 
-        return activity
+    async def get_today_activity(self, user_id: UUID) -> Optional[DailyActivity]:
+        return await self.get_activity_by_date(user_id, self.today)
 
-    def get_today_activity(self, user_id: UUID) -> Optional[DailyActivity]:
-        return self.get_activity_by_date(user_id, date.today())
+    async def get_activity_by_date(self, user_id: UUID, activity_date: date) -> Optional[DailyActivity]:
+        result = await self.db.execute(
+            _ACTIVITY_BY_DATE, {"user_id": user_id, "activity_dt": activity_date}
+        )
+        return result.scalar_one_or_none()
 
-    def get_activity_by_date(self, user_id: UUID, activity_date: date) -> Optional[DailyActivity]:
-        return (
-            self.db.query(DailyActivity)
-            .filter(
-                DailyActivity.user_id == user_id,
-                DailyActivity.activity_dt == activity_date,
-            )
-            .one_or_none()
+    async def get_activity_range(
+        self, user_id: UUID, date_from: date, date_to: date
+    ) -> Sequence[ActivityRow]:
+        result = await self.db.execute(
+            _ACTIVITY_RANGE,
+            {"user_id": user_id, "date_from": date_from, "date_to": date_to},
         )
+        return result.all()
 
-    def get_activity_range(
+    async def stream_activity_range(
         self, user_id: UUID, date_from: date, date_to: date
-    ) -> List[DailyActivity]:
-        return (
-            self.db.query(DailyActivity)
-            .filter(
-                DailyActivity.user_id == user_id,
-                DailyActivity.activity_dt >= date_from,
-                DailyActivity.activity_dt <= date_to,
-            )
-            .order_by(DailyActivity.activity_dt.asc())
-            .all()
+    ) -> AsyncIterator[Sequence[ActivityRow]]:
+        """Yield a range in chunks from a server-side cursor instead of one list.
+
+        The session stays open until the response has been sent, so the cursor
+        outlives the route handler that starts it.
+        """
+        result = await self.db.stream(
+            _ACTIVITY_RANGE.execution_options(yield_per=STREAM_CHUNK_ROWS),
+            {"user_id": user_id, "date_from": date_from, "date_to": date_to},
         )
+        async for rows in result.partitions():
+            yield rows
 
-    def get_week_activity(self, user_id: UUID) -> List[DailyActivity]:
-        today = date.today()
-        start_of_week = today - timedelta(days=today.weekday())
-        end_of_week = start_of_week + timedelta(days=6)
-        activities = self.get_activity_range(user_id, start_of_week, end_of_week)
+    async def get_week_activity(self, user_id: UUID) -> List[ActivityRow]:
+        start_of_week = self.today - _WEEK_OFFSETS[self.today.weekday()]
+        end_of_week = start_of_week + _WEEK_OFFSETS[-1]
+        activities = await self.get_activity_range(user_id, start_of_week, end_of_week)
         activity_map = {activity.activity_dt: activity for activity in activities}
 
-        ordered: List[DailyActivity] = []
-        for i in range(7):
-            current_day = start_of_week + timedelta(days=i)
+        ordered: List[ActivityRow] = []
+        for offset in _WEEK_OFFSETS:
+            current_day = start_of_week + offset
             if current_day in activity_map:
                 ordered.append(activity_map[current_day])
             else:
-                ordered.append(
-                    DailyActivity(
-                        user_id=user_id,
-                        activity_dt=current_day,
-                        lessons_completed=0,
-                        quizzes_completed=0,
-                        minutes=0,
-                        points=0,
-                    )
-                )
+                ordered.append(ActivityRow(user_id, current_day))
 
         return ordered
 
-    def get_month_activity(self, user_id: UUID, year: int, month: int) -> Dict[str, object]:
+    async def get_month_activity(self, user_id: UUID, year: int, month: int) -> Dict[str, object]:
         start_of_month = date(year, month, 1)
-        if month == 12:
-            end_of_month = date(year + 1, 1, 1) - timedelta(days=1)
-        else:
-            end_of_month = date(year, month + 1, 1) - timedelta(days=1)
+        end_of_month = start_of_month.replace(day=calendar.monthrange(year, month)[1])
+
+        width = len(ACTIVITY_COLUMNS)
+        result = await self.db.execute(
+            _MONTH_ACTIVITY,
+            {"user_id": user_id, "date_from": start_of_month, "date_to": end_of_month},
+        )
+        rows = result.all()
 
-        activities = self.get_activity_range(user_id, start_of_month, end_of_month)
-        totals = self._aggregate_totals(activities)
+        totals = dict.fromkeys(_SUMMARY_FIELDS, 0)
+        if rows:
+            totals = dict(zip(_SUMMARY_FIELDS, (int(value) for value in rows[0][width:])))
 
-        day_map = {activity.activity_dt: activity for activity in activities}
-        days: List[DailyActivity] = []
+        day_map = {row.activity_dt: ActivityRow(*row[:width]) for row in rows}
+        days: List[ActivityRow] = []
         current_day = start_of_month
         while current_day <= end_of_month:
             activity = day_map.get(current_day)
             if activity is None:
-                activity = DailyActivity(user_id=user_id, activity_dt=current_day)
+                activity = ActivityRow(user_id, current_day)
             days.append(activity)
-            current_day += timedelta(days=1)
+            current_day += _ONE_DAY
 
         return {
             "year": year,
@@ -115,36 +183,79 @@ class DailyActivityService:
             "days": days,
         }
 
-    def get_activity_summary(self, user_id: UUID) -> Dict[str, object]:
-        activities = (
-            self.db.query(DailyActivity)
-            .filter(DailyActivity.user_id == user_id)
-            .order_by(DailyActivity.activity_dt.asc())
-            .all()
+    async def _live_lifetime_summary(
+        self, user_id: UUID
+    ) -> Tuple[Dict[str, int], int, Optional[ActivityRow]]:
+        """Lifetime figures aggregated live, for users not in the materialized view yet."""
+        result = await self.db.execute(
+            select(*ACTIVITY_COLUMNS).where(daily_activity.c.user_id == user_id)
         )
+        activities = result.all()
+        most_active = None
+        if activities:
+            most_active = max(activities, key=lambda a: (a.points, a.activity_dt))
+        return self._aggregate_totals(activities), len(activities), most_active
+
+    def _summary_statement(self, user_id: UUID, last_7_start: date, last_30_start: date):
+        """7/30-day FILTER totals LEFT JOINed to the user's mv_user_activity_summary row.
+
+        The aggregate always yields one row, so the view columns come back NULL for
+        users the view (refreshed periodically) does not cover yet.
+        """
+        in_last_7 = daily_activity.c.activity_dt >= last_7_start
+        window = (
+            select(
+                *(
+                    func.coalesce(func.sum(daily_activity.c[field]).filter(in_last_7), 0)
+                    .label(f"last_7_{field}")
+                    for field in _SUMMARY_FIELDS
+                ),
+                *(
+                    func.coalesce(func.sum(daily_activity.c[field]), 0).label(f"last_30_{field}")
+                    for field in _SUMMARY_FIELDS
+                ),
+            )
+            .where(
+                daily_activity.c.user_id == user_id,
+                daily_activity.c.activity_dt >= last_30_start,
+            )
+            .subquery("window_totals")
+        )
+        lifetime = (
+            select(mv_user_activity_summary)
+            .where(mv_user_activity_summary.c.user_id == user_id)
+            .subquery("lifetime")
+        )
+        return select(window, lifetime).select_from(window.outerjoin(lifetime, true()))
 
-        lifetime_totals = self._aggregate_totals(activities)
-
-        today = date.today()
-        last_7_start = today - timedelta(days=6)
-        last_30_start = today - timedelta(days=29)
-
-        last_7 = [a for a in activities if a.activity_dt >= last_7_start]
-        last_30 = [a for a in activities if a.activity_dt >= last_30_start]
+    async def get_activity_summary(self, user_id: UUID) -> Dict[str, object]:
+        last_7_start = self.today - _LAST_7_SPAN
+        last_30_start = self.today - _LAST_30_SPAN
 
-        last_7_totals = self._aggregate_totals(last_7)
-        last_30_totals = self._aggregate_totals(last_30)
+        # One round trip on the request's session for both the view row and the windows
+        result = await self.db.execute(
+            self._summary_statement(user_id, last_7_start, last_30_start)
+        )
+        row = result.mappings().one()
+        last_7_totals = {field: int(row[f"last_7_{field}"]) for field in _SUMMARY_FIELDS}
+        last_30_totals = {field: int(row[f"last_30_{field}"]) for field in _SUMMARY_FIELDS}
+
+        if row["user_id"] is not None:
+            lifetime_totals = {field: row[f"lifetime_{field}"] for field in _SUMMARY_FIELDS}
+            active_days = row["active_days"]
+            most_active = ActivityRow(
+                user_id,
+                row["most_active_dt"],
+                *(row[f"most_active_{field}"] for field in _SUMMARY_FIELDS),
+            )
+        else:
+            lifetime_totals, active_days, most_active = await self._live_lifetime_summary(user_id)
 
-        active_days = len(activities)
         average_totals = {
             key: (round(value / active_days) if active_days else 0)
             for key, value in lifetime_totals.items()
         }
 
-        most_active = None
-        if activities:
-            most_active = max(activities, key=lambda a: (a.points, a.activity_dt))
-
         return {
             "lifetime": lifetime_totals,
             "last_7_days": last_7_totals,
@@ -154,22 +265,43 @@ class DailyActivityService:
             "most_active_day": most_active,
         }
 
-    def increment_activity(
+    async def increment_activity(
         self, user_id: UUID, activity_date: date, field: str, amount: int
-    ) -> DailyActivity:
-        field = field.lower()
-        if field not in self.VALID_FIELDS:
+    ) -> ActivityRow:
+        stmt = _INCREMENT_ACTIVITY.get(field)
+        if stmt is None:
             raise ValueError(f"Invalid activity field: {field}")
 
-        activity = self._get_or_create_activity(user_id, activity_date)
-        current_value = getattr(activity, field, 0)
-        setattr(activity, field, current_value + amount)
+        # Single atomic UPSERT: no read-modify-write race and one round-trip
+        result = await self.db.execute(
+            stmt, {"user_id": user_id, "activity_dt": activity_date, "amount": amount}
+        )
+        row = ActivityRow(*result.one())
+        await self.db.commit()
+        return row
+
+    async def buffer_increment(
+        self, user_id: UUID, activity_date: date, field: str, amount: int
+    ) -> ActivityRow:
+        """Queue an increment for the next batched flush and return the projected row.
+
+        The projection is the stored row plus whatever is still buffered for that
+        day; a flush landing between the two reads can skew it, so callers that
+        need the authoritative row use increment_activity instead.
+        """
+        daily_activity_buffer.add(user_id, activity_date, field, amount)
 
-        self.db.commit()
-        self.db.refresh(activity)
-        return activity
+        result = await self.db.execute(
+            _ACTIVITY_ROW_BY_DATE, {"user_id": user_id, "activity_dt": activity_date}
+        )
+        stored = result.one_or_none()
+        row = ActivityRow(*stored) if stored else ActivityRow(user_id, activity_date)
+        pending = daily_activity_buffer.pending(user_id, activity_date)
+        return row._replace(
+            **{field: getattr(row, field) + pending[field] for field in _SUMMARY_FIELDS}
+        )
 
-    def _aggregate_totals(self, activities: List[DailyActivity]) -> Dict[str, int]:
+    def _aggregate_totals(self, activities: Sequence[ActivityRow]) -> Dict[str, int]:
         totals = {
             "lessons_completed": 0,
             "quizzes_completed": 0,
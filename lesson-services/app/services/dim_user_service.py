@@ -1,37 +1,41 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, exists, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.bulk import COPY_THRESHOLD, copy_records
 from app.models.progress_models import DimUser
 from app.schemas.dim_user_schema import DimUserCreate, DimUserUpdate
 
 
+async def get_user_by_id(db: AsyncSession, user_id: UUID) -> Optional[DimUser]:
+    """Plain function so the hot GET /me route needs no service wrapper."""
+    return await db.get(DimUser, user_id)
+
+
 class DimUserService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def get_user_by_id(self, user_id: UUID) -> Optional[DimUser]:
-        return (
-            self.db.query(DimUser)
-            .filter(DimUser.user_id == user_id)
-            .one_or_none()
-        )
+    async def get_user_by_id(self, user_id: UUID) -> Optional[DimUser]:
+        return await get_user_by_id(self.db, user_id)
 
-    def create_user(self, user_data: DimUserCreate) -> DimUser:
+    async def create_user(self, user_data: DimUserCreate) -> DimUser:
         user_dict = user_data.model_dump()
         if user_dict.get("locale") is None:
             user_dict["locale"] = "en"
 
         new_user = DimUser(**user_dict)
         self.db.add(new_user)
-        self.db.commit()
-        self.db.refresh(new_user)
+        await self.db.commit()
+        await self.db.refresh(new_user)
         return new_user
 
-    def update_user(self, user_id: UUID, user_data: DimUserUpdate) -> Optional[DimUser]:
-        user = self.get_user_by_id(user_id)
+    async def update_user(self, user_id: UUID, user_data: DimUserUpdate) -> Optional[DimUser]:
+        user = await self.get_user_by_id(user_id)
         if not user:
             return None
 
@@ -40,21 +44,76 @@ class DimUserService:
             setattr(user, field, value)
 
         user.updated_at = datetime.now(timezone.utc)
-        self.db.commit()
-        self.db.refresh(user)
+        await self.db.commit()
+        await self.db.refresh(user)
         return user
 
-    def update_locale(self, user_id: UUID, locale: str) -> Optional[DimUser]:
-        return self.update_user(user_id, DimUserUpdate(locale=locale))
+    async def update_locale(self, user_id: UUID, locale: str) -> Optional[DimUser]:
+        return await self.update_user(user_id, DimUserUpdate(locale=locale))
 
-    def delete_user(self, user_id: UUID) -> bool:
-        user = self.get_user_by_id(user_id)
-        if not user:
-            return False
+    async def delete_user(self, user_id: UUID) -> bool:
+        result = await self.db.execute(delete(DimUser).where(DimUser.user_id == user_id))
+        await self.db.commit()
+        return result.rowcount > 0
+
+    async def user_exists(self, user_id: UUID) -> bool:
+        return bool(
+            await self.db.scalar(select(exists().where(DimUser.user_id == user_id)))
+        )
+
+    async def bulk_upsert_users(self, users: List[DimUserCreate]) -> int:
+        """Insert or refresh many users, e.g. when seeding from the auth service.
+
+        Large batches are COPYed into a temp table and merged with a single
+        INSERT ... SELECT ... ON CONFLICT; small ones use one multi-row upsert.
+        """
+        # Last write wins for duplicate ids within a batch
+        rows = {
+            user.user_id: (user.user_id, user.locale or "en", user.level_hint)
+            for user in users
+        }
+        if not rows:
+            return 0
 
-        self.db.delete(user)
-        self.db.commit()
-        return True
+        if len(rows) >= COPY_THRESHOLD:
+            await self.db.execute(
+                text(
+                    "CREATE TEMP TABLE dim_users_stage "
+                    "(LIKE dim_users INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+            )
+            await copy_records(
+                self.db,
+                "dim_users_stage",
+                ("user_id", "locale", "level_hint"),
+                rows.values(),
+            )
+            await self.db.execute(
+                text(
+                    "INSERT INTO dim_users (user_id, locale, level_hint) "
+                    "SELECT user_id, locale, level_hint FROM dim_users_stage "
+                    "ON CONFLICT (user_id) DO UPDATE SET "
+                    "locale = EXCLUDED.locale, "
+                    "level_hint = EXCLUDED.level_hint, "
+                    "updated_at = now()"
+                )
+            )
+        else:
+            stmt = pg_insert(DimUser).values(
+                [
+                    {"user_id": user_id, "locale": locale, "level_hint": level_hint}
+                    for user_id, locale, level_hint in rows.values()
+                ]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[DimUser.user_id],
+                set_={
+                    "locale": stmt.excluded.locale,
+                    "level_hint": stmt.excluded.level_hint,
+                    "updated_at": datetime.now(timezone.utc),
+                },
+            )
+            await self.db.execute(stmt)
 
-    def user_exists(self, user_id: UUID) -> bool:
-        return self.db.query(DimUser).filter(DimUser.user_id == user_id).count() > 0
+        await self.db.commit()
+        return len(rows)
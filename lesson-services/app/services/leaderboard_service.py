@@ -1,11 +1,25 @@
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    Select,
+    column,
+    delete,
+    desc,
+    exists,
+    func,
+    literal,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.progress_models import LeaderboardSnapshot, UserPoints
+from app.database.bulk import COPY_THRESHOLD, copy_records
+from app.models.progress_models import LeaderboardSnapshot, UserPoints, UserPointsLog
 from app.schemas.leaderboard_schema import (
     LeaderboardEntry,
     LeaderboardPeriod,
@@ -13,9 +27,24 @@ from app.schemas.leaderboard_schema import (
     LeaderboardSnapshotCreate,
 )
 
+leaderboard_snapshots = LeaderboardSnapshot.__table__
+
+# Entry columns as plain Core rows; responses are assembled without ORM hydration
+_ENTRY_COLUMNS = (
+    leaderboard_snapshots.c.rank,
+    leaderboard_snapshots.c.user_id,
+    leaderboard_snapshots.c.points,
+    leaderboard_snapshots.c.taken_at,
+)
+
+# Temp table large snapshot payloads are COPYed into before the merge
+_snapshot_stage = table(
+    "leaderboard_snapshots_stage", column("rank"), column("user_id"), column("points")
+)
+
 
 class LeaderboardService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     # ------------------------------------------------------------------
@@ -28,29 +57,113 @@ class LeaderboardService:
     def _calculate_month_key(self, value: date) -> str:
         return value.strftime("%Y-%m")
 
+    def _current_period_key(self, period: LeaderboardPeriod, value: date) -> str:
+        if period == LeaderboardPeriod.WEEKLY:
+            return self._calculate_week_key(value)
+        return self._calculate_month_key(value)
+
+    def current_period_key(self, period: LeaderboardPeriod) -> str:
+        return self._current_period_key(period, datetime.utcnow().date())
+
+    async def _lock_period(self, period: LeaderboardPeriod, period_key: str) -> None:
+        """Take a transaction-scoped advisory lock for one period's snapshot."""
+        await self.db.execute(
+            select(
+                func.pg_advisory_xact_lock(func.hashtext(period.value), func.hashtext(period_key))
+            )
+        )
+
+    def _ranked_points(self, period: LeaderboardPeriod, limit: int) -> Select:
+        order_column = (
+            UserPoints.weekly
+            if period == LeaderboardPeriod.WEEKLY
+            else UserPoints.monthly
+        )
+        ordering = (order_column.desc(), UserPoints.updated_at.asc())
+        return (
+            select(
+                func.row_number().over(order_by=ordering).label("rank"),
+                UserPoints.user_id,
+                order_column.label("points"),
+            )
+            .order_by(*ordering)
+            .limit(limit)
+        )
+
+    async def _upsert_ranked_snapshot(self, period: LeaderboardPeriod, limit: int) -> int:
+        """Bring the current period's snapshot in line with user_points.
+
+        Only rows whose rank or points changed are rewritten, and users that fell
+        out of the top ``limit`` are removed, so an unchanged leaderboard costs no
+        writes.
+        """
+        period_key = self._current_period_key(period, datetime.utcnow().date())
+        # Serialized with create_snapshot, whose upsert would otherwise interleave with the
+        # DELETE below. Blocking rather than skipping: refresh has already drained the change log
+        await self._lock_period(period, period_key)
+        ranked = self._ranked_points(period, limit).subquery("ranked")
+
+        stmt = pg_insert(LeaderboardSnapshot).from_select(
+            ["period", "period_key", "rank", "user_id", "points", "taken_at"],
+            select(
+                # Typed so asyncpg binds the enum rather than varchar
+                literal(period.value, LeaderboardSnapshot.period.type),
+                literal(period_key),
+                ranked.c.rank,
+                ranked.c.user_id,
+                ranked.c.points,
+                func.now(),
+            ),
+        )
+        stmt = stmt.on_conflict_do_update(
+            constraint="leaderboard_period_user_key",
+            set_={
+                "rank": stmt.excluded.rank,
+                "points": stmt.excluded.points,
+                "taken_at": stmt.excluded.taken_at,
+            },
+            where=tuple_(LeaderboardSnapshot.rank, LeaderboardSnapshot.points).is_distinct_from(
+                tuple_(stmt.excluded.rank, stmt.excluded.points)
+            ),
+        )
+        written = (await self.db.execute(stmt)).rowcount or 0
+
+        removed = (await self.db.execute(
+            delete(LeaderboardSnapshot).where(
+                LeaderboardSnapshot.period == period.value,
+                LeaderboardSnapshot.period_key == period_key,
+                LeaderboardSnapshot.user_id.not_in(
+                    select(ranked.c.user_id)
+                ),
+            )
+        )).rowcount or 0
+
+        return written + removed
+
     def _build_response(
         self,
         period: LeaderboardPeriod,
         period_key: str,
-        rows: List[LeaderboardSnapshot],
+        rows: Sequence,
     ) -> Optional[LeaderboardResponse]:
         if not rows:
             return None
 
+        # Rows come straight from the database, so skip re-validation
         entries = [
-            LeaderboardEntry(rank=row.rank, user_id=row.user_id, points=row.points)
-            for row in rows
+            LeaderboardEntry.model_construct(rank=rank, user_id=user_id, points=points)
+            for rank, user_id, points, _ in rows
         ]
-        taken_at = max(row.taken_at for row in rows)
+        taken_at = max(taken_at for *_, taken_at in rows)
 
-        return LeaderboardResponse(
+        return LeaderboardResponse.model_construct(
             period=period,
             period_key=period_key,
             entries=entries,
             taken_at=taken_at,
         )
 
-    def _get_leaderboard(
+    async def _get_leaderboard(
         self,
         period: LeaderboardPeriod,
         period_key: str,
@@ -58,12 +171,12 @@ class LeaderboardService:
         offset: int = 0,
     ) -> Optional[LeaderboardResponse]:
         query = (
-            self.db.query(LeaderboardSnapshot)
-            .filter(
-                LeaderboardSnapshot.period == period.value,
-                LeaderboardSnapshot.period_key == period_key,
+            select(*_ENTRY_COLUMNS)
+            .where(
+                leaderboard_snapshots.c.period == period.value,
+                leaderboard_snapshots.c.period_key == period_key,
             )
-            .order_by(LeaderboardSnapshot.rank.asc())
+            .order_by(leaderboard_snapshots.c.rank.asc())
         )
 
         if offset:
@@ -71,109 +184,170 @@ class LeaderboardService:
         if limit:
             query = query.limit(limit)
 
-        rows = query.all()
+        rows = (await self.db.execute(query)).all()
         return self._build_response(period, period_key, rows)
 
-    def _get_period_history(
+    async def _get_period_history(
         self,
         period: LeaderboardPeriod,
         limit: int,
         offset: int,
+        before: Optional[str] = None,
     ) -> List[LeaderboardResponse]:
-        period_max = func.max(LeaderboardSnapshot.taken_at)
-        rows = (
-            self.db.query(
-                LeaderboardSnapshot.period_key,
-                period_max.label("taken_at"),
-            )
-            .filter(LeaderboardSnapshot.period == period.value)
-            .group_by(LeaderboardSnapshot.period_key)
-            .order_by(period_max.desc())
-            .offset(offset)
+        """Newest-first snapshots, one page of period keys at a time.
+
+        Period keys sort chronologically (YYYY-Www, YYYY-MM), so pages walk the
+        (period, period_key DESC, rank) index. ``before`` is a keyset cursor: the
+        last period_key of the previous page, which keeps deep pages as cheap as
+        the first one.
+        """
+        period_key = leaderboard_snapshots.c.period_key
+        keys_query = (
+            select(period_key)
+            .where(leaderboard_snapshots.c.period == period.value)
+            .group_by(period_key)
+            .order_by(period_key.desc())
             .limit(limit)
-            .all()
         )
+        if before is not None:
+            keys_query = keys_query.where(period_key < before)
+        if offset:
+            keys_query = keys_query.offset(offset)
 
-        responses: List[LeaderboardResponse] = []
-        for row in rows:
-            response = self._get_leaderboard(period, row.period_key)
-            if response:
-                responses.append(response)
-        return responses
+        keys = (await self.db.scalars(keys_query)).all()
+        if not keys:
+            return []
+
+        result = await self.db.execute(
+            select(period_key, *_ENTRY_COLUMNS)
+            .where(
+                leaderboard_snapshots.c.period == period.value,
+                period_key.in_(keys),
+            )
+            .order_by(period_key.desc(), leaderboard_snapshots.c.rank.asc())
+        )
+        rows_by_key: Dict[str, list] = {}
+        for key, *entry in result.all():
+            rows_by_key.setdefault(key, []).append(entry)
+
+        return [
+            self._build_response(period, key, rows)
+            for key, rows in rows_by_key.items()
+        ]
 
     # ------------------------------------------------------------------
     # Public API methods
     # ------------------------------------------------------------------
-    def get_current_weekly_leaderboard(
+    async def get_current_weekly_leaderboard(
         self,
         limit: int = 100,
         offset: int = 0,
     ) -> Optional[LeaderboardResponse]:
         current_key = self._calculate_week_key(datetime.utcnow().date())
-        return self._get_leaderboard(LeaderboardPeriod.WEEKLY, current_key, limit, offset)
+        return await self._get_leaderboard(LeaderboardPeriod.WEEKLY, current_key, limit, offset)
 
-    def get_current_monthly_leaderboard(
+    async def get_current_monthly_leaderboard(
         self,
         limit: int = 100,
         offset: int = 0,
     ) -> Optional[LeaderboardResponse]:
         current_key = self._calculate_month_key(datetime.utcnow().date())
-        return self._get_leaderboard(LeaderboardPeriod.MONTHLY, current_key, limit, offset)
+        return await self._get_leaderboard(LeaderboardPeriod.MONTHLY, current_key, limit, offset)
 
-    def get_weekly_history(
+    async def get_weekly_history(
         self,
         limit: int = 4,
         offset: int = 0,
+        before: Optional[str] = None,
     ) -> List[LeaderboardResponse]:
-        return self._get_period_history(LeaderboardPeriod.WEEKLY, limit, offset)
+        return await self._get_period_history(LeaderboardPeriod.WEEKLY, limit, offset, before)
 
-    def get_monthly_history(
+    async def get_monthly_history(
         self,
         limit: int = 6,
         offset: int = 0,
+        before: Optional[str] = None,
     ) -> List[LeaderboardResponse]:
-        return self._get_period_history(LeaderboardPeriod.MONTHLY, limit, offset)
+        return await self._get_period_history(LeaderboardPeriod.MONTHLY, limit, offset, before)
 
-    def create_snapshot(
+    async def create_snapshot(
         self,
         period: LeaderboardPeriod,
         payload: LeaderboardSnapshotCreate,
     ) -> int:
+        """Upsert a snapshot supplied by the caller.
+
+        Large payloads are COPYed into a temp table and merged with a single
+        INSERT ... SELECT ... ON CONFLICT; small ones use one multi-row upsert.
+        Concurrent writers of the same period wait for each other's commit.
+        """
         taken_at = payload.taken_at or datetime.utcnow()
-        entries = [
-            LeaderboardSnapshot(
-                period=period.value,
-                period_key=payload.period_key,
-                rank=entry.rank,
-                user_id=entry.user_id,
-                points=entry.points,
-                taken_at=taken_at,
-            )
+        # Last write wins for duplicate users within a payload
+        rows = {
+            entry.user_id: (entry.rank, entry.user_id, entry.points)
             for entry in payload.entries
-        ]
-
-        if not entries:
+        }
+        if not rows:
             return 0
 
-        self.db.add_all(entries)
-        self.db.commit()
-        return len(entries)
+        await self._lock_period(period, payload.period_key)
+
+        columns = ["period", "period_key", "rank", "user_id", "points", "taken_at"]
+        if len(rows) >= COPY_THRESHOLD:
+            await self.db.execute(
+                text(
+                    "CREATE TEMP TABLE leaderboard_snapshots_stage "
+                    "(rank integer, user_id uuid, points integer) ON COMMIT DROP"
+                )
+            )
+            await copy_records(
+                self.db, "leaderboard_snapshots_stage", ("rank", "user_id", "points"), rows.values()
+            )
+            stmt = pg_insert(LeaderboardSnapshot).from_select(
+                columns,
+                select(
+                    literal(period.value, LeaderboardSnapshot.period.type),
+                    literal(payload.period_key),
+                    _snapshot_stage.c.rank,
+                    _snapshot_stage.c.user_id,
+                    _snapshot_stage.c.points,
+                    literal(taken_at, LeaderboardSnapshot.taken_at.type),
+                ),
+            )
+        else:
+            stmt = pg_insert(LeaderboardSnapshot).values(
+                [
+                    dict(zip(columns, (period.value, payload.period_key, *row, taken_at)))
+                    for row in rows.values()
+                ]
+            )
+        stmt = stmt.on_conflict_do_update(
+            constraint="leaderboard_period_user_key",
+            set_={
+                "rank": stmt.excluded.rank,
+                "points": stmt.excluded.points,
+                "taken_at": stmt.excluded.taken_at,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+        return len(rows)
 
-    def get_user_leaderboard_history(
+    async def get_user_leaderboard_history(
         self, user_id: UUID
     ) -> Dict[str, List[LeaderboardResponse]]:
         period_max = func.max(LeaderboardSnapshot.taken_at)
-        rows = (
-            self.db.query(
+        result = await self.db.execute(
+            select(
                 LeaderboardSnapshot.period,
                 LeaderboardSnapshot.period_key,
                 period_max.label("taken_at"),
             )
-            .filter(LeaderboardSnapshot.user_id == user_id)
+            .where(LeaderboardSnapshot.user_id == user_id)
             .group_by(LeaderboardSnapshot.period, LeaderboardSnapshot.period_key)
             .order_by(period_max.desc())
-            .all()
         )
+        rows = result.all()
 
         history_map = {
             LeaderboardPeriod.WEEKLY.value: [],
@@ -182,7 +356,7 @@ class LeaderboardService:
 
         for row in rows:
             period_enum = LeaderboardPeriod(row.period)
-            response = self._get_leaderboard(period_enum, row.period_key)
+            response = await self._get_leaderboard(period_enum, row.period_key)
             if response:
                 history_map[row.period].append(response)
 
@@ -191,53 +365,57 @@ class LeaderboardService:
             "monthly": history_map[LeaderboardPeriod.MONTHLY.value],
         }
 
-    def get_leaderboard_by_week(
+    async def get_leaderboard_by_week(
         self, week_key: str, limit: Optional[int] = None, offset: int = 0
     ) -> Optional[LeaderboardResponse]:
-        return self._get_leaderboard(
+        return await self._get_leaderboard(
             LeaderboardPeriod.WEEKLY, week_key, limit=limit, offset=offset
         )
 
-    def get_leaderboard_by_month(
+    async def get_leaderboard_by_month(
         self, month_key: str, limit: Optional[int] = None, offset: int = 0
     ) -> Optional[LeaderboardResponse]:
-        return self._get_leaderboard(
+        return await self._get_leaderboard(
             LeaderboardPeriod.MONTHLY, month_key, limit=limit, offset=offset
         )
 
-    def get_user_current_ranks(self, user_id: UUID) -> Dict[str, Optional[int]]:
+    async def get_user_current_ranks(self, user_id: UUID) -> Dict[str, Optional[int]]:
         today = datetime.utcnow().date()
         week_key = self._calculate_week_key(today)
         month_key = self._calculate_month_key(today)
 
         weekly = (
-            self.db.query(LeaderboardSnapshot)
-            .filter(
-                LeaderboardSnapshot.period == LeaderboardPeriod.WEEKLY.value,
-                LeaderboardSnapshot.period_key == week_key,
-                LeaderboardSnapshot.user_id == user_id,
+            await self.db.scalars(
+                select(LeaderboardSnapshot)
+                .where(
+                    LeaderboardSnapshot.period == LeaderboardPeriod.WEEKLY.value,
+                    LeaderboardSnapshot.period_key == week_key,
+                    LeaderboardSnapshot.user_id == user_id,
+                )
+                .order_by(desc(LeaderboardSnapshot.taken_at))
+                .limit(1)
             )
-            .order_by(desc(LeaderboardSnapshot.taken_at))
-            .first()
-        )
+        ).first()
 
         monthly = (
-            self.db.query(LeaderboardSnapshot)
-            .filter(
-                LeaderboardSnapshot.period == LeaderboardPeriod.MONTHLY.value,
-                LeaderboardSnapshot.period_key == month_key,
-                LeaderboardSnapshot.user_id == user_id,
+            await self.db.scalars(
+                select(LeaderboardSnapshot)
+                .where(
+                    LeaderboardSnapshot.period == LeaderboardPeriod.MONTHLY.value,
+                    LeaderboardSnapshot.period_key == month_key,
+                    LeaderboardSnapshot.user_id == user_id,
+                )
+                .order_by(desc(LeaderboardSnapshot.taken_at))
+                .limit(1)
             )
-            .order_by(desc(LeaderboardSnapshot.taken_at))
-            .first()
-        )
+        ).first()
 
         return {
             "weekly_rank": weekly.rank if weekly else None,
             "monthly_rank": monthly.rank if monthly else None,
         }
 
-    def cleanup_old_snapshots(
+    async def cleanup_old_snapshots(
         self, keep_weeks: int = 52, keep_months: int = 24
     ) -> int:
         if keep_weeks < 0 or keep_months < 0:
@@ -247,69 +425,66 @@ class LeaderboardService:
         cutoff_month = datetime.utcnow() - timedelta(days=keep_months * 30)
 
         weekly_deleted = (
-            self.db.query(LeaderboardSnapshot)
-            .filter(
-                LeaderboardSnapshot.period == LeaderboardPeriod.WEEKLY.value,
-                LeaderboardSnapshot.taken_at < cutoff_week,
+            await self.db.execute(
+                delete(LeaderboardSnapshot)
+                .where(
+                    LeaderboardSnapshot.period == LeaderboardPeriod.WEEKLY.value,
+                    LeaderboardSnapshot.taken_at < cutoff_week,
+                )
+                .execution_options(synchronize_session=False)
             )
-            .delete(synchronize_session=False)
-        )
+        ).rowcount
 
         monthly_deleted = (
-            self.db.query(LeaderboardSnapshot)
-            .filter(
-                LeaderboardSnapshot.period == LeaderboardPeriod.MONTHLY.value,
-                LeaderboardSnapshot.taken_at < cutoff_month,
+            await self.db.execute(
+                delete(LeaderboardSnapshot)
+                .where(
+                    LeaderboardSnapshot.period == LeaderboardPeriod.MONTHLY.value,
+                    LeaderboardSnapshot.taken_at < cutoff_month,
+                )
+                .execution_options(synchronize_session=False)
             )
-            .delete(synchronize_session=False)
-        )
+        ).rowcount
 
-        self.db.commit()
+        await self.db.commit()
         return (weekly_deleted or 0) + (monthly_deleted or 0)
 
-    def create_snapshot_from_points(
+    async def create_snapshot_from_points(
         self,
         period: LeaderboardPeriod,
         limit: int = 100,
     ) -> int:
-        """Generate leaderboard snapshot using the user_points table."""
+        """Sync the current period's snapshot from the user_points table."""
 
-        taken_at = datetime.utcnow()
-        period_key = (
-            self._calculate_week_key(taken_at.date())
-            if period == LeaderboardPeriod.WEEKLY
-            else self._calculate_month_key(taken_at.date())
-        )
+        written = await self._upsert_ranked_snapshot(period, limit)
+        await self.db.commit()
+        return written
 
-        order_column = (
-            UserPoints.weekly
-            if period == LeaderboardPeriod.WEEKLY
-            else UserPoints.monthly
-        )
+    async def refresh_leaderboards(self, limit: int = 100) -> Dict[str, int]:
+        """Incrementally refresh current leaderboards from the points change log.
 
-        points_rows = (
-            self.db.query(UserPoints.user_id, order_column.label("points"))
-            .order_by(order_column.desc())
-            .limit(limit)
-            .all()
-        )
+        The log is drained in the same transaction as the snapshot writes. When
+        nothing changed, a period is only written if it has no snapshot yet
+        (e.g. the first refresh of a new week or month).
+        """
 
-        if not points_rows:
-            return 0
+        changes = (await self.db.execute(delete(UserPointsLog))).rowcount or 0
+        today = datetime.utcnow().date()
 
-        snapshots = [
-            LeaderboardSnapshot(
-                period=period.value,
-                period_key=period_key,
-                rank=index + 1,
-                user_id=row.user_id,
-                points=row.points,
-                taken_at=taken_at,
+        results: Dict[str, int] = {}
+        for period in LeaderboardPeriod:
+            has_snapshot = await self.db.scalar(
+                select(
+                    exists().where(
+                        LeaderboardSnapshot.period == period.value,
+                        LeaderboardSnapshot.period_key == self._current_period_key(period, today),
+                    )
+                )
             )
-            for index, row in enumerate(points_rows)
-        ]
-
-        self.db.add_all(snapshots)
-        self.db.commit()
-        return len(snapshots)
+            if changes or not has_snapshot:
+                results[period.value] = await self._upsert_ranked_snapshot(period, limit)
+            else:
+                results[period.value] = 0
 
+        await self.db.commit()
+        return results
@@ -1,10 +1,19 @@
-from sqlalchemy.orm import Session
+import json
+
+from sqlalchemy import delete, func, insert, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+
+from app.database.bulk import COPY_THRESHOLD, copy_records
+from app.models.progress_models import Outbox
+from app.schemas.outbox_schema import OutboxCreate
 
-# from app.models.progress_models import Outbox
-# from app.schemas.outbox_schema import OutboxCreate
+# Rows removed per committed DELETE when cleaning up published messages
+CLEANUP_BATCH_SIZE = 10_000
+# Upper bound for one cleanup batch, so a bad plan fails fast instead of holding locks
+CLEANUP_STATEMENT_TIMEOUT = "30s"
 
 class OutboxService:
     """
@@ -20,16 +29,24 @@ class OutboxService:
     4. Old published messages are periodically cleaned up
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
-    # get_pending_messages(limit: int = 100) -> List[Outbox]
-    # Logic: Get unpublished messages for processing
-    # - Query outbox WHERE published_at IS NULL
-    # - Order by created_at ASC (FIFO - first in, first out)
-    # - Limit to batch size
-    # - Return list of pending messages
-    # - Called by background worker polling
+    async def get_pending_messages(self, limit: int = 100) -> List[Outbox]:
+        """Claim a batch of unpublished messages for the calling worker.
+
+        Identity ids are monotonic, so ordering by id keeps FIFO order and walks
+        the ``outbox_unpub_idx`` partial index. Rows locked by another worker are
+        skipped rather than waited on.
+        """
+        stmt = (
+            select(Outbox)
+            .where(Outbox.published_at.is_(None))
+            .order_by(Outbox.id.asc())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(await self.db.scalars(stmt))
     
     # get_message(outbox_id: int) -> Optional[Outbox]
     # Logic: Get specific outbox message by ID
@@ -49,6 +66,55 @@ class OutboxService:
     # - DO NOT commit here - let caller commit with domain transaction
     # - Return created outbox record
     
+    async def replay_messages(self, messages: List[Dict[str, Any]]) -> int:
+        """Re-enqueue a batch of messages (e.g. replayed progress events).
+
+        Batches of ``COPY_THRESHOLD`` rows or more are streamed with COPY,
+        smaller ones go through a single executemany INSERT.
+        """
+        if not messages:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "aggregate_id": message["aggregate_id"],
+                "topic": message["topic"],
+                "type": message["type"],
+                "payload": message["payload"],
+                "created_at": message.get("created_at") or now,
+            }
+            for message in messages
+        ]
+
+        if len(rows) >= COPY_THRESHOLD:
+            columns = ("aggregate_id", "topic", "type", "payload", "created_at")
+            # asyncpg's COPY sends jsonb as text, so payloads are serialized here
+            await copy_records(
+                self.db,
+                Outbox.__tablename__,
+                columns,
+                (
+                    (
+                        row["aggregate_id"],
+                        row["topic"],
+                        row["type"],
+                        json.dumps(row["payload"]),
+                        row["created_at"],
+                    )
+                    for row in rows
+                ),
+            )
+        else:
+            await self.db.execute(insert(Outbox), rows)
+
+        await self.db.commit()
+        return len(rows)
+
+    async def create_messages(self, messages: List[OutboxCreate]) -> int:
+        """Enqueue a batch of messages in one statement rather than one INSERT each."""
+        return await self.replay_messages([message.model_dump() for message in messages])
+
     # mark_as_published(outbox_id: int) -> Optional[Outbox]
     # Logic: Mark message as successfully published
     # - Find outbox record by id
@@ -57,30 +123,88 @@ class OutboxService:
     # - Return updated record
     # - Called by worker after successful publish to queue
     
-    # mark_batch_as_published(outbox_ids: List[int]) -> int
-    # Logic: Mark multiple messages as published (bulk operation)
-    # - Update outbox SET published_at = now() WHERE id IN outbox_ids
-    # - Commit transaction
-    # - Return count of updated records
-    # - More efficient for batch processing
-    
-    # cleanup_old_published(days_old: int = 7) -> int
-    # Logic: Delete old published messages to prevent table bloat
-    # - Calculate cutoff date (now - days_old)
-    # - Delete outbox WHERE published_at < cutoff AND published_at IS NOT NULL
-    # - Never delete unpublished messages
-    # - Commit transaction
-    # - Return count of deleted records
-    # - Run periodically (e.g., daily cron job)
-    
-    # get_outbox_stats() -> Dict[str, Any]
-    # Logic: Get statistics about outbox state
-    # - Count pending messages (published_at IS NULL)
-    # - Count published in last 24h
-    # - Count old unpublished (created_at > 1 hour ago, still NULL)
-    # - Calculate average publish time (published_at - created_at)
-    # - Group pending by topic
-    # - Return comprehensive statistics dict
+    async def mark_batch_as_published(self, outbox_ids: List[int]) -> int:
+        """Stamp ``published_at`` on every listed message with a single UPDATE.
+
+        Messages that are already published keep their original timestamp.
+        """
+        result = await self.db.execute(
+            update(Outbox)
+            .where(Outbox.id.in_(outbox_ids), Outbox.published_at.is_(None))
+            .values(published_at=func.now())
+        )
+        await self.db.commit()
+        return result.rowcount
+
+    async def cleanup_old_published(self, days_old: int = 7) -> int:
+        """Delete messages published more than ``days_old`` days ago; pending ones are kept.
+
+        Rows go in batches of ``CLEANUP_BATCH_SIZE``, each committed on its own, so
+        a large backlog never holds one long transaction and its locks. Each batch
+        is picked through ``outbox_published_at_idx`` and runs under
+        ``CLEANUP_STATEMENT_TIMEOUT``. Whole expired months are dropped by
+        partition maintenance instead.
+        """
+        cutoff = datetime.now(timezone.utc) - timedelta(days=days_old)
+        batch = (
+            select(Outbox.id)
+            .where(Outbox.published_at < cutoff)
+            .limit(CLEANUP_BATCH_SIZE)
+            .scalar_subquery()
+        )
+        stmt = delete(Outbox).where(Outbox.id.in_(batch))
+
+        deleted = 0
+        while True:
+            await self.db.execute(
+                text(f"SET LOCAL statement_timeout = '{CLEANUP_STATEMENT_TIMEOUT}'")
+            )
+            result = await self.db.execute(stmt)
+            await self.db.commit()
+            deleted += result.rowcount
+            if result.rowcount < CLEANUP_BATCH_SIZE:
+                return deleted
+
+    async def get_outbox_stats(self) -> Dict[str, Any]:
+        """Outbox health counters, computed as filtered aggregates in one scan."""
+        now = datetime.now(timezone.utc)
+        pending = Outbox.published_at.is_(None)
+        published_recently = Outbox.published_at >= now - timedelta(hours=24)
+        totals = (
+            await self.db.execute(
+                select(
+                    func.count().filter(pending).label("pending"),
+                    func.count().filter(published_recently).label("published_last_24h"),
+                    func.count()
+                    .filter(pending, Outbox.created_at < now - timedelta(hours=1))
+                    .label("stale_pending"),
+                    func.avg(
+                        func.extract("epoch", Outbox.published_at - Outbox.created_at)
+                    )
+                    .filter(published_recently)
+                    .label("avg_publish_seconds"),
+                )
+            )
+        ).one()
+
+        pending_by_topic = await self.db.execute(
+            select(Outbox.topic, func.count())
+            .where(pending)
+            .group_by(Outbox.topic)
+            .order_by(Outbox.topic.asc())
+        )
+
+        return {
+            "pending": totals.pending,
+            "published_last_24h": totals.published_last_24h,
+            "stale_pending": totals.stale_pending,
+            "avg_publish_seconds": (
+                float(totals.avg_publish_seconds)
+                if totals.avg_publish_seconds is not None
+                else None
+            ),
+            "pending_by_topic": dict(pending_by_topic.tuples().all()),
+        }
     
     # get_failed_messages(age_hours: int = 1) -> List[Outbox]
     # Logic: Identify messages that failed to publish
@@ -1,15 +1,36 @@
-from sqlalchemy import and_, desc, func
-from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+import json
+
+from sqlalchemy import Date, and_, bindparam, cast, delete, desc, func, insert, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
 from uuid import UUID
-from datetime import datetime, date, time, timedelta
+from datetime import datetime, date, time, timedelta, timezone
 
+from app.database.bulk import COPY_THRESHOLD, copy_records
 from app.models.progress_models import ProgressEvent
-from app.schemas import ProgressEventCreate
+from app.schemas import ProgressEventCreate, ProgressEventResponse
+
+progress_events = ProgressEvent.__table__
+
+# Rows fetched per round trip when a page is streamed from a server-side cursor
+STREAM_CHUNK_ROWS = 100
+
+# Exactly the columns ProgressEventResponse reads, so list pages skip ORM hydration
+_EVENT_COLUMNS = tuple(progress_events.c[name] for name in ProgressEventResponse.model_fields)
+
+# Fixed-shape reads built once at import; ids and paging are bound per call
+_GET_EVENT = select(ProgressEvent).where(ProgressEvent.id == bindparam("event_id"))
+_RECENT_EVENTS = (
+    select(*_EVENT_COLUMNS)
+    .where(progress_events.c.user_id == bindparam("user_id"))
+    .order_by(desc(progress_events.c.created_at))
+    .limit(bindparam("limit"))
+)
 
 
 class ProgressEventService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     def _apply_date_filters(
@@ -20,122 +41,183 @@ class ProgressEventService:
     ):
         if date_from:
             start_dt = datetime.combine(date_from, time.min)
-            query = query.filter(ProgressEvent.created_at >= start_dt)
+            query = query.where(ProgressEvent.created_at >= start_dt)
         if date_to:
             end_dt = datetime.combine(date_to, time.max)
-            query = query.filter(ProgressEvent.created_at <= end_dt)
+            query = query.where(ProgressEvent.created_at <= end_dt)
         return query
 
-    def get_user_events(
+    def _user_events_query(
         self,
         user_id: UUID,
-        event_type: Optional[str] = None,
-        limit: int = 100,
-        offset: int = 0,
-        date_from: Optional[date] = None,
-        date_to: Optional[date] = None,
-    ) -> List[ProgressEvent]:
-        query = self.db.query(ProgressEvent).filter(ProgressEvent.user_id == user_id)
+        event_type: Optional[str],
+        limit: int,
+        offset: int,
+        date_from: Optional[date],
+        date_to: Optional[date],
+    ):
+        query = select(*_EVENT_COLUMNS).where(progress_events.c.user_id == user_id)
 
         if event_type:
-            query = query.filter(ProgressEvent.type == event_type)
+            query = query.where(progress_events.c.type == event_type)
 
         query = self._apply_date_filters(query, date_from, date_to)
+        return query.order_by(desc(progress_events.c.created_at)).offset(offset).limit(limit)
 
-        return (
-            query.order_by(desc(ProgressEvent.created_at))
-            .offset(offset)
-            .limit(limit)
-            .all()
+    async def get_user_events(
+        self,
+        user_id: UUID,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> List[ProgressEventResponse]:
+        result = await self.db.execute(
+            self._user_events_query(user_id, event_type, limit, offset, date_from, date_to)
         )
+        return [ProgressEventResponse.model_validate(row) for row in result.mappings()]
 
-    def get_event(self, event_id: int) -> Optional[ProgressEvent]:
-        return (
-            self.db.query(ProgressEvent)
-            .filter(ProgressEvent.id == event_id)
-            .one_or_none()
+    async def stream_user_events(
+        self,
+        user_id: UUID,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Yield a page in chunks from a server-side cursor instead of one list.
+
+        The session stays open until the response has been sent, so the cursor
+        outlives the route handler that starts it.
+        """
+        query = self._user_events_query(user_id, event_type, limit, offset, date_from, date_to)
+        result = await self.db.stream(query.execution_options(yield_per=STREAM_CHUNK_ROWS))
+        async for rows in result.mappings().partitions():
+            yield rows
+
+    async def get_first_event_date(self, user_id: UUID) -> Optional[date]:
+        """Day of the user's earliest event, in the same timezone the date filters use."""
+        return await self.db.scalar(
+            select(cast(func.min(progress_events.c.created_at), Date)).where(
+                progress_events.c.user_id == user_id
+            )
         )
 
-    def create_event(self, event_data: ProgressEventCreate) -> ProgressEvent:
-        new_event = ProgressEvent(**event_data.model_dump())
-        self.db.add(new_event)
-        self.db.commit()
-        self.db.refresh(new_event)
-        return new_event
+    async def get_event(self, event_id: int) -> Optional[ProgressEvent]:
+        result = await self.db.execute(_GET_EVENT, {"event_id": event_id})
+        return result.scalar_one_or_none()
 
-    def get_events_by_type(
+    async def create_event(self, event_data: ProgressEventCreate) -> ProgressEventResponse:
+        # RETURNING brings back id and created_at, so no refresh SELECT follows the insert
+        result = await self.db.execute(
+            insert(progress_events).values(**event_data.model_dump()).returning(*_EVENT_COLUMNS)
+        )
+        event = ProgressEventResponse.model_validate(result.mappings().one())
+        await self.db.commit()
+        return event
+
+    async def get_events_by_type(
         self,
         user_id: UUID,
         event_type: str,
         limit: int = 50,
         offset: int = 0,
-    ) -> List[ProgressEvent]:
-        return self.get_user_events(
+    ) -> List[ProgressEventResponse]:
+        return await self.get_user_events(
             user_id=user_id,
             event_type=event_type,
             limit=limit,
             offset=offset,
         )
 
-    def get_recent_events(self, user_id: UUID, limit: int = 50) -> List[ProgressEvent]:
-        return (
-            self.db.query(ProgressEvent)
-            .filter(ProgressEvent.user_id == user_id)
-            .order_by(desc(ProgressEvent.created_at))
-            .limit(limit)
-            .all()
-        )
+    async def get_recent_events(self, user_id: UUID, limit: int = 50) -> List[ProgressEventResponse]:
+        result = await self.db.execute(_RECENT_EVENTS, {"user_id": user_id, "limit": limit})
+        return [ProgressEventResponse.model_validate(row) for row in result.mappings()]
 
-    def delete_event(self, event_id: int) -> bool:
-        event = self.get_event(event_id)
-        if not event:
-            return False
-
-        self.db.delete(event)
-        self.db.commit()
-        return True
+    async def delete_event(self, event_id: int) -> bool:
+        result = await self.db.execute(
+            delete(progress_events).where(progress_events.c.id == event_id)
+        )
+        await self.db.commit()
+        return result.rowcount > 0
 
-    def get_event_type_stats(
+    async def get_event_type_stats(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
     ) -> Dict[str, int]:
-        query = self.db.query(
-            ProgressEvent.type,
-            func.count(ProgressEvent.id).label("count"),
-        )
+        # count(*) needs no column from the heap, so (type, created_at) serves it index-only
+        query = select(progress_events.c.type, func.count())
 
         if date_from or date_to:
             query = self._apply_date_filters(query, date_from, date_to)
 
-        results = (
-            query.group_by(ProgressEvent.type)
-            .order_by(ProgressEvent.type.asc())
-            .all()
+        results = await self.db.execute(
+            query.group_by(progress_events.c.type).order_by(progress_events.c.type.asc())
         )
 
-        return {row.type: row.count for row in results}
+        return dict(results.tuples().all())
 
-    def get_user_event_timeline(
+    async def get_user_event_timeline(
         self,
         user_id: UUID,
         date_from: date,
         date_to: date,
     ) -> List[ProgressEvent]:
-        query = self.db.query(ProgressEvent).filter(ProgressEvent.user_id == user_id)
+        query = select(ProgressEvent).where(ProgressEvent.user_id == user_id)
         query = self._apply_date_filters(query, date_from, date_to)
-        return query.order_by(ProgressEvent.created_at.asc()).all()
-
-    def bulk_create_events(self, events: List[Dict[str, Any]]) -> List[ProgressEvent]:
-        new_events = [ProgressEvent(**event) for event in events]
-        self.db.add_all(new_events)
-        self.db.commit()
-        # Refresh objects individually to populate generated fields
-        for event in new_events:
-            self.db.refresh(event)
-        return new_events
-
-    def get_event_count_by_day(
+        result = await self.db.scalars(query.order_by(ProgressEvent.created_at.asc()))
+        return list(result)
+
+    async def bulk_create_events(self, events: List[Dict[str, Any]]) -> List[ProgressEvent]:
+        if not events:
+            return []
+        # One batched INSERT ... RETURNING populates generated fields without a refresh per row
+        new_events = await self.db.scalars(insert(ProgressEvent).returning(ProgressEvent), events)
+        await self.db.commit()
+        return list(new_events)
+
+    async def replay_events(self, events: List[Dict[str, Any]]) -> int:
+        """Append a batch of events without hydrating ORM objects.
+
+        Batches of ``COPY_THRESHOLD`` rows or more are streamed with COPY,
+        smaller ones go through a single executemany INSERT.
+        """
+        if not events:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": event["user_id"],
+                "type": event["type"],
+                "payload": event["payload"],
+                "created_at": event.get("created_at") or now,
+            }
+            for event in events
+        ]
+
+        if len(rows) >= COPY_THRESHOLD:
+            columns = ("user_id", "type", "payload", "created_at")
+            # asyncpg's COPY sends jsonb as text, so payloads are serialized here
+            await copy_records(
+                self.db,
+                ProgressEvent.__tablename__,
+                columns,
+                (
+                    (row["user_id"], row["type"], json.dumps(row["payload"]), row["created_at"])
+                    for row in rows
+                ),
+            )
+        else:
+            await self.db.execute(insert(ProgressEvent), rows)
+
+        await self.db.commit()
+        return len(rows)
+
+    async def get_event_count_by_day(
         self,
         user_id: UUID,
         days: int = 30,
@@ -143,11 +225,11 @@ class ProgressEventService:
         cutoff = datetime.utcnow() - timedelta(days=days)
         day_expr = func.date_trunc("day", ProgressEvent.created_at)
         query = (
-            self.db.query(
+            select(
                 day_expr.label("event_day"),
                 func.count(ProgressEvent.id).label("count"),
             )
-            .filter(
+            .where(
                 and_(
                     ProgressEvent.user_id == user_id,
                     ProgressEvent.created_at >= cutoff,
@@ -157,7 +239,8 @@ class ProgressEventService:
             .order_by(day_expr)
         )
 
-        return {row.event_day.date(): row.count for row in query.all()}
+        results = await self.db.execute(query)
+        return {row.event_day.date(): row.count for row in results}
 
     def publish_event_to_queue(self, event: ProgressEvent) -> bool:
         """Placeholder for publishing events to a message queue."""
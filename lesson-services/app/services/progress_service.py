@@ -298,29 +298,35 @@ class ProgressService:
             taken_at=entries[0].taken_at
         )
 
-    async def get_user_stats(self, user_id: UUID) -> dict:
-        # Get user points
+    def get_points(self, user_id: UUID) -> Optional[UserPointsResponse]:
         points = self.db.query(UserPoints).filter(UserPoints.user_id == user_id).first()
-        
-        # Get streak
+        return UserPointsResponse.from_orm(points) if points else None
+
+    def get_streak(self, user_id: UUID) -> Optional[UserStreakResponse]:
         streak = self.db.query(UserStreak).filter(UserStreak.user_id == user_id).first()
-        
-        # Get recent activity
+        return UserStreakResponse.from_orm(streak) if streak else None
+
+    def get_daily_activity(self, user_id: UUID, days: int = 7) -> List[DailyActivityResponse]:
         recent_activity = self.db.query(DailyActivity).filter(
             DailyActivity.user_id == user_id
-        ).order_by(desc(DailyActivity.activity_dt)).limit(7).all()
-        
-        # Get lesson progress
+        ).order_by(desc(DailyActivity.activity_dt)).limit(days).all()
+        return [DailyActivityResponse.from_orm(activity) for activity in recent_activity]
+
+    def get_lesson_stats(self, user_id: UUID) -> dict:
         lesson_stats = self.db.query(
             UserLesson.status,
             func.count(UserLesson.id).label('count')
         ).filter(UserLesson.user_id == user_id).group_by(UserLesson.status).all()
-        
+        return {status: count for status, count in lesson_stats}
+
+    async def get_user_stats(self, user_id: UUID) -> dict:
+        # Callers that need a single field use the narrow getters above; like every
+        # query here they block on the sync Session, so they are plain methods
         return {
-            "points": UserPointsResponse.from_orm(points) if points else None,
-            "streak": UserStreakResponse.from_orm(streak) if streak else None,
-            "recent_activity": [DailyActivityResponse.from_orm(activity) for activity in recent_activity],
-            "lesson_stats": {status: count for status, count in lesson_stats}
+            "points": self.get_points(user_id),
+            "streak": self.get_streak(user_id),
+            "recent_activity": self.get_daily_activity(user_id),
+            "lesson_stats": self.get_lesson_stats(user_id),
         }
 
     # Helper methods
@@ -2,91 +2,124 @@ from datetime import datetime
 from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, delete, exists, insert, select, update as sql_update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.progress_models import QuizAnswer, QuizAttempt
 from app.schemas import (
     QuizAnswerCreate,
+    QuizAnswerResponse,
+    QuizAnswerSubmission,
     QuizAnswerSummary,
     QuizAnswerUpdate,
 )
 
+quiz_answers = QuizAnswer.__table__
+
+# Exactly the columns QuizAnswerResponse reads, so list pages skip ORM hydration
+_ANSWER_COLUMNS = tuple(quiz_answers.c[name] for name in QuizAnswerResponse.model_fields)
+
+# Fixed-shape reads built once at import; ids are bound per call
+_GET_ATTEMPT = select(QuizAttempt).where(QuizAttempt.id == bindparam("attempt_id"))
+_GET_ANSWER = select(QuizAnswer).where(QuizAnswer.id == bindparam("answer_id"))
+# Answer writes need the attempt's submitted state too; one join instead of two reads
+_GET_ANSWER_FOR_WRITE = (
+    select(QuizAnswer, QuizAttempt.submitted_at)
+    .join(QuizAttempt, QuizAttempt.id == QuizAnswer.attempt_id)
+    .where(QuizAnswer.id == bindparam("answer_id"))
+)
+# Deletes only while the owning attempt is still open, in the same statement
+_DELETE_OPEN_ANSWER = delete(quiz_answers).where(
+    quiz_answers.c.id == bindparam("answer_id"),
+    exists().where(
+        QuizAttempt.id == quiz_answers.c.attempt_id,
+        QuizAttempt.submitted_at.is_(None),
+    ),
+)
+_ATTEMPT_ANSWERS = (
+    select(*_ANSWER_COLUMNS)
+    .where(quiz_answers.c.attempt_id == bindparam("attempt_id"))
+    .order_by(quiz_answers.c.answered_at.asc())
+)
+
 
 class QuizAnswerService:
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
-    def _get_attempt(self, attempt_id: UUID) -> Optional[QuizAttempt]:
-        return (
-            self.db.query(QuizAttempt)
-            .filter(QuizAttempt.id == attempt_id)
-            .one_or_none()
-        )
+    async def _get_attempt(self, attempt_id: UUID) -> Optional[QuizAttempt]:
+        result = await self.db.execute(_GET_ATTEMPT, {"attempt_id": attempt_id})
+        return result.scalar_one_or_none()
 
-    def _ensure_attempt_open(self, attempt_id: UUID) -> QuizAttempt:
-        attempt = self._get_attempt(attempt_id)
+    async def _ensure_attempt_open(self, attempt_id: UUID) -> QuizAttempt:
+        attempt = await self._get_attempt(attempt_id)
         if not attempt:
             raise ValueError("Quiz attempt not found")
         if attempt.submitted_at is not None:
             raise ValueError("Quiz attempt has already been submitted")
         return attempt
 
-    def get_attempt_answers(self, attempt_id: UUID) -> List[QuizAnswer]:
-        return (
-            self.db.query(QuizAnswer)
-            .filter(QuizAnswer.attempt_id == attempt_id)
-            .order_by(QuizAnswer.answered_at.asc())
-            .all()
-        )
+    async def _get_open_answer(self, answer_id: UUID) -> Optional[QuizAnswer]:
+        row = (
+            await self.db.execute(_GET_ANSWER_FOR_WRITE, {"answer_id": answer_id})
+        ).one_or_none()
+        if row is None:
+            return None
+        answer, submitted_at = row
+        if submitted_at is not None:
+            raise ValueError("Quiz attempt has already been submitted")
+        return answer
 
-    def create_answer(self, payload: QuizAnswerCreate) -> QuizAnswer:
-        self._ensure_attempt_open(payload.attempt_id)
+    async def get_attempt_answers(self, attempt_id: UUID) -> List[QuizAnswerResponse]:
+        result = await self.db.execute(_ATTEMPT_ANSWERS, {"attempt_id": attempt_id})
+        return [QuizAnswerResponse.model_validate(row) for row in result.mappings()]
 
-        answer = QuizAnswer(**payload.model_dump())
-        answer.answered_at = datetime.utcnow()
+    async def create_answer(self, payload: QuizAnswerCreate) -> QuizAnswerResponse:
+        await self._ensure_attempt_open(payload.attempt_id)
 
-        self.db.add(answer)
-        self.db.commit()
-        self.db.refresh(answer)
+        # RETURNING hands back the stored row, so no refresh SELECT follows the write
+        result = await self.db.execute(
+            insert(quiz_answers)
+            .values(**payload.model_dump(), answered_at=datetime.utcnow())
+            .returning(*_ANSWER_COLUMNS)
+        )
+        answer = QuizAnswerResponse.model_validate(result.mappings().one())
+        await self.db.commit()
         return answer
 
-    def get_answer(self, answer_id: UUID) -> Optional[QuizAnswer]:
-        return (
-            self.db.query(QuizAnswer)
-            .filter(QuizAnswer.id == answer_id)
-            .one_or_none()
-        )
+    async def get_answer(self, answer_id: UUID) -> Optional[QuizAnswer]:
+        result = await self.db.execute(_GET_ANSWER, {"answer_id": answer_id})
+        return result.scalar_one_or_none()
 
-    def update_answer(
+    async def update_answer(
         self, answer_id: UUID, update: QuizAnswerUpdate
-    ) -> Optional[QuizAnswer]:
-        answer = self.get_answer(answer_id)
+    ) -> Optional[QuizAnswerResponse]:
+        answer = await self._get_open_answer(answer_id)
         if not answer:
             return None
 
-        self._ensure_attempt_open(answer.attempt_id)
-
-        for field, value in update.model_dump(exclude_unset=True).items():
-            setattr(answer, field, value)
-
-        answer.answered_at = datetime.utcnow()
-        self.db.commit()
-        self.db.refresh(answer)
-        return answer
-
-    def delete_answer(self, answer_id: UUID) -> bool:
-        answer = self.get_answer(answer_id)
-        if not answer:
-            return False
-
-        self._ensure_attempt_open(answer.attempt_id)
-
-        self.db.delete(answer)
-        self.db.commit()
-        return True
-
-    def get_answer_summary(self, attempt_id: UUID) -> QuizAnswerSummary:
-        answers = self.get_attempt_answers(attempt_id)
+        result = await self.db.execute(
+            sql_update(quiz_answers)
+            .where(quiz_answers.c.id == answer_id)
+            .values(**update.model_dump(exclude_unset=True), answered_at=datetime.utcnow())
+            .returning(*_ANSWER_COLUMNS)
+        )
+        updated = QuizAnswerResponse.model_validate(result.mappings().one())
+        await self.db.commit()
+        return updated
+
+    async def delete_answer(self, answer_id: UUID) -> bool:
+        result = await self.db.execute(_DELETE_OPEN_ANSWER, {"answer_id": answer_id})
+        if result.rowcount > 0:
+            await self.db.commit()
+            return True
+
+        # Nothing deleted: tell a missing answer apart from one on a submitted attempt
+        await self._get_open_answer(answer_id)
+        return False
+
+    async def get_answer_summary(self, attempt_id: UUID) -> QuizAnswerSummary:
+        answers = await self.get_attempt_answers(attempt_id)
         total = len(answers)
         correct = len([a for a in answers if a.is_correct])
         points = sum(a.points_earned for a in answers)
@@ -121,24 +154,24 @@ class QuizAnswerService:
             points = 0
         return is_correct, points
 
-    def bulk_create_answers(
-        self, attempt_id: UUID, answers: List[QuizAnswerCreate]
-    ) -> List[QuizAnswer]:
-        self._ensure_attempt_open(attempt_id)
-
-        created_answers: List[QuizAnswer] = []
-        for answer_data in answers:
-            payload = answer_data.model_dump()
-            payload["attempt_id"] = attempt_id
-            answer = QuizAnswer(**payload)
-            answer.answered_at = datetime.utcnow()
-            self.db.add(answer)
-            created_answers.append(answer)
-
-        if created_answers:
-            self.db.commit()
-            for answer in created_answers:
-                self.db.refresh(answer)
-
-        return created_answers
-
+    async def bulk_create_answers(
+        self, attempt_id: UUID, answers: List[QuizAnswerSubmission]
+    ) -> List[QuizAnswerResponse]:
+        await self._ensure_attempt_open(attempt_id)
+        if not answers:
+            return []
+
+        answered_at = datetime.utcnow()
+        rows = [
+            {**answer_data.model_dump(), "attempt_id": attempt_id, "answered_at": answered_at}
+            for answer_data in answers
+        ]
+
+        # One multi-row INSERT ... RETURNING hands back the stored rows in submission order
+        result = await self.db.execute(
+            insert(quiz_answers).returning(*_ANSWER_COLUMNS, sort_by_parameter_order=True),
+            rows,
+        )
+        created = [QuizAnswerResponse.model_validate(row) for row in result.mappings()]
+        await self.db.commit()
+        return created
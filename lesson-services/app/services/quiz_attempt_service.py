@@ -1,13 +1,12 @@
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import desc, func
+from sqlalchemy import delete, desc, func, insert, or_, tuple_
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.progress_models import QuizAnswer, QuizAttempt
 from app.schemas import (
-    QuizAnswerCreate,
     QuizAnswerSubmission,
     QuizAttemptCreate,
     QuizAttemptSubmit,
@@ -56,11 +55,7 @@ class QuizAttemptService:
             return None
 
         if submission.answers:
-            for answer_data in submission.answers:
-                answer_payload = QuizAnswerCreate(
-                    attempt_id=attempt.id, **answer_data.model_dump()
-                )
-                self._upsert_answer(attempt, answer_payload)
+            self._save_answers(attempt, submission.answers)
 
         attempt.total_points = submission.total_points
         if submission.max_points is not None:
@@ -82,35 +77,36 @@ class QuizAttemptService:
             attempt.passed = max_points == 0 or submission.total_points >= max_points
 
         self.db.commit()
-        self.db.refresh(attempt)
-        return attempt
-
-    def _upsert_answer(
-        self, attempt: QuizAttempt, answer_data: QuizAnswerCreate
-    ) -> QuizAnswer:
-        existing = (
-            self.db.query(QuizAnswer)
-            .filter(
-                QuizAnswer.attempt_id == attempt.id,
-                QuizAnswer.question_id == answer_data.question_id,
-            )
-            .one_or_none()
-        )
-
-        payload = answer_data.model_dump()
-        payload["attempt_id"] = attempt.id
-
-        if existing:
-            for field, value in payload.items():
-                setattr(existing, field, value)
-            existing.answered_at = datetime.utcnow()
-            obj = existing
-        else:
-            obj = QuizAnswer(**payload)
-            obj.answered_at = datetime.utcnow()
-            self.db.add(obj)
-
-        return obj
+        # Commit expired the attempt and its answers, and new answers went in through
+        # Core; one reload with selectinload returns the attempt ready for the response
+        return self.get_attempt(attempt_id)
+
+    def _save_answers(
+        self, attempt: QuizAttempt, answers: List[QuizAnswerSubmission]
+    ) -> None:
+        # Answers are already loaded with the attempt, so re-answered questions are
+        # updated in memory and only new questions are written, as one Core INSERT
+        # rather than an ORM object per row. A repeated question keeps its last answer.
+        existing_answers = {answer.question_id: answer for answer in attempt.answers}
+        answered_at = datetime.utcnow()
+        new_rows: Dict[UUID, Dict[str, Any]] = {}
+
+        for answer_data in answers:
+            payload = answer_data.model_dump()
+            existing = existing_answers.get(answer_data.question_id)
+            if existing:
+                for field, value in payload.items():
+                    setattr(existing, field, value)
+                existing.answered_at = answered_at
+            else:
+                new_rows[answer_data.question_id] = {
+                    **payload,
+                    "attempt_id": attempt.id,
+                    "answered_at": answered_at,
+                }
+
+        if new_rows:
+            self.db.execute(insert(QuizAnswer), list(new_rows.values()))
 
     def get_user_quiz_attempts(
         self, user_id: UUID, quiz_id: UUID
@@ -131,14 +127,36 @@ class QuizAttemptService:
         passed: Optional[bool] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[Tuple[Optional[datetime], UUID]] = None,
     ) -> List[QuizAttempt]:
+        """Newest-first attempts; open attempts (no submitted_at) sort first.
+
+        ``cursor`` is the (submitted_at, id) of the last row of the previous page.
+        It seeks the (user_id, submitted_at DESC, id DESC) index, so deep pages
+        cost the same as the first one.
+        """
         query = self.db.query(QuizAttempt).filter(QuizAttempt.user_id == user_id)
 
         if passed is not None:
             query = query.filter(QuizAttempt.passed == passed)
 
+        if cursor is not None:
+            submitted_at, attempt_id = cursor
+            if submitted_at is None:
+                query = query.filter(
+                    or_(
+                        QuizAttempt.submitted_at.is_not(None),
+                        QuizAttempt.id < attempt_id,
+                    )
+                )
+            else:
+                query = query.filter(
+                    tuple_(QuizAttempt.submitted_at, QuizAttempt.id)
+                    < tuple_(submitted_at, attempt_id)
+                )
+
         return (
-            query.order_by(desc(QuizAttempt.submitted_at), desc(QuizAttempt.started_at))
+            query.order_by(desc(QuizAttempt.submitted_at), desc(QuizAttempt.id))
             .offset(offset)
             .limit(limit)
             .all()
@@ -158,13 +176,10 @@ class QuizAttemptService:
         )
 
     def delete_attempt(self, attempt_id: UUID) -> bool:
-        attempt = self.db.query(QuizAttempt).filter(QuizAttempt.id == attempt_id).one_or_none()
-        if not attempt:
-            return False
-
-        self.db.delete(attempt)
+        # Answers go with it through the ON DELETE CASCADE foreign key
+        result = self.db.execute(delete(QuizAttempt).where(QuizAttempt.id == attempt_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
 
     def get_quiz_statistics(self, user_id: UUID, quiz_id: UUID) -> Dict[str, Optional[float]]:
         base_query = self.db.query(QuizAttempt).filter(
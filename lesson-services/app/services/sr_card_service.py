@@ -1,37 +1,72 @@
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import Integer, Numeric, case, cast, delete, func, literal, select, update
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session
 
-from app.models.progress_models import SRCard
-from app.schemas import SRCardCreate
+from app.models.progress_models import SRCard, SRSchedule
+from app.schemas import SRCardCreate, SRCardResponse
+
+sr_cards = SRCard.__table__
+
+# Exactly the columns SRCardResponse reads, for the streamed card list
+_CARD_COLUMNS = tuple(sr_cards.c[name] for name in SRCardResponse.model_fields)
+
+# Rows fetched per round trip when the card list is streamed from a server-side cursor
+STREAM_CHUNK_ROWS = 500
 
 
 class SRCardService:
     def __init__(self, db: Session):
         self.db = db
 
+    def _user_cards_filters(
+        self, user_id: UUID, suspended: Optional[bool], due_only: bool
+    ) -> list:
+        filters = [SRCard.user_id == user_id]
+
+        if suspended is not None:
+            filters.append(SRCard.suspended == suspended)
+
+        if due_only:
+            now = datetime.utcnow()
+            filters.extend((SRCard.due_at <= now, SRCard.suspended.is_(False)))
+
+        return filters
+
     def get_user_cards(
         self,
         user_id: UUID,
         suspended: Optional[bool] = None,
         due_only: bool = False,
     ) -> List[SRCard]:
-        query = self.db.query(SRCard).filter(SRCard.user_id == user_id)
-
-        if suspended is not None:
-            query = query.filter(SRCard.suspended == suspended)
-
-        if due_only:
-            now = datetime.utcnow()
-            query = query.filter(
-                SRCard.due_at <= now,
-                SRCard.suspended.is_(False),
-            )
+        return (
+            self.db.query(SRCard)
+            .filter(*self._user_cards_filters(user_id, suspended, due_only))
+            .order_by(SRCard.due_at.asc())
+            .all()
+        )
 
-        return query.order_by(SRCard.due_at.asc()).all()
+    def stream_user_cards(
+        self,
+        user_id: UUID,
+        suspended: Optional[bool] = None,
+        due_only: bool = False,
+    ) -> Iterator[Sequence[RowMapping]]:
+        """Yield the card list in chunks from a server-side cursor instead of one list.
+
+        The session stays open until the response has been sent, so the cursor
+        outlives the route handler that starts it.
+        """
+        result = self.db.execute(
+            select(*_CARD_COLUMNS)
+            .where(*self._user_cards_filters(user_id, suspended, due_only))
+            .order_by(sr_cards.c.due_at.asc())
+            .execution_options(yield_per=STREAM_CHUNK_ROWS)
+        )
+        yield from result.mappings().partitions()
 
     def get_due_cards(self, user_id: UUID) -> List[SRCard]:
         return self.get_user_cards(user_id=user_id, due_only=True)
@@ -74,95 +109,82 @@ class SRCardService:
         return card
 
     def update_card_after_review(self, card_id: UUID, quality: int) -> Optional[SRCard]:
-        card = self.get_card(card_id)
-        if not card:
-            return None
-
         quality = max(0, min(5, quality))
-        now = datetime.utcnow()
 
-        if quality >= 3:
-            if card.repetition == 0:
-                interval = 1
-            elif card.repetition == 1:
-                interval = 6
-            else:
-                interval = max(1, round(card.interval_d * card.ease_factor))
-            card.repetition += 1
-            card.interval_d = int(interval)
-        else:
-            card.repetition = 0
-            card.interval_d = 0
-
-        new_ef = card.ease_factor + (
-            0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
+        # SM-2 transitions come from sr_schedule; only the ease-factor growth
+        # for mature cards depends on the card's own values.
+        new_interval = func.coalesce(
+            SRSchedule.new_interval_d,
+            cast(
+                func.greatest(1, func.round(SRCard.interval_d * SRCard.ease_factor)),
+                Integer,
+            ),
+        )
+        stmt = (
+            update(SRCard)
+            .where(
+                SRCard.id == card_id,
+                SRSchedule.repetition == func.least(SRCard.repetition, 2),
+                SRSchedule.quality == quality,
+            )
+            .values(
+                repetition=case(
+                    (SRSchedule.passed, SRCard.repetition + 1),
+                    else_=0,
+                ),
+                interval_d=new_interval,
+                ease_factor=func.greatest(
+                    1.3,
+                    func.round(cast(SRCard.ease_factor + SRSchedule.ef_delta, Numeric), 2),
+                ),
+                due_at=func.now() + new_interval * literal(timedelta(days=1)),
+                suspended=False,
+            )
+            .returning(SRCard)
+            .execution_options(synchronize_session=False)
         )
-        card.ease_factor = max(1.3, round(new_ef, 2))
 
-        card.due_at = now + timedelta(days=card.interval_d)
-        card.suspended = False
+        card = self.db.scalars(stmt).one_or_none()
+        if card is None:
+            return None
 
         self.db.commit()
         self.db.refresh(card)
         return card
 
     def delete_card(self, card_id: UUID) -> bool:
-        card = self.get_card(card_id)
-        if not card:
-            return False
-
-        self.db.delete(card)
+        result = self.db.execute(delete(SRCard).where(SRCard.id == card_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
 
     def get_user_stats(self, user_id: UUID) -> Dict[str, float]:
+        """Deck counters for one user as filtered aggregates over a single scan."""
         now = datetime.utcnow()
-        base_query = self.db.query(SRCard).filter(SRCard.user_id == user_id)
-
-        total_cards = base_query.count()
-        suspended_cards = base_query.filter(SRCard.suspended.is_(True)).count()
-        due_cards = (
-            base_query.filter(SRCard.suspended.is_(False))
-            .filter(SRCard.due_at <= now)
-            .count()
-        )
-        new_cards = (
-            base_query.filter(SRCard.repetition == 0, SRCard.suspended.is_(False)).count()
-        )
-        learning_cards = (
-            base_query.filter(
-                SRCard.repetition > 0,
-                SRCard.repetition < 3,
-                SRCard.suspended.is_(False),
-            ).count()
-        )
-        mature_cards = (
-            base_query.filter(
-                SRCard.repetition >= 3,
-                SRCard.suspended.is_(False),
-            ).count()
-        )
-
-        avg_ease = (
-            self.db.query(func.avg(SRCard.ease_factor))
-            .filter(SRCard.user_id == user_id, SRCard.suspended.is_(False))
-            .scalar()
-        )
-        avg_interval = (
-            self.db.query(func.avg(SRCard.interval_d))
-            .filter(SRCard.user_id == user_id, SRCard.suspended.is_(False))
-            .scalar()
-        )
+        active = SRCard.suspended.is_(False)
+        row = self.db.execute(
+            select(
+                func.count().label("total_cards"),
+                func.count().filter(SRCard.suspended.is_(True)).label("suspended_cards"),
+                func.count().filter(active, SRCard.due_at <= now).label("due_cards"),
+                func.count().filter(active, SRCard.repetition == 0).label("new_cards"),
+                func.count()
+                .filter(active, SRCard.repetition > 0, SRCard.repetition < 3)
+                .label("learning_cards"),
+                func.count().filter(active, SRCard.repetition >= 3).label("mature_cards"),
+                func.avg(SRCard.ease_factor).filter(active).label("avg_ease"),
+                func.avg(SRCard.interval_d).filter(active).label("avg_interval"),
+            ).where(SRCard.user_id == user_id)
+        ).one()
 
         return {
-            "total_cards": total_cards,
-            "due_cards": due_cards,
-            "suspended_cards": suspended_cards,
-            "new_cards": new_cards,
-            "learning_cards": learning_cards,
-            "mature_cards": mature_cards,
-            "average_ease_factor": float(avg_ease or 0.0),
-            "average_interval": float(avg_interval or 0.0),
+            "total_cards": row.total_cards,
+            "due_cards": row.due_cards,
+            "suspended_cards": row.suspended_cards,
+            "new_cards": row.new_cards,
+            "learning_cards": row.learning_cards,
+            "mature_cards": row.mature_cards,
+            "average_ease_factor": float(row.avg_ease or 0.0),
+            "average_interval": float(row.avg_interval or 0.0),
         }
 
     def get_card_by_flashcard(
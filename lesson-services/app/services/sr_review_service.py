@@ -1,13 +1,13 @@
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import delete, func, tuple_
 from sqlalchemy.orm import Session
 
 from app.models.progress_models import SRReview
 from app.schemas import SRCardCreate, SRReviewCreate
-from app.services.daily_activity_service import DailyActivityService
+from app.services.daily_activity_buffer import daily_activity_buffer
 from app.services.sr_card_service import SRCardService
 
 REVIEW_MINUTES_PER_CARD = 2
@@ -18,7 +18,6 @@ class SRReviewService:
     def __init__(self, db: Session):
         self.db = db
         self.card_service = SRCardService(db)
-        self.activity_service = DailyActivityService(db)
 
     def create_review(self, user_id: UUID, review_data: SRReviewCreate) -> SRReview:
         quality = review_data.quality
@@ -52,15 +51,11 @@ class SRReviewService:
         )
 
         self.db.add(review)
-        self.db.flush()
+        self.db.commit()
 
         today = review.reviewed_at.date()
-        self.activity_service.increment_activity(
-            user_id, today, "minutes", REVIEW_MINUTES_PER_CARD
-        )
-        self.activity_service.increment_activity(
-            user_id, today, "points", REVIEW_POINTS
-        )
+        daily_activity_buffer.add(user_id, today, "minutes", REVIEW_MINUTES_PER_CARD)
+        daily_activity_buffer.add(user_id, today, "points", REVIEW_POINTS)
 
         self.db.refresh(review)
         return review
@@ -72,7 +67,9 @@ class SRReviewService:
         offset: int = 0,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
+        cursor: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[SRReview]:
+        """Newest-first reviews; ``cursor`` is the (reviewed_at, id) the previous page ended on."""
         query = self.db.query(SRReview).filter(SRReview.user_id == user_id)
 
         if date_from:
@@ -81,9 +78,11 @@ class SRReviewService:
         if date_to:
             end = datetime.combine(date_to + timedelta(days=1), datetime.min.time())
             query = query.filter(SRReview.reviewed_at < end)
+        if cursor is not None:
+            query = query.filter(tuple_(SRReview.reviewed_at, SRReview.id) < tuple_(*cursor))
 
         return (
-            query.order_by(SRReview.reviewed_at.desc())
+            query.order_by(SRReview.reviewed_at.desc(), SRReview.id.desc())
             .offset(offset)
             .limit(limit)
             .all()
@@ -116,18 +115,28 @@ class SRReviewService:
             .all()
         )
 
+    def _quality_counts(self, *filters) -> Dict[int, int]:
+        """Reviews per quality score; the stats only need these counts, not the rows."""
+        return dict(
+            self.db.query(SRReview.quality, func.count())
+            .filter(*filters)
+            .group_by(SRReview.quality)
+            .all()
+        )
+
     def get_today_stats(self, user_id: UUID) -> Dict[str, object]:
-        reviews = self.get_today_reviews(user_id)
-        return self._calculate_review_stats(reviews)
+        start_of_day = datetime.combine(date.today(), datetime.min.time())
+        end_of_day = start_of_day + timedelta(days=1)
+        return self._calculate_review_stats(
+            self._quality_counts(
+                SRReview.user_id == user_id,
+                SRReview.reviewed_at >= start_of_day,
+                SRReview.reviewed_at < end_of_day,
+            )
+        )
 
     def get_user_review_stats(self, user_id: UUID) -> Dict[str, object]:
-        reviews = (
-            self.db.query(SRReview)
-            .filter(SRReview.user_id == user_id)
-            .order_by(SRReview.reviewed_at.desc())
-            .all()
-        )
-        stats = self._calculate_review_stats(reviews)
+        stats = self._calculate_review_stats(self._quality_counts(SRReview.user_id == user_id))
         stats["review_streak"] = self.get_review_streak(user_id)
         stats["unique_flashcards"] = (
             self.db.query(func.count(func.distinct(SRReview.flashcard_id)))
@@ -157,13 +166,9 @@ class SRReviewService:
         return stats
 
     def delete_review(self, review_id: UUID) -> bool:
-        review = self.db.query(SRReview).filter(SRReview.id == review_id).one_or_none()
-        if review is None:
-            return False
-
-        self.db.delete(review)
+        result = self.db.execute(delete(SRReview).where(SRReview.id == review_id))
         self.db.commit()
-        return True
+        return result.rowcount > 0
 
     def get_review_streak(self, user_id: UUID) -> int:
         distinct_dates = (
@@ -212,8 +217,8 @@ class SRReviewService:
 
         return {row.review_date: row.review_count for row in results}
 
-    def _calculate_review_stats(self, reviews: List[SRReview]) -> Dict[str, object]:
-        total_reviews = len(reviews)
+    def _calculate_review_stats(self, quality_counts: Dict[int, int]) -> Dict[str, object]:
+        total_reviews = sum(quality_counts.values())
         if total_reviews == 0:
             return {
                 "total_reviews": 0,
@@ -223,15 +228,9 @@ class SRReviewService:
             }
 
         quality_distribution = {i: 0 for i in range(6)}
-        total_quality = 0
-        retained = 0
-
-        for review in reviews:
-            score = int(review.quality)
-            quality_distribution[score] = quality_distribution.get(score, 0) + 1
-            total_quality += score
-            if score >= 3:
-                retained += 1
+        quality_distribution.update(quality_counts)
+        total_quality = sum(score * count for score, count in quality_counts.items())
+        retained = sum(count for score, count in quality_counts.items() if score >= 3)
 
         average_quality = total_quality / total_reviews
         retention_rate = retained / total_reviews if total_reviews else 0.0
@@ -4,7 +4,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import func
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session
 
 from app.models.progress_models import UserLesson
@@ -12,10 +12,16 @@ from app.schemas import (
     LessonStatus,
     UserLessonCompletionRequest,
     UserLessonCreate,
+    UserLessonResponse,
     UserLessonStats,
     UserLessonUpdate,
 )
 
+user_lessons = UserLesson.__table__
+
+# Exactly the columns UserLessonResponse reads, so list pages skip ORM hydration
+_LESSON_COLUMNS = tuple(user_lessons.c[name] for name in UserLessonResponse.model_fields)
+
 
 class UserLessonService:
     """Business logic for managing user lesson progress."""
@@ -35,14 +41,15 @@ class UserLessonService:
 
     def get_user_lessons(
         self, user_id: UUID, status: Optional[LessonStatus] = None
-    ) -> List[UserLesson]:
+    ) -> List[UserLessonResponse]:
         """Return all lessons for a user with optional status filter."""
 
-        query = self._query().filter(UserLesson.user_id == user_id)
+        query = select(*_LESSON_COLUMNS).where(user_lessons.c.user_id == user_id)
         status_value = self._status_value(status)
         if status_value:
-            query = query.filter(UserLesson.status == status_value)
-        return query.order_by(UserLesson.started_at.desc()).all()
+            query = query.where(user_lessons.c.status == status_value)
+        result = self.db.execute(query.order_by(user_lessons.c.started_at.desc()))
+        return [UserLessonResponse.model_validate(row) for row in result.mappings()]
 
     def get_user_lesson(self, user_id: UUID, lesson_id: UUID) -> Optional[UserLesson]:
         """Return the most recent lesson entry for the user/lesson pair."""
@@ -144,7 +151,7 @@ class UserLessonService:
         self.db.refresh(lesson)
         return lesson
 
-    def get_in_progress_lessons(self, user_id: UUID) -> List[UserLesson]:
+    def get_in_progress_lessons(self, user_id: UUID) -> List[UserLessonResponse]:
         return self.get_user_lessons(user_id, LessonStatus.IN_PROGRESS)
 
     def get_completed_lessons(
@@ -163,13 +170,17 @@ class UserLessonService:
         )
 
     def delete_user_lesson(self, user_id: UUID, lesson_id: UUID) -> bool:
-        lesson = self.get_user_lesson(user_id, lesson_id)
-        if not lesson:
-            return False
-
-        self.db.delete(lesson)
+        # Same row get_user_lesson returns: the most recent entry for the pair
+        latest = (
+            select(user_lessons.c.id)
+            .where(user_lessons.c.user_id == user_id, user_lessons.c.lesson_id == lesson_id)
+            .order_by(user_lessons.c.started_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        result = self.db.execute(delete(user_lessons).where(user_lessons.c.id == latest))
         self.db.commit()
-        return True
+        return result.rowcount > 0
 
     def get_lesson_stats(self, user_id: UUID) -> UserLessonStats:
         total_started = (
@@ -4,10 +4,10 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import desc, func
+from sqlalchemy import Row, desc, func
 from sqlalchemy.orm import Session
 
-from app.models.progress_models import DimUser, UserPoints
+from app.models.progress_models import DimUser, UserPoints, UserPointsLog
 
 
 class UserPointsService:
@@ -32,6 +32,7 @@ class UserPointsService:
             updated_at=datetime.utcnow(),
         )
         self.db.add(points)
+        self._log_change("init", user_id=user_id, new_points=0)
         self.db.commit()
         self.db.refresh(points)
         return points
@@ -42,12 +43,39 @@ class UserPointsService:
             return points
         return self.initialize_user_points(user_id)
 
+    def _log_change(
+        self,
+        op: str,
+        user_id: Optional[UUID] = None,
+        old_points: Optional[int] = None,
+        new_points: Optional[int] = None,
+    ) -> None:
+        """Record a points change for the incremental leaderboard refresh.
+
+        Written in the caller's transaction so the log never diverges from user_points.
+        """
+        self.db.add(
+            UserPointsLog(
+                user_id=user_id,
+                old_points=old_points,
+                new_points=new_points,
+                op=op,
+            )
+        )
+
     def _apply_delta(self, user_id: UUID, delta: int) -> UserPoints:
         points = self.get_or_create_points(user_id)
+        old_lifetime = points.lifetime
         points.lifetime = max(points.lifetime + delta, 0)
         points.weekly = max(points.weekly + delta, 0)
         points.monthly = max(points.monthly + delta, 0)
         points.updated_at = datetime.utcnow()
+        self._log_change(
+            "add" if delta >= 0 else "subtract",
+            user_id=user_id,
+            old_points=old_lifetime,
+            new_points=points.lifetime,
+        )
         self.db.commit()
         self.db.refresh(points)
         return points
@@ -63,11 +91,15 @@ class UserPointsService:
         return self._apply_delta(user_id, -points)
 
     def _leaderboard_query(self, column):
-        return self.db.query(UserPoints).order_by(desc(column), UserPoints.updated_at.asc())
+        # Only the two columns a board shows, in the order of the matching
+        # user_points_<column>_rank_idx, so the top N comes from an index-only scan
+        return self.db.query(UserPoints.user_id, column).order_by(
+            desc(column), UserPoints.updated_at.asc()
+        )
 
     def get_lifetime_leaderboard(
         self, limit: int = 100, offset: int = 0
-    ) -> List[UserPoints]:
+    ) -> List[Row]:
         return (
             self._leaderboard_query(UserPoints.lifetime)
             .offset(offset)
@@ -77,7 +109,7 @@ class UserPointsService:
 
     def get_weekly_leaderboard(
         self, limit: int = 100, offset: int = 0
-    ) -> List[UserPoints]:
+    ) -> List[Row]:
         return (
             self._leaderboard_query(UserPoints.weekly)
             .offset(offset)
@@ -87,7 +119,7 @@ class UserPointsService:
 
     def get_monthly_leaderboard(
         self, limit: int = 100, offset: int = 0
-    ) -> List[UserPoints]:
+    ) -> List[Row]:
         return (
             self._leaderboard_query(UserPoints.monthly)
             .offset(offset)
@@ -103,6 +135,7 @@ class UserPointsService:
             },
             synchronize_session=False,
         )
+        self._log_change("reset_weekly")
         self.db.commit()
         return updated
 
@@ -114,6 +147,7 @@ class UserPointsService:
             },
             synchronize_session=False,
         )
+        self._log_change("reset_monthly")
         self.db.commit()
         return updated
 
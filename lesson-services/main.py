@@ -1,10 +1,28 @@
-from fastapi import FastAPI
+import logging
+
+from fastapi import APIRouter, Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.middlewares.auth_middleware import InternalAuthRequired
-from app.database.migrations import run_database_migrations
-from app.config import settings
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.exc import SQLAlchemyError
+from app.dependencies.auth import get_current_user
+from app.database.cache import close_redis
+from app.database.connection import async_engine, engine
+from app.database.materialized_views import (
+    start_materialized_view_refresher,
+    stop_materialized_view_refresher,
+)
+from app.database.partitions import (
+    run_partition_maintenance,
+    start_partition_maintainer,
+    stop_partition_maintainer,
+)
+from app.services.daily_activity_buffer import (
+    start_daily_activity_flusher,
+    stop_daily_activity_flusher,
+)
 from app.routers import (
     daily_activity_routes,
+    dim_user_routes,
     health_routes,
     leaderboard_routes,
     outbox_routes,
@@ -18,10 +36,13 @@ from app.routers import (
     user_streak_routes,
 )
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(
     title="Lesson Services API",
     description="A RESTful API for managing English learning lessons",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -33,27 +54,45 @@ app.add_middleware(
 )
 
 
-# Add authentication middleware (except for health check)
-app.add_middleware(InternalAuthRequired)
+@app.on_event("startup")
+async def prepare_database() -> None:
+    # Schema migrations run as a separate one-shot job (python -m app.cli migrate)
+    try:
+        run_partition_maintenance()
+    except SQLAlchemyError:
+        # Serving traffic matters more than next month's partitions; the periodic run retries
+        logger.exception("Partition maintenance failed at startup")
+    start_daily_activity_flusher()
+    start_materialized_view_refresher()
+    start_partition_maintainer()
+    logger.info("Database pools: sync %s; async %s", engine.pool.status(), async_engine.pool.status())
+
 
+@app.on_event("shutdown")
+async def flush_daily_activity() -> None:
+    await stop_partition_maintainer()
+    await stop_materialized_view_refresher()
+    await stop_daily_activity_flusher()
+    await async_engine.dispose()
+    await close_redis()
 
-@app.on_event("startup")
-async def apply_database_migrations() -> None:
-    if settings.run_migrations_on_startup:
-        run_database_migrations()
+# Internal auth is resolved per route by dependency; health stays unauthenticated
+api_router = APIRouter(dependencies=[Depends(get_current_user)])
+api_router.include_router(daily_activity_routes.router, tags=["daily-activity"])
+api_router.include_router(dim_user_routes.router, tags=["user-preferences"])
+api_router.include_router(leaderboard_routes.router, tags=["leaderboard"])
+api_router.include_router(outbox_routes.router, tags=["outbox"])
+api_router.include_router(progress_event_routes.router, tags=["progress-event"])
+api_router.include_router(quiz_answer_routes.router, tags=["quiz-answer"])
+api_router.include_router(quiz_attempt_routes.router, tags=["quiz-attempt"])
+api_router.include_router(sr_card_routes.router, tags=["sr-card"])
+api_router.include_router(sr_review_routes.router, tags=["sr-review"])
+api_router.include_router(user_lesson_routes.router, tags=["user-lesson"])
+api_router.include_router(user_points_routes.router, tags=["user-points"])
+api_router.include_router(user_streak_routes.router, tags=["user-streak"])
 
 app.include_router(health_routes.router, prefix="/api/v1", tags=["health"])
-app.include_router(daily_activity_routes.router, prefix="/api/v1", tags=["daily-activity"])
-app.include_router(leaderboard_routes.router, prefix="/api/v1", tags=["leaderboard"])
-app.include_router(outbox_routes.router, prefix="/api/v1", tags=["outbox"])
-app.include_router(progress_event_routes.router, prefix="/api/v1", tags=["progress-event"])
-app.include_router(quiz_answer_routes.router, prefix="/api/v1", tags=["quiz-answer"])
-app.include_router(quiz_attempt_routes.router, prefix="/api/v1", tags=["quiz-attempt"])
-app.include_router(sr_card_routes.router, prefix="/api/v1", tags=["sr-card"])
-app.include_router(sr_review_routes.router, prefix="/api/v1", tags=["sr-review"])
-app.include_router(user_lesson_routes.router, prefix="/api/v1", tags=["user-lesson"])
-app.include_router(user_points_routes.router, prefix="/api/v1", tags=["user-points"])
-app.include_router(user_streak_routes.router, prefix="/api/v1", tags=["user-streak"])
+app.include_router(api_router, prefix="/api/v1")
 
 if __name__ == "__main__":
     import uvicorn